@@ -2,7 +2,7 @@
 pragma solidity 0.8.17;
 
 import {TradeHandler} from "../trading/TradeHandler.sol";
-import {ITradingModule, Trade} from "../../interfaces/trading/ITradingModule.sol";
+import {ITradingModule, Trade, BatchTrade} from "../../interfaces/trading/ITradingModule.sol";
 
 /// @notice MockVault used to test the trading module
 contract MockVault {
@@ -25,5 +25,10 @@ contract MockVault {
         return TradeHandler._executeTrade(trade, dexId, TRADING_MODULE);
     }
 
+    function executeTradeBatch(BatchTrade[] memory trades)
+        external returns (uint256[] memory amountsSold, uint256[] memory amountsBought) {
+        return TradeHandler._executeTradeBatch(trades, TRADING_MODULE);
+    }
+
     receive() external payable {}
 }
@@ -0,0 +1,30 @@
+// SPDX-License-Identifier: MIT
+pragma solidity 0.8.17;
+
+import {StableMath} from "../../vaults/balancer/internal/math/StableMath.sol";
+
+/// @notice Exposes StableMath for profiling, gas used is measured around the internal call
+contract MockStableMath {
+    function calculateInvariant(
+        uint256 amplificationParameter,
+        uint256[] memory balances,
+        bool roundUp
+    ) external view returns (uint256 invariant, uint256 gasUsed) {
+        gasUsed = gasleft();
+        invariant = StableMath._calculateInvariant(amplificationParameter, balances, roundUp);
+        gasUsed = gasUsed - gasleft();
+    }
+
+    function getTokenBalanceGivenInvariantAndAllOtherBalances(
+        uint256 amplificationParameter,
+        uint256[] memory balances,
+        uint256 invariant,
+        uint256 tokenIndex
+    ) external view returns (uint256 tokenBalance, uint256 gasUsed) {
+        gasUsed = gasleft();
+        tokenBalance = StableMath._getTokenBalanceGivenInvariantAndAllOtherBalances(
+            amplificationParameter, balances, invariant, tokenIndex
+        );
+        gasUsed = gasUsed - gasleft();
+    }
+}
@@ -0,0 +1,32 @@
+// SPDX-License-Identifier: MIT
+pragma solidity 0.8.17;
+
+import "@openzeppelin/contracts/proxy/beacon/BeaconProxy.sol";
+import {IMockVault} from "../../interfaces/IMockVault.sol";
+
+contract nMockBeaconProxy is BeaconProxy {
+    address public immutable MOCK_IMPL;
+
+    constructor(
+        address beacon,
+        bytes memory data,
+        address _mockImpl
+    ) payable BeaconProxy(beacon, data) {
+        MOCK_IMPL = _mockImpl;
+    }
+
+    receive() external payable override {
+        // Allow ETH transfers to succeed
+    }
+
+    function _implementation() internal view virtual override returns (address impl) {
+        if (msg.sig == IMockVault.joinPoolAndStake.selector ||
+            msg.sig == IMockVault.convertStrategyToUnderlying.selector ||
+            msg.sig == IMockVault.setValuationFactor.selector ||
+            msg.sig == IMockVault.valuationFactors.selector ||
+            msg.sig == IMockVault.getTimeWeightedPrimaryBalance.selector) {
+            return MOCK_IMPL;
+        }
+        return super._implementation();
+    }
+}
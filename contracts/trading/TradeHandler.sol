@@ -1,7 +1,7 @@
 // SPDX-License-Identifier: MIT
 pragma solidity 0.8.17;
 
-import {ITradingModule, Trade} from "../../interfaces/trading/ITradingModule.sol";
+import {ITradingModule, Trade, BatchTrade} from "../../interfaces/trading/ITradingModule.sol";
 import {nProxy} from "../proxy/nProxy.sol";
 
 /// @notice TradeHandler is an internal library to be compiled into StrategyVaults to interact
@@ -38,4 +38,16 @@ library TradeHandler {
         require(success);
         (amountSold, amountBought) = abi.decode(result, (uint256, uint256));
     }
+
+    /// @notice Can be used to delegate call to the TradingModule's implementation in order to execute
+    /// multiple trades in a single call.
+    function _executeTradeBatch(
+        BatchTrade[] memory trades,
+        ITradingModule tradingModule
+    ) internal returns (uint256[] memory amountsSold, uint256[] memory amountsBought) {
+        (bool success, bytes memory result) = nProxy(payable(address(tradingModule))).getImplementation()
+            .delegatecall(abi.encodeWithSelector(ITradingModule.executeTradeBatch.selector, trades));
+        require(success);
+        (amountsSold, amountsBought) = abi.decode(result, (uint256[], uint256[]));
+    }
 }
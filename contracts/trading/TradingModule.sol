@@ -35,6 +35,14 @@ contract TradingModule is Initializable, UUPSUpgradeable, ITradingModule {
         uint8 rateDecimals;
     }
 
+    /// @notice Token prices read during a batch so that each oracle is only read once
+    struct OracleCache {
+        address[] tokens;
+        int256[] prices;
+        int256[] rateDecimals;
+        uint256 length;
+    }
+
     int256 internal constant RATE_DECIMALS = 1e18;
     mapping(address => PriceOracle) public priceOracles;
     uint32 public maxOracleFreshnessInSeconds;
@@ -191,6 +199,56 @@ contract TradingModule is Initializable, UUPSUpgradeable, ITradingModule {
             );
     }
 
+    /// @notice Should be called via delegate call to execute multiple trades on behalf of the caller.
+    /// Permissions and dynamic slippage limits for all trades are fetched from the proxy in a single call.
+    /// @param trades batch trade objects, may be executed on different dexes
+    /// @return amountsSold amount of tokens sold for each trade
+    /// @return amountsBought amount of tokens purchased for each trade
+    function executeTradeBatch(BatchTrade[] calldata trades)
+        external
+        override
+        returns (uint256[] memory amountsSold, uint256[] memory amountsBought)
+    {
+        // This method calls back into the implementation via the proxy so that it has proper
+        // access to storage.
+        uint256[] memory limitAmounts = PROXY.getBatchLimitAmounts(address(this), trades);
+
+        amountsSold = new uint256[](trades.length);
+        amountsBought = new uint256[](trades.length);
+        for (uint256 i; i < trades.length; i++) {
+            if (trades[i].trade.amount == 0) continue;
+            (amountsSold[i], amountsBought[i]) = _executeBatchTrade(trades[i], limitAmounts[i]);
+        }
+    }
+
+    function _executeBatchTrade(
+        BatchTrade calldata batchTrade,
+        uint256 limitAmount
+    ) private returns (uint256 amountSold, uint256 amountBought) {
+        Trade memory trade = batchTrade.trade;
+        address spender;
+        address target;
+        uint256 msgValue;
+        bytes memory executionData;
+
+        if (batchTrade.useDynamicSlippage) {
+            trade.limit = limitAmount;
+            (spender, target, msgValue, executionData) = PROXY.getExecutionData(batchTrade.dexId, address(this), trade);
+        } else {
+            (spender, target, msgValue, executionData) = _getExecutionData(batchTrade.dexId, address(this), batchTrade.trade);
+        }
+
+        return
+            TradingUtils._executeInternal(
+                trade,
+                batchTrade.dexId,
+                spender,
+                target,
+                msgValue,
+                executionData
+            );
+    }
+
     function _getExecutionData(
         uint16 dexId,
         address from,
@@ -235,19 +293,8 @@ contract TradingModule is Initializable, UUPSUpgradeable, ITradingModule {
         override
         returns (int256 answer, int256 decimals)
     {
-        PriceOracle memory baseOracle = priceOracles[baseToken];
-        PriceOracle memory quoteOracle = priceOracles[quoteToken];
-
-        int256 baseDecimals = int256(10**baseOracle.rateDecimals);
-        int256 quoteDecimals = int256(10**quoteOracle.rateDecimals);
-
-        (/* */, int256 basePrice, /* */, uint256 bpUpdatedAt, /* */) = baseOracle.oracle.latestRoundData();
-        require(block.timestamp - bpUpdatedAt <= maxOracleFreshnessInSeconds);
-        require(basePrice > 0); /// @dev: Chainlink Rate Error
-
-        (/* */, int256 quotePrice, /* */, uint256 qpUpdatedAt, /* */) = quoteOracle.oracle.latestRoundData();
-        require(block.timestamp - qpUpdatedAt <= maxOracleFreshnessInSeconds);
-        require(quotePrice > 0); /// @dev: Chainlink Rate Error
+        (int256 basePrice, int256 baseDecimals) = _getTokenPrice(baseToken);
+        (int256 quotePrice, int256 quoteDecimals) = _getTokenPrice(quoteToken);
 
         answer =
             (basePrice * quoteDecimals * RATE_DECIMALS) /
@@ -255,12 +302,64 @@ contract TradingModule is Initializable, UUPSUpgradeable, ITradingModule {
         decimals = RATE_DECIMALS;
     }
 
+    /// @notice Returns Chainlink oracle prices for multiple base tokens against the same quote token. The
+    /// quote token oracle is only read once.
+    /// @param baseTokens addresses of the first token in each pair
+    /// @param quoteToken address of the second token in every pair
+    /// @return answers exchange rates in rate decimals, in the same order as baseTokens
+    /// @return decimals number of decimals in the rates, currently hardcoded to 1e18
+    function getOraclePrices(address[] calldata baseTokens, address quoteToken)
+        external
+        view
+        override
+        returns (int256[] memory answers, int256 decimals)
+    {
+        (int256 quotePrice, int256 quoteDecimals) = _getTokenPrice(quoteToken);
+        answers = new int256[](baseTokens.length);
+
+        for (uint256 i; i < baseTokens.length; i++) {
+            (int256 basePrice, int256 baseDecimals) = _getTokenPrice(baseTokens[i]);
+            answers[i] = (basePrice * quoteDecimals * RATE_DECIMALS) / (quotePrice * baseDecimals);
+        }
+        decimals = RATE_DECIMALS;
+    }
+
+    /// @notice Returns the Chainlink price for a single token, usually quoted in USD
+    function _getTokenPrice(address token) private view returns (int256 price, int256 rateDecimals) {
+        PriceOracle memory oracle = priceOracles[token];
+        rateDecimals = int256(10**oracle.rateDecimals);
+
+        uint256 updatedAt;
+        (/* */, price, /* */, updatedAt, /* */) = oracle.oracle.latestRoundData();
+        require(block.timestamp - updatedAt <= maxOracleFreshnessInSeconds);
+        require(price > 0); /// @dev: Chainlink Rate Error
+    }
+
+    function _getCachedTokenPrice(
+        OracleCache memory cache,
+        address token
+    ) private view returns (int256 price, int256 rateDecimals) {
+        for (uint256 i; i < cache.length; i++) {
+            if (cache.tokens[i] == token) return (cache.prices[i], cache.rateDecimals[i]);
+        }
+
+        (price, rateDecimals) = _getTokenPrice(token);
+        cache.tokens[cache.length] = token;
+        cache.prices[cache.length] = price;
+        cache.rateDecimals[cache.length] = rateDecimals;
+        cache.length += 1;
+    }
+
     function _hasPermission(uint32 flags, uint32 flagID) private pure returns (bool) {
         return (flags & flagID) == flagID;
     }
 
     /// @notice Check if the caller is allowed to execute the provided trade object
     function canExecuteTrade(address from, uint16 dexId, Trade calldata trade) external view override returns (bool) {
+        return _canExecuteTrade(from, dexId, trade);
+    }
+
+    function _canExecuteTrade(address from, uint16 dexId, Trade calldata trade) private view returns (bool) {
         TokenPermissions memory permissions = tokenWhitelist[from][trade.sellToken];
         if (!_hasPermission(permissions.dexFlags, uint32(1 << dexId))) {
             return false;
@@ -294,4 +393,48 @@ contract TradingModule is Initializable, UUPSUpgradeable, ITradingModule {
             oracleDecimals: uint256(oracleDecimals)
         });
     }
+
+    /// @notice Checks permissions and calculates the trade limits for a batch of trades. Oracle prices are
+    /// read once per token and shared across all trades in the batch. Reverts if any trade is not permitted.
+    /// @param from address for the contract executing the trades
+    /// @param trades batch trade objects
+    /// @return limitAmounts trade limit for each trade, trades without dynamic slippage use trade.limit
+    function getBatchLimitAmounts(
+        address from,
+        BatchTrade[] calldata trades
+    ) external view override returns (uint256[] memory limitAmounts) {
+        limitAmounts = new uint256[](trades.length);
+        // Each trade references at most two tokens
+        OracleCache memory cache = OracleCache({
+            tokens: new address[](trades.length * 2),
+            prices: new int256[](trades.length * 2),
+            rateDecimals: new int256[](trades.length * 2),
+            length: 0
+        });
+
+        for (uint256 i; i < trades.length; i++) {
+            BatchTrade calldata batchTrade = trades[i];
+            if (!_canExecuteTrade(from, batchTrade.dexId, batchTrade.trade)) revert InsufficientPermissions();
+
+            if (!batchTrade.useDynamicSlippage) {
+                limitAmounts[i] = batchTrade.trade.limit;
+                continue;
+            }
+
+            (int256 basePrice, int256 baseDecimals) = _getCachedTokenPrice(cache, batchTrade.trade.sellToken);
+            (int256 quotePrice, int256 quoteDecimals) = _getCachedTokenPrice(cache, batchTrade.trade.buyToken);
+            int256 oraclePrice = (basePrice * quoteDecimals * RATE_DECIMALS) / (quotePrice * baseDecimals);
+            require(oraclePrice > 0); /// @dev Chainlink rate error
+
+            limitAmounts[i] = TradingUtils._getLimitAmount({
+                tradeType: batchTrade.trade.tradeType,
+                sellToken: batchTrade.trade.sellToken,
+                buyToken: batchTrade.trade.buyToken,
+                amount: batchTrade.trade.amount,
+                slippageLimit: batchTrade.dynamicSlippageLimit,
+                oraclePrice: uint256(oraclePrice),
+                oracleDecimals: uint256(RATE_DECIMALS)
+            });
+        }
+    }
 }
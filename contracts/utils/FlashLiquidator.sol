@@ -59,21 +59,62 @@ contract FlashLiquidator is IEulerFlashLoanReceiver, BoringOwnable {
         uint256 amount,
         LiquidationParams calldata params
     ) external onlyOwner returns (uint256) {
+        return _estimateProfit(asset, amount, _toBatch(params));
+    }
+
+    /// @notice Estimates the profit of liquidating multiple accounts inside a single flash loan
+    function estimateProfitBatch(
+        address asset,
+        uint256 amount,
+        LiquidationParams[] calldata params
+    ) external onlyOwner returns (uint256) {
+        return _estimateProfit(asset, amount, params);
+    }
+
+    function flashLiquidate(
+        address asset,
+        uint256 amount,
+        LiquidationParams calldata params
+    ) external {
+        _flashLiquidate(asset, amount, _toBatch(params));
+    }
+
+    /// @notice Liquidates multiple accounts across vaults using a single flash loan. The asset
+    /// is minted and redeemed once for the entire batch. All accounts must be liquidated in the
+    /// same currency, accounts that are no longer eligible for liquidation are skipped.
+    function flashLiquidateBatch(
+        address asset,
+        uint256 amount,
+        LiquidationParams[] calldata params
+    ) external {
+        _flashLiquidate(asset, amount, params);
+    }
+
+    function _estimateProfit(
+        address asset,
+        uint256 amount,
+        LiquidationParams[] memory params
+    ) private returns (uint256) {
         uint256 balance = IERC20(asset).balanceOf(address(this));
         IEulerDToken dToken = IEulerDToken(MARKETS.underlyingToDToken(asset));
         dToken.flashLoan(amount, abi.encode(asset, amount, false, params));
         return IERC20(asset).balanceOf(address(this)) - balance;
     }
 
-    function flashLiquidate(
+    function _flashLiquidate(
         address asset,
         uint256 amount,
-        LiquidationParams calldata params
-    ) external {
+        LiquidationParams[] memory params
+    ) private {
         IEulerDToken dToken = IEulerDToken(MARKETS.underlyingToDToken(asset));
         dToken.flashLoan(amount, abi.encode(asset, amount, true, params));
     }
 
+    function _toBatch(LiquidationParams calldata params) private pure returns (LiquidationParams[] memory batch) {
+        batch = new LiquidationParams[](1);
+        batch[0] = params;
+    }
+
     function onFlashLoan(bytes memory data) external override {
         require(msg.sender == address(EULER));
 
@@ -81,56 +122,35 @@ contract FlashLiquidator is IEulerFlashLoanReceiver, BoringOwnable {
             address asset, 
             uint256 amount, 
             bool withdraw,
-            LiquidationParams memory params
-        ) = abi.decode(data, (address, uint256, bool, LiquidationParams));
+            LiquidationParams[] memory params
+        ) = abi.decode(data, (address, uint256, bool, LiquidationParams[]));
 
+        require(params.length > 0);
+        uint16 currencyId = params[0].currencyId;
         address assetToken = underlyingToAsset[asset];
 
         // Mint CToken
-        if (params.currencyId == Constants.ETH_CURRENCY_ID) {
+        if (currencyId == Constants.ETH_CURRENCY_ID) {
             Deployments.WETH.withdraw(amount);
             CEtherInterface(assetToken).mint{value: amount}();
         } else {
             CErc20Interface(assetToken).mint(amount);
         }
 
-        {
-            (
-                /* int256 collateralRatio */,
-                /* int256 minCollateralRatio */,
-                int256 maxLiquidatorDepositAssetCash,
-                /* uint256 vaultSharesToLiquidator */
-            ) = NOTIONAL.getVaultAccountCollateralRatio(params.account, params.vault);
-            
-            require(maxLiquidatorDepositAssetCash > 0);
-
-            if (params.useVaultDeleverage) {
-                IStrategyVault(params.vault).deleverageAccount(
-                    params.account, 
-                    params.vault, 
-                    address(this), 
-                    uint256(maxLiquidatorDepositAssetCash), 
-                    false, 
-                    params.redeemData
-                );
-            } else {
-                NOTIONAL.deleverageAccount(
-                    params.account, 
-                    params.vault,
-                    address(this), 
-                    uint256(maxLiquidatorDepositAssetCash), 
-                    false, 
-                    params.redeemData
-                );
-            }
+        uint256 accountsLiquidated;
+        for (uint256 i; i < params.length; i++) {
+            // Minted asset tokens can only be used to liquidate accounts in the same currency
+            require(params[i].currencyId == currencyId);
+            if (_deleverageAccount(params[i])) accountsLiquidated++;
         }
+        require(accountsLiquidated > 0);
 
         // Redeem CToken
         {
             uint256 balance = IERC20(assetToken).balanceOf(address(this));
             if (balance > 0) {
                 CErc20Interface(assetToken).redeem(balance);
-                if (params.currencyId == Constants.ETH_CURRENCY_ID) {
+                if (currencyId == Constants.ETH_CURRENCY_ID) {
                     _wrapETH();
                 }
             }
@@ -143,6 +163,41 @@ contract FlashLiquidator is IEulerFlashLoanReceiver, BoringOwnable {
         IERC20(asset).transfer(msg.sender, amount); // repay
     }
 
+    /// @notice Returns false if the account can no longer be liquidated (i.e. it was liquidated
+    /// by someone else or is back above the min collateral ratio)
+    function _deleverageAccount(LiquidationParams memory params) private returns (bool) {
+        (
+            /* int256 collateralRatio */,
+            /* int256 minCollateralRatio */,
+            int256 maxLiquidatorDepositAssetCash,
+            /* uint256 vaultSharesToLiquidator */
+        ) = NOTIONAL.getVaultAccountCollateralRatio(params.account, params.vault);
+
+        if (maxLiquidatorDepositAssetCash <= 0) return false;
+
+        if (params.useVaultDeleverage) {
+            IStrategyVault(params.vault).deleverageAccount(
+                params.account, 
+                params.vault, 
+                address(this), 
+                uint256(maxLiquidatorDepositAssetCash), 
+                false, 
+                params.redeemData
+            );
+        } else {
+            NOTIONAL.deleverageAccount(
+                params.account, 
+                params.vault,
+                address(this), 
+                uint256(maxLiquidatorDepositAssetCash), 
+                false, 
+                params.redeemData
+            );
+        }
+
+        return true;
+    }
+
     function _withdrawToOwner(address token, uint256 amount) private {
         if (amount == type(uint256).max) {
             amount = IERC20(token).balanceOf(address(this));
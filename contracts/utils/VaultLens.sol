@@ -0,0 +1,173 @@
+// SPDX-License-Identifier: GPL-3.0-only
+pragma solidity 0.8.17;
+
+import {NotionalProxy} from "../../interfaces/notional/NotionalProxy.sol";
+import {ITradingModule} from "../../interfaces/trading/ITradingModule.sol";
+import {MarketParameters, VaultState} from "../global/Types.sol";
+
+interface IAuraVaultViews {
+    function getEmergencySettlementPoolClaimAmount(uint256 maturity) external view returns (uint256 poolClaimToSettle);
+}
+
+/// @notice Stateless read only contract that returns everything off chain tooling needs about a
+/// vault in a single eth_call, so that all values are read at the same block
+contract VaultLens {
+    NotionalProxy public immutable NOTIONAL;
+    ITradingModule public immutable TRADING_MODULE;
+
+    /// @notice MetaStable vaults take a uint256 token index, boosted vaults take a uint8. Both
+    /// arguments are abi encoded to the same word so only the selector differs.
+    bytes4 internal constant GET_SPOT_PRICE_UINT256 = bytes4(keccak256("getSpotPrice(uint256)"));
+    bytes4 internal constant GET_SPOT_PRICE_UINT8 = bytes4(keccak256("getSpotPrice(uint8)"));
+
+    struct MaturitySnapshot {
+        VaultState vaultState;
+        // Set to false if the vault reverts when calculating the emergency settlement amount
+        bool hasEmergencySettlement;
+        uint256 emergencySettlementPoolClaim;
+    }
+
+    struct OraclePrice {
+        address base;
+        address quote;
+        // Set to false if the trading module has no oracle for the pair
+        bool isValid;
+        int256 answer;
+        int256 decimals;
+    }
+
+    struct AccountCollateral {
+        address account;
+        // Set to false if Notional reverts when calculating the collateral ratio, i.e. the account
+        // has exited the vault
+        bool isValid;
+        int256 collateralRatio;
+        int256 minCollateralRatio;
+        int256 maxLiquidatorDepositAssetCash;
+        uint256 vaultSharesToLiquidator;
+    }
+
+    struct VaultSnapshot {
+        uint256 blockNumber;
+        uint256 blockTimestamp;
+        uint16 currencyId;
+        // ABI encoded return value of getStrategyContext, the type depends on the vault
+        bytes strategyContext;
+        MaturitySnapshot[] maturities;
+        uint256[] spotPrices;
+        OraclePrice[] oraclePrices;
+    }
+
+    constructor(NotionalProxy notional_, ITradingModule tradingModule_) {
+        NOTIONAL = notional_;
+        TRADING_MODULE = tradingModule_;
+    }
+
+    /// @notice Returns a snapshot of the vault at the current block
+    /// @param vault address of the strategy vault
+    /// @param pastMaturities maturities that are no longer active, active maturities are read from Notional
+    /// @param numTokens number of token indexes to get spot prices for
+    /// @param quoteToken token that oracle prices are quoted in
+    /// @param baseTokens tokens to get oracle prices for
+    function getVaultSnapshot(
+        address vault,
+        uint256[] calldata pastMaturities,
+        uint256 numTokens,
+        address quoteToken,
+        address[] calldata baseTokens
+    ) external view returns (VaultSnapshot memory snapshot) {
+        snapshot.blockNumber = block.number;
+        snapshot.blockTimestamp = block.timestamp;
+        snapshot.currencyId = NOTIONAL.getVaultConfig(vault).borrowCurrencyId;
+        snapshot.strategyContext = _staticcall(vault, abi.encodeWithSignature("getStrategyContext()"));
+        snapshot.maturities = _getMaturities(vault, snapshot.currencyId, pastMaturities);
+        snapshot.spotPrices = _getSpotPrices(vault, numTokens);
+        snapshot.oraclePrices = _getOraclePrices(quoteToken, baseTokens);
+    }
+
+    /// @notice Returns the collateral ratio of every account in a single call, used to scan the
+    /// vault for accounts that can be liquidated
+    /// @param vault address of the strategy vault
+    /// @param accounts vault accounts to read
+    function getCollateralRatios(
+        address vault,
+        address[] calldata accounts
+    ) external view returns (AccountCollateral[] memory collateral) {
+        collateral = new AccountCollateral[](accounts.length);
+        for (uint256 i; i < accounts.length; i++) {
+            collateral[i].account = accounts[i];
+
+            try NOTIONAL.getVaultAccountCollateralRatio(accounts[i], vault) returns (
+                int256 collateralRatio,
+                int256 minCollateralRatio,
+                int256 maxLiquidatorDepositAssetCash,
+                uint256 vaultSharesToLiquidator
+            ) {
+                collateral[i].isValid = true;
+                collateral[i].collateralRatio = collateralRatio;
+                collateral[i].minCollateralRatio = minCollateralRatio;
+                collateral[i].maxLiquidatorDepositAssetCash = maxLiquidatorDepositAssetCash;
+                collateral[i].vaultSharesToLiquidator = vaultSharesToLiquidator;
+            } catch {}
+        }
+    }
+
+    function _getMaturities(
+        address vault,
+        uint16 currencyId,
+        uint256[] calldata pastMaturities
+    ) private view returns (MaturitySnapshot[] memory maturities) {
+        MarketParameters[] memory markets = NOTIONAL.getActiveMarkets(currencyId);
+        uint256 numPast = pastMaturities.length;
+        maturities = new MaturitySnapshot[](numPast + markets.length);
+
+        for (uint256 i; i < maturities.length; i++) {
+            uint256 maturity = i < numPast ? pastMaturities[i] : markets[i - numPast].maturity;
+            maturities[i].vaultState = NOTIONAL.getVaultState(vault, maturity);
+
+            try IAuraVaultViews(vault).getEmergencySettlementPoolClaimAmount(maturity) returns (uint256 poolClaim) {
+                maturities[i].hasEmergencySettlement = true;
+                maturities[i].emergencySettlementPoolClaim = poolClaim;
+            } catch {}
+        }
+    }
+
+    function _getSpotPrices(address vault, uint256 numTokens) private view returns (uint256[] memory spotPrices) {
+        spotPrices = new uint256[](numTokens);
+        for (uint256 i; i < numTokens; i++) {
+            (bool success, bytes memory result) = vault.staticcall(abi.encodeWithSelector(GET_SPOT_PRICE_UINT256, i));
+            if (!success) {
+                result = _staticcall(vault, abi.encodeWithSelector(GET_SPOT_PRICE_UINT8, i));
+            }
+            spotPrices[i] = abi.decode(result, (uint256));
+        }
+    }
+
+    function _getOraclePrices(
+        address quoteToken,
+        address[] calldata baseTokens
+    ) private view returns (OraclePrice[] memory oraclePrices) {
+        oraclePrices = new OraclePrice[](baseTokens.length);
+        for (uint256 i; i < baseTokens.length; i++) {
+            oraclePrices[i].base = baseTokens[i];
+            oraclePrices[i].quote = quoteToken;
+
+            try TRADING_MODULE.getOraclePrice(baseTokens[i], quoteToken) returns (int256 answer, int256 decimals) {
+                oraclePrices[i].isValid = true;
+                oraclePrices[i].answer = answer;
+                oraclePrices[i].decimals = decimals;
+            } catch {}
+        }
+    }
+
+    function _staticcall(address target, bytes memory data) private view returns (bytes memory result) {
+        bool success;
+        (success, result) = target.staticcall(data);
+        if (!success) {
+            // Bubble up the revert reason from the vault
+            assembly {
+                revert(add(result, 32), mload(result))
+            }
+        }
+    }
+}
@@ -16,7 +16,8 @@ import {
     ThreeTokenPoolContext,
     DepositParams,
     RedeemParams,
-    ReinvestRewardParams
+    ReinvestRewardParams,
+    MaturitySettlement
 } from "./common/VaultTypes.sol";
 import {StrategyUtils} from "./common/internal/strategy/StrategyUtils.sol";
 import {BalancerConstants} from "./balancer/internal/BalancerConstants.sol";
@@ -126,6 +127,29 @@ contract Boosted3TokenAuraVault is Boosted3TokenPoolMixin {
         );
     }
 
+    /// @notice Post maturity settlement for multiple maturities, redeem params are decoded and
+    /// validated once. Each single sided exit moves the pool, so the strategy context is reloaded
+    /// for every maturity and minPrimary is calculated against the current pool balances.
+    function settleVaultPostMaturityBatch(
+        MaturitySettlement[] calldata settlements,
+        bytes calldata data
+    ) external onlyRole(POST_MATURITY_SETTLEMENT_ROLE) {
+        for (uint256 i; i < settlements.length; i++) {
+            if (block.timestamp < settlements[i].maturity) {
+                revert Errors.HasNotMatured();
+            }
+        }
+        RedeemParams memory params = SettlementUtils._decodeParamsAndValidate(
+            VaultStorage.getStrategyVaultSettings().postMaturitySettlementSlippageLimitPercent,
+            data
+        );
+        for (uint256 i; i < settlements.length; i++) {
+            Boosted3TokenAuraHelper.settleVault(
+                _strategyContext(), settlements[i].maturity, settlements[i].strategyTokensToRedeem, params
+            );
+        }
+    }
+
     function settleVaultEmergency(uint256 maturity, bytes calldata data) 
         external onlyRole(EMERGENCY_SETTLEMENT_ROLE) {
         // No need for emergency settlement during the settlement window
@@ -140,6 +164,12 @@ contract Boosted3TokenAuraVault is Boosted3TokenPoolMixin {
         Boosted3TokenAuraHelper.reinvestReward(_strategyContext(), params);
     }
 
+    /// @notice Sells multiple reward tokens and reinvests them with a single pool join
+    function reinvestRewardBatch(ReinvestRewardParams calldata params) 
+        external onlyRole(REWARD_REINVESTMENT_ROLE) {
+        Boosted3TokenAuraHelper.reinvestRewardBatch(_strategyContext(), params);
+    }
+
     function convertStrategyToUnderlying(
         address account,
         uint256 strategyTokenAmount,
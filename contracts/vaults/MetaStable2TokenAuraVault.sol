@@ -18,7 +18,8 @@ import {
     TwoTokenPoolContext,
     DepositParams,
     RedeemParams,
-    ReinvestRewardParams
+    ReinvestRewardParams,
+    MaturitySettlement
 } from "./common/VaultTypes.sol";
 import {MetaStable2TokenVaultMixin} from "./balancer/mixins/MetaStable2TokenVaultMixin.sol";
 import {AuraStakingMixin} from "./balancer/mixins/AuraStakingMixin.sol";
@@ -145,6 +146,25 @@ contract MetaStable2TokenAuraVault is MetaStable2TokenVaultMixin {
         );
     }
 
+    /// @notice Post maturity settlement for multiple maturities, the strategy context is
+    /// loaded and validated once for all maturities
+    function settleVaultPostMaturityBatch(
+        MaturitySettlement[] calldata settlements,
+        bytes calldata data
+    ) external onlyRole(POST_MATURITY_SETTLEMENT_ROLE) {
+        for (uint256 i; i < settlements.length; i++) {
+            if (block.timestamp < settlements[i].maturity) {
+                revert Errors.HasNotMatured();
+            }
+        }
+        MetaStable2TokenAuraStrategyContext memory context = _strategyContext();
+        RedeemParams memory params = SettlementUtils._decodeParamsAndValidate(
+            context.baseStrategy.vaultSettings.postMaturitySettlementSlippageLimitPercent,
+            data
+        );
+        MetaStable2TokenAuraHelper.settleVaultBatch(context, settlements, params);
+    }
+
     function settleVaultEmergency(uint256 maturity, bytes calldata data) 
         external onlyRole(EMERGENCY_SETTLEMENT_ROLE) {
         // No need for emergency settlement during the settlement window
@@ -159,6 +179,12 @@ contract MetaStable2TokenAuraVault is MetaStable2TokenVaultMixin {
         MetaStable2TokenAuraHelper.reinvestReward(_strategyContext(), params);
     }
 
+    /// @notice Sells multiple reward tokens and reinvests them with a single pool join
+    function reinvestRewardBatch(ReinvestRewardParams calldata params) 
+        external onlyRole(REWARD_REINVESTMENT_ROLE) {
+        MetaStable2TokenAuraHelper.reinvestRewardBatch(_strategyContext(), params);
+    }
+
     /// @notice Updates the vault settings
     /// @param settings vault settings
     function setStrategyVaultSettings(StrategyVaultSettings calldata settings)
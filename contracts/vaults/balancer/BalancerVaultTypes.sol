@@ -60,6 +60,8 @@ struct UnderlyingPoolContext {
     uint256 fee;
     uint256 lowerTarget;
     uint256 upperTarget;
+    bytes32 poolId;
+    address mainToken;
 }
 
 struct BoostedOracleContext {
@@ -26,16 +26,17 @@ import {Balancer3TokenBoostedPoolUtils} from "../internal/pool/Balancer3TokenBoo
 import {Boosted3TokenAuraRewardUtils} from "../internal/reward/Boosted3TokenAuraRewardUtils.sol";
 import {VaultStorage} from "../../common/VaultStorage.sol";
 import {StableMath} from "../internal/math/StableMath.sol";
+import {TypeConvert} from "../../../global/TypeConvert.sol";
 
 library Boosted3TokenAuraHelper {
-    using Boosted3TokenAuraRewardUtils for Balancer3TokenPoolContext;
-    using Boosted3TokenAuraRewardUtils for ThreeTokenPoolContext;
+    using Boosted3TokenAuraRewardUtils for BoostedOracleContext;
     using Balancer3TokenBoostedPoolUtils for Balancer3TokenPoolContext;
     using Balancer3TokenBoostedPoolUtils for ThreeTokenPoolContext;
     using StrategyUtils for StrategyContext;
     using SettlementUtils for StrategyContext;
     using VaultStorage for StrategyVaultSettings;
     using VaultStorage for StrategyVaultState;
+    using TypeConvert for uint256;
 
     function deposit(
         Boosted3TokenAuraStrategyContext memory context,
@@ -64,6 +65,7 @@ library Boosted3TokenAuraHelper {
         finalPrimaryBalance = context.poolContext._redeem({
             strategyContext: context.baseStrategy,
             stakingContext: context.stakingContext,
+            oracleContext: context.oracleContext,
             strategyTokens: strategyTokens,
             minPrimary: params.minPrimary
         });
@@ -130,18 +132,18 @@ library Boosted3TokenAuraHelper {
         uint256 redeemStrategyTokenAmount,
         RedeemParams memory params
     ) private {        
+        // Pool data and oracle prices are validated once and shared by minPrimary and the
+        // expected underlying redeemed
+        uint256 primaryPerBPT = poolContext._getTimeWeightedPrimaryPerBPT(oracleContext, strategyContext);
+
         // Calculate minPrimary using Chainlink oracle data
-        params.minPrimary = poolContext._getTimeWeightedPrimaryBalance(
-            oracleContext, strategyContext, bptToSettle
-        );
+        params.minPrimary = poolContext._getPrimaryBalanceForBPT(primaryPerBPT, bptToSettle);
         params.minPrimary = params.minPrimary * strategyContext.vaultSettings.poolSlippageLimitPercent / 
             uint256(VaultConstants.VAULT_PERCENT_BASIS);
 
-        int256 expectedUnderlyingRedeemed = poolContext._convertStrategyToUnderlying({
-            strategyContext: strategyContext,
-            oracleContext: oracleContext,
-            strategyTokenAmount: redeemStrategyTokenAmount
-        });
+        int256 expectedUnderlyingRedeemed = poolContext._getPrimaryBalanceForBPT(
+            primaryPerBPT, strategyContext._convertStrategyTokensToPoolClaim(redeemStrategyTokenAmount)
+        ).toInt();
 
         strategyContext._executeSettlement({
             maturity: maturity,
@@ -155,22 +157,51 @@ library Boosted3TokenAuraHelper {
         Boosted3TokenAuraStrategyContext calldata context,
         ReinvestRewardParams calldata params
     ) external {        
+        (address rewardToken, uint256 primaryAmount) = context.oracleContext._executeRewardTrades({
+            rewardTokens: context.stakingContext.rewardTokens,
+            tradingModule: context.baseStrategy.tradingModule,
+            data: params.tradeData
+        });
+
+        uint256 bptAmount = _joinPoolAndStakeRewards(context, primaryAmount);
+
+        emit VaultEvents.RewardReinvested(rewardToken, primaryAmount, 0, bptAmount); 
+    }
+
+    /// @notice Sells multiple reward tokens and reinvests the proceeds with a single pool join and stake
+    /// @param params tradeData is an abi encoded SingleSidedRewardTradeParams[]
+    function reinvestRewardBatch(
+        Boosted3TokenAuraStrategyContext calldata context,
+        ReinvestRewardParams calldata params
+    ) external {
+        (
+            address[] memory rewardTokens,
+            uint256 primaryAmount
+        ) = context.oracleContext._executeRewardTradesBatch({
+            rewardTokens: context.stakingContext.rewardTokens,
+            tradingModule: context.baseStrategy.tradingModule,
+            data: params.tradeData
+        });
+
+        uint256 bptAmount = _joinPoolAndStakeRewards(context, primaryAmount);
+
+        emit VaultEvents.RewardsReinvested(rewardTokens, primaryAmount, 0, bptAmount); 
+    }
+
+    function _joinPoolAndStakeRewards(
+        Boosted3TokenAuraStrategyContext calldata context,
+        uint256 primaryAmount
+    ) private returns (uint256 bptAmount) {
         StrategyContext memory strategyContext = context.baseStrategy;
         BoostedOracleContext calldata oracleContext = context.oracleContext;
         AuraStakingContext calldata stakingContext = context.stakingContext;
         Balancer3TokenPoolContext calldata poolContext = context.poolContext;
 
-        (address rewardToken, uint256 primaryAmount) = context.poolContext.basePool._executeRewardTrades({
-            rewardTokens: stakingContext.rewardTokens,
-            tradingModule: strategyContext.tradingModule,
-            data: params.tradeData
-        });
-
         /// @notice This function is used to validate the spot price against
         /// the oracle price. The return values are not used.
         poolContext._getValidatedPoolData(oracleContext, strategyContext);
 
-        uint256 bptAmount = context.poolContext._joinPoolAndStake({
+        bptAmount = context.poolContext._joinPoolAndStake({
             strategyContext: strategyContext,
             stakingContext: stakingContext,
             oracleContext: oracleContext,
@@ -188,8 +219,6 @@ library Boosted3TokenAuraHelper {
 
         strategyContext.vaultState.totalPoolClaim += bptAmount;
         strategyContext.vaultState.setStrategyVaultState(); 
-
-        emit VaultEvents.RewardReinvested(rewardToken, primaryAmount, 0, bptAmount); 
     }
 
     function convertStrategyToUnderlying(
@@ -13,7 +13,8 @@ import {
     TwoTokenPoolContext,
     DepositParams,
     RedeemParams,
-    ReinvestRewardParams
+    ReinvestRewardParams,
+    MaturitySettlement
 } from "../../common/VaultTypes.sol";
 import {VaultEvents} from "../../common/VaultEvents.sol";
 import {SettlementUtils} from "../../common/internal/settlement/SettlementUtils.sol";
@@ -23,6 +24,7 @@ import {Balancer2TokenPoolUtils} from "../internal/pool/Balancer2TokenPoolUtils.
 import {Stable2TokenOracleMath} from "../internal/math/Stable2TokenOracleMath.sol";
 import {VaultStorage} from "../../common/VaultStorage.sol";
 import {IERC20} from "../../../../interfaces/IERC20.sol";
+import {TypeConvert} from "../../../global/TypeConvert.sol";
 
 library MetaStable2TokenAuraHelper {
     using Balancer2TokenPoolUtils for Balancer2TokenPoolContext;
@@ -33,6 +35,7 @@ library MetaStable2TokenAuraHelper {
     using SettlementUtils for StrategyContext;
     using VaultStorage for StrategyVaultSettings;
     using VaultStorage for StrategyVaultState;
+    using TypeConvert for uint256;
 
     function deposit(
         MetaStable2TokenAuraStrategyContext memory context,
@@ -85,6 +88,61 @@ library MetaStable2TokenAuraHelper {
         emit VaultEvents.VaultSettlement(maturity, bptToSettle, strategyTokensToRedeem);
     }
 
+    /// @notice Settles multiple maturities against a single strategy context. The oracle pair price,
+    /// spot price and pool supply are loaded once and reused to calculate the min exit amounts and the
+    /// expected underlying redeemed for every maturity. The pool supply is read before the first exit
+    /// so that it stays consistent with the pool balances in the context, each exit reduces both.
+    function settleVaultBatch(
+        MetaStable2TokenAuraStrategyContext calldata context,
+        MaturitySettlement[] calldata settlements,
+        RedeemParams memory params
+    ) external {
+        StrategyContext calldata strategyContext = context.baseStrategy;
+        TwoTokenPoolContext calldata basePool = context.poolContext.basePool;
+
+        uint256 oraclePrice = basePool._getOraclePairPrice(strategyContext);
+        // Oracle price is always specified in terms of primary, so tokenIndex == 0 for primary
+        uint256 spotPrice = context.oracleContext._getSpotPrice({
+            poolContext: context.poolContext,
+            primaryBalance: basePool.primaryBalance,
+            secondaryBalance: basePool.secondaryBalance,
+            tokenIndex: 0
+        });
+        uint256 totalPoolSupply = basePool.poolToken.totalSupply();
+
+        for (uint256 i; i < settlements.length; i++) {
+            MaturitySettlement calldata settlement = settlements[i];
+            uint256 bptToSettle = strategyContext._convertStrategyTokensToPoolClaim(settlement.strategyTokensToRedeem);
+
+            /// @notice params.minPrimary and params.minSecondary are not required to be passed in by the caller
+            /// for this strategy vault
+            (params.minPrimary, params.minSecondary) = basePool._getMinExitAmounts({
+                strategyContext: strategyContext,
+                spotPrice: spotPrice,
+                oraclePrice: oraclePrice,
+                poolClaim: bptToSettle,
+                totalPoolSupply: totalPoolSupply
+            });
+
+            uint256 expectedUnderlyingRedeemed = basePool._getTimeWeightedPrimaryBalance({
+                strategyContext: strategyContext,
+                poolClaim: bptToSettle,
+                oraclePrice: oraclePrice,
+                spotPrice: spotPrice,
+                totalPoolSupply: totalPoolSupply
+            });
+
+            strategyContext._executeSettlement({
+                maturity: settlement.maturity,
+                expectedUnderlyingRedeemed: expectedUnderlyingRedeemed.toInt(),
+                redeemStrategyTokenAmount: settlement.strategyTokensToRedeem,
+                params: params
+            });
+
+            emit VaultEvents.VaultSettlement(settlement.maturity, bptToSettle, settlement.strategyTokensToRedeem);
+        }
+    }
+
     function settleVaultEmergency(
         MetaStable2TokenAuraStrategyContext calldata context, 
         uint256 maturity, 
@@ -125,22 +183,35 @@ library MetaStable2TokenAuraHelper {
         uint256 redeemStrategyTokenAmount,
         RedeemParams memory params
     ) private {
+        // Oracle and spot prices are read once and shared by the min exit amounts and the
+        // expected underlying redeemed
         uint256 oraclePrice = poolContext.basePool._getOraclePairPrice(strategyContext);
+        // Oracle price is always specified in terms of primary, so tokenIndex == 0 for primary
+        uint256 spotPrice = oracleContext._getSpotPrice({
+            poolContext: poolContext,
+            primaryBalance: poolContext.basePool.primaryBalance,
+            secondaryBalance: poolContext.basePool.secondaryBalance,
+            tokenIndex: 0
+        });
+        uint256 totalPoolSupply = poolContext.basePool.poolToken.totalSupply();
 
         /// @notice params.minPrimary and params.minSecondary are not required to be passed in by the caller
         /// for this strategy vault
-        (params.minPrimary, params.minSecondary) = oracleContext._getMinExitAmounts({
-            poolContext: poolContext,
+        (params.minPrimary, params.minSecondary) = poolContext.basePool._getMinExitAmounts({
             strategyContext: strategyContext,
+            spotPrice: spotPrice,
             oraclePrice: oraclePrice,
-            bptAmount: bptToSettle
+            poolClaim: bptToSettle,
+            totalPoolSupply: totalPoolSupply
         });
 
-        int256 expectedUnderlyingRedeemed = poolContext._convertStrategyToUnderlying({
+        int256 expectedUnderlyingRedeemed = poolContext.basePool._getTimeWeightedPrimaryBalance({
             strategyContext: strategyContext,
-            oracleContext: oracleContext,
-            strategyTokenAmount: redeemStrategyTokenAmount
-        });
+            poolClaim: strategyContext._convertStrategyTokensToPoolClaim(redeemStrategyTokenAmount),
+            oraclePrice: oraclePrice,
+            spotPrice: spotPrice,
+            totalPoolSupply: totalPoolSupply
+        }).toInt();
 
         strategyContext._executeSettlement({
             maturity: maturity,
@@ -154,20 +225,52 @@ library MetaStable2TokenAuraHelper {
         MetaStable2TokenAuraStrategyContext calldata context,
         ReinvestRewardParams calldata params
     ) external {
-        StrategyContext memory strategyContext = context.baseStrategy;
-        Balancer2TokenPoolContext calldata poolContext = context.poolContext; 
-        StableOracleContext calldata oracleContext = context.oracleContext;
-
         (
             address rewardToken, 
             uint256 primaryAmount, 
             uint256 secondaryAmount
-        ) = poolContext.basePool._executeRewardTrades({
+        ) = context.poolContext.basePool._executeRewardTrades({
+            rewardTokens: context.stakingContext.rewardTokens,
+            tradingModule: context.baseStrategy.tradingModule,
+            data: params.tradeData
+        });
+
+        uint256 bptAmount = _joinPoolAndStakeRewards(context, primaryAmount, secondaryAmount, params.minPoolClaim);
+
+        emit VaultEvents.RewardReinvested(rewardToken, primaryAmount, secondaryAmount, bptAmount); 
+    }
+
+    /// @notice Sells multiple reward tokens and reinvests the proceeds with a single pool join and stake
+    /// @param params tradeData is an abi encoded Proportional2TokenRewardTradeParams[]
+    function reinvestRewardBatch(
+        MetaStable2TokenAuraStrategyContext calldata context,
+        ReinvestRewardParams calldata params
+    ) external {
+        (
+            address[] memory rewardTokens, 
+            uint256 primaryAmount, 
+            uint256 secondaryAmount
+        ) = context.poolContext.basePool._executeRewardTradesBatch({
             rewardTokens: context.stakingContext.rewardTokens,
-            tradingModule: strategyContext.tradingModule,
+            tradingModule: context.baseStrategy.tradingModule,
             data: params.tradeData
         });
 
+        uint256 bptAmount = _joinPoolAndStakeRewards(context, primaryAmount, secondaryAmount, params.minPoolClaim);
+
+        emit VaultEvents.RewardsReinvested(rewardTokens, primaryAmount, secondaryAmount, bptAmount); 
+    }
+
+    function _joinPoolAndStakeRewards(
+        MetaStable2TokenAuraStrategyContext calldata context,
+        uint256 primaryAmount,
+        uint256 secondaryAmount,
+        uint256 minPoolClaim
+    ) private returns (uint256 bptAmount) {
+        StrategyContext memory strategyContext = context.baseStrategy;
+        Balancer2TokenPoolContext calldata poolContext = context.poolContext; 
+        StableOracleContext calldata oracleContext = context.oracleContext;
+
         // Make sure we are joining with the right proportion to minimize slippage
         oracleContext._validateSpotPriceAndPairPrice({
             poolContext: poolContext,
@@ -177,19 +280,17 @@ library MetaStable2TokenAuraHelper {
             secondaryAmount: secondaryAmount
         });
 
-        uint256 bptAmount = poolContext._joinPoolAndStake({
+        bptAmount = poolContext._joinPoolAndStake({
             strategyContext: strategyContext,
             stakingContext: context.stakingContext,
             primaryAmount: primaryAmount,
             secondaryAmount: secondaryAmount,
             /// @notice minBPT is not required to be set by the caller because primaryAmount
             /// and secondaryAmount are already validated
-            minBPT: params.minPoolClaim      
+            minBPT: minPoolClaim      
         });
 
         strategyContext.vaultState.totalPoolClaim += bptAmount;
         strategyContext.vaultState.setStrategyVaultState(); 
-
-        emit VaultEvents.RewardReinvested(rewardToken, primaryAmount, secondaryAmount, bptAmount); 
     }
 }
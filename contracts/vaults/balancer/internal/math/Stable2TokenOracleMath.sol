@@ -5,7 +5,6 @@ import {StableOracleContext, Balancer2TokenPoolContext, StrategyContext} from ".
 import {TwoTokenPoolContext} from "../../../common/VaultTypes.sol";
 import {VaultConstants} from "../../../common/VaultConstants.sol";
 import {StrategyUtils} from "../../../common/internal/strategy/StrategyUtils.sol";
-import {TwoTokenPoolUtils} from "../../../common/internal/pool/TwoTokenPoolUtils.sol";
 import {BalancerConstants} from "../BalancerConstants.sol";
 import {Errors} from "../../../../global/Errors.sol";
 import {TypeConvert} from "../../../../global/TypeConvert.sol";
@@ -15,7 +14,6 @@ import {ITradingModule} from "../../../../../interfaces/trading/ITradingModule.s
 library Stable2TokenOracleMath {
     using TypeConvert for int256;
     using Stable2TokenOracleMath for StableOracleContext;
-    using TwoTokenPoolUtils for TwoTokenPoolContext;
     using StrategyUtils for StrategyContext;
 
     function _getSpotPrice(
@@ -70,32 +68,6 @@ library Stable2TokenOracleMath {
         }
     }
 
-    /// @notice calculates the expected min exit amounts for a given BPT amount
-    function _getMinExitAmounts(
-        StableOracleContext calldata oracleContext,
-        Balancer2TokenPoolContext calldata poolContext,
-        StrategyContext calldata strategyContext,
-        uint256 oraclePrice,
-        uint256 bptAmount
-    ) internal view returns (uint256 minPrimary, uint256 minSecondary) {
-        // Oracle price is always specified in terms of primary, so tokenIndex == 0 for primary
-        // Validate the spot price to make sure the pool is not being manipulated
-        uint256 spotPrice = _getSpotPrice({
-            oracleContext: oracleContext,
-            poolContext: poolContext,
-            primaryBalance: poolContext.basePool.primaryBalance,
-            secondaryBalance: poolContext.basePool.secondaryBalance,
-            tokenIndex: 0
-        });
-
-        (minPrimary, minSecondary) = poolContext.basePool._getMinExitAmounts({
-            strategyContext: strategyContext,
-            spotPrice: spotPrice,
-            oraclePrice: oraclePrice,
-            poolClaim: bptAmount
-        });
-    }
-
     function _validateSpotPriceAndPairPrice(
         StableOracleContext calldata oracleContext,
         Balancer2TokenPoolContext calldata poolContext,
@@ -92,7 +92,8 @@ library Balancer2TokenPoolUtils {
             strategyContext: strategyContext,
             poolClaim: bptAmount,
             oraclePrice: oraclePairPrice,
-            spotPrice: spotPrice
+            spotPrice: spotPrice,
+            totalPoolSupply: poolContext.basePool.poolToken.totalSupply()
         });
     }
 
@@ -184,15 +184,11 @@ library Balancer3TokenBoostedPoolUtils {
         Balancer3TokenPoolContext memory poolContext, 
         BoostedOracleContext memory oracleContext,
         StrategyContext memory context,
-        address tokenIn,
-        address tokenOut,
+        int256 answer,
         uint8 tokenIndex,
         uint256[] memory balances,
         uint256 invariant
     ) private view {
-        (int256 answer, int256 decimals) = context.tradingModule.getOraclePrice(tokenOut, tokenIn);
-        require(decimals == int256(BalancerConstants.BALANCER_PRECISION));
-        
         uint256 spotPrice = _getSpotPriceWithInvariant({
             poolContext: poolContext,
             oracleContext: oracleContext,
@@ -222,16 +218,21 @@ library Balancer3TokenBoostedPoolUtils {
         uint256[] memory balances,
         uint256 invariant
     ) private view {
-        address primaryUnderlying = ILinearPool(address(poolContext.basePool.basePool.primaryToken)).getMainToken();
-        address secondaryUnderlying = ILinearPool(address(poolContext.basePool.basePool.secondaryToken)).getMainToken();
-        address tertiaryUnderlying = ILinearPool(address(poolContext.basePool.tertiaryToken)).getMainToken();
+        address[] memory baseTokens = new address[](2);
+        baseTokens[0] = oracleContext.underlyingPools[1].mainToken; // secondary underlying
+        baseTokens[1] = oracleContext.underlyingPools[2].mainToken; // tertiary underlying
+
+        // Both prices are quoted in the primary underlying, the primary oracle is only read once
+        (int256[] memory answers, int256 decimals) = strategyContext.tradingModule.getOraclePrices(
+            baseTokens, oracleContext.underlyingPools[0].mainToken
+        );
+        require(decimals == int256(BalancerConstants.BALANCER_PRECISION));
 
         _validateSpotPrice({
             poolContext: poolContext,
             oracleContext: oracleContext,
             context: strategyContext,
-            tokenIn: primaryUnderlying,
-            tokenOut: secondaryUnderlying,
+            answer: answers[0],
             tokenIndex: 1, // secondary index
             balances: balances,
             invariant: invariant
@@ -241,8 +242,7 @@ library Balancer3TokenBoostedPoolUtils {
             poolContext: poolContext,
             oracleContext: oracleContext,
             context: strategyContext,
-            tokenIn: primaryUnderlying,
-            tokenOut: tertiaryUnderlying,
+            answer: answers[1],
             tokenIndex: 2, // tertiary index
             balances: balances,
             invariant: invariant
@@ -294,6 +294,22 @@ library Balancer3TokenBoostedPoolUtils {
         StrategyContext memory strategyContext,
         uint256 bptAmount
     ) internal view returns (uint256 primaryAmount) {
+        primaryAmount = _getPrimaryBalanceForBPT(
+            poolContext, _getTimeWeightedPrimaryPerBPT(poolContext, oracleContext, strategyContext), bptAmount
+        );
+    }
+
+    /// @notice Gets the time-weighted value of 1 BPT in the primary underlying token (in BALANCER_PRECISION),
+    /// spot prices are validated against oracle prices. The value scales linearly with the BPT amount so it can
+    /// be reused to value multiple BPT amounts against the same pool state.
+    /// @param poolContext pool context variables
+    /// @param oracleContext oracle context variables
+    /// @return primaryPerBPT primary underlying value of 1 BPT
+    function _getTimeWeightedPrimaryPerBPT(
+        Balancer3TokenPoolContext memory poolContext,
+        BoostedOracleContext memory oracleContext,
+        StrategyContext memory strategyContext
+    ) internal view returns (uint256 primaryPerBPT) {
         (
            uint256[] memory balances, 
            uint256 invariant
@@ -318,10 +334,17 @@ library Balancer3TokenBoostedPoolUtils {
         linearBPTAmount = linearBPTAmount * BalancerConstants.BALANCER_PRECISION / poolContext.primaryScaleFactor;
 
         // Primary underlying pool = index 0
-        primaryAmount = _getUnderlyingMainOut(oracleContext.underlyingPools[0], linearBPTAmount);
+        primaryPerBPT = _getUnderlyingMainOut(oracleContext.underlyingPools[0], linearBPTAmount);
+    }
 
+    /// @notice Scales the value of 1 BPT to the given bptAmount in primary precision
+    function _getPrimaryBalanceForBPT(
+        Balancer3TokenPoolContext memory poolContext,
+        uint256 primaryPerBPT,
+        uint256 bptAmount
+    ) internal pure returns (uint256 primaryAmount) {
         uint256 primaryPrecision = 10 ** poolContext.basePool.basePool.primaryDecimals;
-        primaryAmount = (primaryAmount * bptAmount * primaryPrecision) / BalancerConstants.BALANCER_PRECISION_SQUARED;
+        primaryAmount = (primaryPerBPT * bptAmount * primaryPrecision) / BalancerConstants.BALANCER_PRECISION_SQUARED;
     }
 
     function _approveBalancerTokens(ThreeTokenPoolContext memory poolContext, address bptSpender) internal {
@@ -336,14 +359,18 @@ library Balancer3TokenBoostedPoolUtils {
         IERC20(primaryUnderlyingAddress).checkApprove(address(Deployments.BALANCER_VAULT), type(uint256).max);
     }
 
-    function _joinPoolExactTokensIn(Balancer3TokenPoolContext memory context, uint256 primaryAmount, uint256 minBPT)
-        private returns (uint256 bptAmount) {
+    function _joinPoolExactTokensIn(
+        Balancer3TokenPoolContext memory context,
+        UnderlyingPoolContext memory primaryPool,
+        uint256 primaryAmount,
+        uint256 minBPT
+    ) private returns (uint256 bptAmount) {
         ILinearPool underlyingPool = ILinearPool(address(context.basePool.basePool.primaryToken));
 
         // Swap underlyingToken for LinearPool BPT
         uint256 linearPoolBPT = BalancerUtils._swapGivenIn({
-            poolId: underlyingPool.getPoolId(),
-            tokenIn: underlyingPool.getMainToken(),
+            poolId: primaryPool.poolId,
+            tokenIn: primaryPool.mainToken,
             tokenOut: address(underlyingPool),
             amountIn: primaryAmount,
             limit: 0 // slippage checked on the second swap
@@ -359,8 +386,12 @@ library Balancer3TokenBoostedPoolUtils {
         });
     }
 
-    function _exitPoolExactBPTIn(Balancer3TokenPoolContext memory context, uint256 bptExitAmount, uint256 minPrimary)
-        private returns (uint256 primaryBalance) {
+    function _exitPoolExactBPTIn(
+        Balancer3TokenPoolContext memory context,
+        UnderlyingPoolContext memory primaryPool,
+        uint256 bptExitAmount,
+        uint256 minPrimary
+    ) private returns (uint256 primaryBalance) {
         ILinearPool underlyingPool = ILinearPool(address(context.basePool.basePool.primaryToken));
 
         // Swap Boosted BPT for LinearPool BPT
@@ -374,9 +405,9 @@ library Balancer3TokenBoostedPoolUtils {
 
         // Swap LinearPool BPT for underlyingToken
         primaryBalance = BalancerUtils._swapGivenIn({
-            poolId: underlyingPool.getPoolId(),
+            poolId: primaryPool.poolId,
             tokenIn: address(underlyingPool),
-            tokenOut: underlyingPool.getMainToken(),
+            tokenOut: primaryPool.mainToken,
             amountIn: linearPoolBPT,
             limit: minPrimary
         }); 
@@ -405,6 +436,7 @@ library Balancer3TokenBoostedPoolUtils {
         Balancer3TokenPoolContext memory poolContext,
         StrategyContext memory strategyContext,
         AuraStakingContext memory stakingContext,
+        BoostedOracleContext memory oracleContext,
         uint256 strategyTokens,
         uint256 minPrimary
     ) internal returns (uint256 finalPrimaryBalance) {
@@ -413,6 +445,7 @@ library Balancer3TokenBoostedPoolUtils {
         finalPrimaryBalance = _unstakeAndExitPool({
             stakingContext: stakingContext,
             poolContext: poolContext,
+            oracleContext: oracleContext,
             bptClaim: bptClaim,
             minPrimary: minPrimary
         });
@@ -426,7 +459,7 @@ library Balancer3TokenBoostedPoolUtils {
         uint256 deposit,
         uint256 minBPT
     ) internal returns (uint256 bptMinted) {
-        bptMinted = _joinPoolExactTokensIn(poolContext, deposit, minBPT);
+        bptMinted = _joinPoolExactTokensIn(poolContext, oracleContext.underlyingPools[0], deposit, minBPT);
 
         // Check BPT threshold to make sure our share of the pool is
         // below maxPoolShare
@@ -445,6 +478,7 @@ library Balancer3TokenBoostedPoolUtils {
     function _unstakeAndExitPool(
         Balancer3TokenPoolContext memory poolContext,
         AuraStakingContext memory stakingContext,
+        BoostedOracleContext memory oracleContext,
         uint256 bptClaim,
         uint256 minPrimary
     ) internal returns (uint256 primaryBalance) {
@@ -452,7 +486,7 @@ library Balancer3TokenBoostedPoolUtils {
         bool success = stakingContext.rewardPool.withdrawAndUnwrap(bptClaim, false); // claimRewards = false
         if (!success) revert Errors.UnstakeFailed();
 
-        primaryBalance = _exitPoolExactBPTIn(poolContext, bptClaim, minPrimary); 
+        primaryBalance = _exitPoolExactBPTIn(poolContext, oracleContext.underlyingPools[0], bptClaim, minPrimary); 
     }
 
     /// @notice We value strategy tokens in terms of the primary balance. The time weighted
@@ -1,10 +1,11 @@
 // SPDX-License-Identifier: GPL-3.0-only
 pragma solidity 0.8.17;
 
+import {BoostedOracleContext} from "../../BalancerVaultTypes.sol";
 import {
-    ThreeTokenPoolContext, 
     ReinvestRewardParams, 
-    SingleSidedRewardTradeParams
+    SingleSidedRewardTradeParams,
+    TradeParams
 } from "../../../common/VaultTypes.sol";
 import {VaultEvents} from "../../../common/VaultEvents.sol";
 import {Errors} from "../../../../global/Errors.sol";
@@ -13,33 +14,32 @@ import {Balancer3TokenBoostedPoolUtils} from "../pool/Balancer3TokenBoostedPoolU
 import {StrategyUtils} from "../../../common/internal/strategy/StrategyUtils.sol";
 import {RewardUtils} from "../../../common/internal/reward/RewardUtils.sol";
 import {ITradingModule} from "../../../../../interfaces/trading/ITradingModule.sol";
-import {ILinearPool} from "../../../../../interfaces/balancer/IBalancerPool.sol";
 import {IERC20} from "../../../../../interfaces/IERC20.sol";
 
 library Boosted3TokenAuraRewardUtils {
     function _validateTrade(
         IERC20[] memory rewardTokens,
         SingleSidedRewardTradeParams memory params,
-        address primaryToken
-    ) private view {
+        address primaryUnderlying
+    ) private pure {
         // Validate trades
         if (!RewardUtils._isValidRewardToken(rewardTokens, params.sellToken)) {
             revert Errors.InvalidRewardToken(params.sellToken);
         }
-        if (params.buyToken != ILinearPool(primaryToken).getMainToken()) {
+        if (params.buyToken != primaryUnderlying) {
             revert Errors.InvalidRewardToken(params.buyToken);
         }
     }
 
     function _executeRewardTrades(
-        ThreeTokenPoolContext calldata poolContext,
+        BoostedOracleContext calldata oracleContext,
         IERC20[] memory rewardTokens,
         ITradingModule tradingModule,
         bytes calldata data
     ) internal returns (address rewardToken, uint256 primaryAmount) {
         SingleSidedRewardTradeParams memory params = abi.decode(data, (SingleSidedRewardTradeParams));
 
-        _validateTrade(rewardTokens, params, poolContext.basePool.primaryToken);
+        _validateTrade(rewardTokens, params, oracleContext.underlyingPools[0].mainToken);
 
         (/*uint256 amountSold*/, primaryAmount) = StrategyUtils._executeTradeExactIn({
             params: params.tradeParams,
@@ -52,4 +52,42 @@ library Boosted3TokenAuraRewardUtils {
 
         rewardToken = params.sellToken;
     }
+
+    /// @notice Sells multiple reward tokens into the primary underlying token in a single trading
+    /// module call so that they can be reinvested with a single pool join
+    /// @param data abi encoded SingleSidedRewardTradeParams[], one entry per reward token
+    function _executeRewardTradesBatch(
+        BoostedOracleContext calldata oracleContext,
+        IERC20[] memory rewardTokens,
+        ITradingModule tradingModule,
+        bytes calldata data
+    ) internal returns (address[] memory rewardTokensSold, uint256 primaryAmount) {
+        SingleSidedRewardTradeParams[] memory params = abi.decode(data, (SingleSidedRewardTradeParams[]));
+        address primaryUnderlying = oracleContext.underlyingPools[0].mainToken;
+
+        TradeParams[] memory tradeParams = new TradeParams[](params.length);
+        rewardTokensSold = new address[](params.length);
+        address[] memory buyTokens = new address[](params.length);
+        uint256[] memory amounts = new uint256[](params.length);
+        for (uint256 i; i < params.length; i++) {
+            _validateTrade(rewardTokens, params[i], primaryUnderlying);
+            tradeParams[i] = params[i].tradeParams;
+            rewardTokensSold[i] = params[i].sellToken;
+            buyTokens[i] = params[i].buyToken;
+            amounts[i] = params[i].amount;
+        }
+
+        (/*uint256[] amountsSold*/, uint256[] memory amountsBought) = StrategyUtils._executeTradesExactIn({
+            params: tradeParams,
+            tradingModule: tradingModule,
+            sellTokens: rewardTokensSold,
+            buyTokens: buyTokens,
+            amounts: amounts,
+            useDynamicSlippage: false
+        });
+
+        for (uint256 i; i < amountsBought.length; i++) {
+            primaryAmount += amountsBought[i];
+        }
+    }
 }
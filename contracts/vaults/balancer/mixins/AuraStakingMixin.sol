@@ -26,6 +26,15 @@ abstract contract AuraStakingMixin is VaultBase {
     IERC20 internal immutable BAL_TOKEN;
     IERC20 internal immutable AURA_TOKEN;
 
+    /// @notice Gauge reward tokens are resolved at deployment so that claims and reinvestments
+    /// do not read them from the gauge. Rewards added to the gauge later require a new implementation.
+    uint256 internal constant MAX_EXTRA_REWARD_TOKENS = 4;
+    uint256 internal immutable NUM_REWARD_TOKENS;
+    IERC20 internal immutable EXTRA_REWARD_TOKEN_0;
+    IERC20 internal immutable EXTRA_REWARD_TOKEN_1;
+    IERC20 internal immutable EXTRA_REWARD_TOKEN_2;
+    IERC20 internal immutable EXTRA_REWARD_TOKEN_3;
+
     constructor(NotionalProxy notional_, AuraVaultDeploymentParams memory params) 
         VaultBase(notional_, params.baseParams.tradingModule, params.baseParams.settlementPeriodInSeconds) {
         LIQUIDITY_GAUGE = params.baseParams.liquidityGauge;
@@ -36,16 +45,33 @@ abstract contract AuraStakingMixin is VaultBase {
         IAuraStakingProxy stakingProxy = IAuraStakingProxy(AURA_BOOSTER.stakerRewards());
         BAL_TOKEN = IERC20(stakingProxy.crv());
         AURA_TOKEN = IERC20(stakingProxy.cvx());
+
+        ILiquidityGauge liquidityGauge = params.baseParams.liquidityGauge;
+        uint256 extraRewardCount = liquidityGauge.reward_count();
+        require(extraRewardCount <= MAX_EXTRA_REWARD_TOKENS);
+        NUM_REWARD_TOKENS = extraRewardCount + 2;
+        EXTRA_REWARD_TOKEN_0 = _extraRewardToken(liquidityGauge, 0, extraRewardCount);
+        EXTRA_REWARD_TOKEN_1 = _extraRewardToken(liquidityGauge, 1, extraRewardCount);
+        EXTRA_REWARD_TOKEN_2 = _extraRewardToken(liquidityGauge, 2, extraRewardCount);
+        EXTRA_REWARD_TOKEN_3 = _extraRewardToken(liquidityGauge, 3, extraRewardCount);
+    }
+
+    function _extraRewardToken(
+        ILiquidityGauge liquidityGauge,
+        uint256 index,
+        uint256 extraRewardCount
+    ) private view returns (IERC20) {
+        return index < extraRewardCount ? IERC20(liquidityGauge.reward_tokens(index)) : IERC20(address(0));
     }
 
     function _rewardTokens() private view returns (IERC20[] memory tokens) {
-        uint256 rewardTokenCount = LIQUIDITY_GAUGE.reward_count() + 2;
-        tokens = new IERC20[](rewardTokenCount);
+        tokens = new IERC20[](NUM_REWARD_TOKENS);
         tokens[0] = BAL_TOKEN;
         tokens[1] = AURA_TOKEN;
-        for (uint256 i = 2; i < rewardTokenCount; i++) {
-            tokens[i] = IERC20(LIQUIDITY_GAUGE.reward_tokens(i - 2));
-        }
+        if (NUM_REWARD_TOKENS > 2) tokens[2] = EXTRA_REWARD_TOKEN_0;
+        if (NUM_REWARD_TOKENS > 3) tokens[3] = EXTRA_REWARD_TOKEN_1;
+        if (NUM_REWARD_TOKENS > 4) tokens[4] = EXTRA_REWARD_TOKEN_2;
+        if (NUM_REWARD_TOKENS > 5) tokens[5] = EXTRA_REWARD_TOKEN_3;
     }
 
     function _auraStakingContext() internal view returns (AuraStakingContext memory) {
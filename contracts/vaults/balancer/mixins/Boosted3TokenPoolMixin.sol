@@ -37,6 +37,18 @@ abstract contract Boosted3TokenPoolMixin is BalancerPoolMixin {
     uint8 internal immutable SECONDARY_DECIMALS;
     uint8 internal immutable TERTIARY_DECIMALS;
 
+    /// @notice Linear pool ids, main tokens and token indexes are fixed at pool creation, they are
+    /// cached here to avoid external calls every time the strategy context is loaded
+    bytes32 internal immutable PRIMARY_LINEAR_POOL_ID;
+    bytes32 internal immutable SECONDARY_LINEAR_POOL_ID;
+    bytes32 internal immutable TERTIARY_LINEAR_POOL_ID;
+    address internal immutable PRIMARY_MAIN_TOKEN;
+    address internal immutable SECONDARY_MAIN_TOKEN;
+    address internal immutable TERTIARY_MAIN_TOKEN;
+    uint8 internal immutable PRIMARY_LINEAR_INDEXES;
+    uint8 internal immutable SECONDARY_LINEAR_INDEXES;
+    uint8 internal immutable TERTIARY_LINEAR_INDEXES;
+
     constructor(
         NotionalProxy notional_, 
         AuraVaultDeploymentParams memory params
@@ -85,37 +97,77 @@ abstract contract Boosted3TokenPoolMixin is BalancerPoolMixin {
         SECONDARY_TOKEN = IERC20(tokens[SECONDARY_INDEX]);
         TERTIARY_TOKEN = IERC20(tokens[TERTIARY_INDEX]);
 
-        uint256 primaryDecimals = IERC20(ILinearPool(address(PRIMARY_TOKEN)).getMainToken()).decimals();
+        // Scoped to avoid stack too deep errors
+        {
+            (bytes32 linearPoolId, address mainToken, uint8 linearIndexes) = _linearPoolMetadata(tokens[primaryIndex]);
+            PRIMARY_LINEAR_POOL_ID = linearPoolId;
+            PRIMARY_MAIN_TOKEN = mainToken;
+            PRIMARY_LINEAR_INDEXES = linearIndexes;
+            uint256 primaryDecimals = IERC20(mainToken).decimals();
+
+            // Do not allow decimal places greater than 18
+            require(primaryDecimals <= 18);
+            PRIMARY_DECIMALS = uint8(primaryDecimals);
+        }
 
-        // Do not allow decimal places greater than 18
-        require(primaryDecimals <= 18);
-        PRIMARY_DECIMALS = uint8(primaryDecimals);
+        {
+            (bytes32 linearPoolId, address mainToken, uint8 linearIndexes) = _linearPoolMetadata(tokens[secondaryIndex]);
+            SECONDARY_LINEAR_POOL_ID = linearPoolId;
+            SECONDARY_MAIN_TOKEN = mainToken;
+            SECONDARY_LINEAR_INDEXES = linearIndexes;
 
-        // If the SECONDARY_TOKEN is ETH, it will be rewritten as WETH
-        uint256 secondaryDecimals = IERC20(ILinearPool(address(SECONDARY_TOKEN)).getMainToken()).decimals();
+            // If the SECONDARY_TOKEN is ETH, it will be rewritten as WETH
+            uint256 secondaryDecimals = IERC20(mainToken).decimals();
 
-        // Do not allow decimal places greater than 18
-        require(secondaryDecimals <= 18);
-        SECONDARY_DECIMALS = uint8(secondaryDecimals);
-        
-        // If the TERTIARY_TOKEN is ETH, it will be rewritten as WETH
-        uint256 tertiaryDecimals = IERC20(ILinearPool(address(TERTIARY_TOKEN)).getMainToken()).decimals();
+            // Do not allow decimal places greater than 18
+            require(secondaryDecimals <= 18);
+            SECONDARY_DECIMALS = uint8(secondaryDecimals);
+        }
+
+        {
+            (bytes32 linearPoolId, address mainToken, uint8 linearIndexes) = _linearPoolMetadata(tokens[tertiaryIndex]);
+            TERTIARY_LINEAR_POOL_ID = linearPoolId;
+            TERTIARY_MAIN_TOKEN = mainToken;
+            TERTIARY_LINEAR_INDEXES = linearIndexes;
 
-        // Do not allow decimal places greater than 18
-        require(tertiaryDecimals <= 18);
-        TERTIARY_DECIMALS = uint8(tertiaryDecimals);
+            // If the TERTIARY_TOKEN is ETH, it will be rewritten as WETH
+            uint256 tertiaryDecimals = IERC20(mainToken).decimals();
+
+            // Do not allow decimal places greater than 18
+            require(tertiaryDecimals <= 18);
+            TERTIARY_DECIMALS = uint8(tertiaryDecimals);
+        }
     }
 
-    function _underlyingPoolContext(ILinearPool underlyingPool) private view returns (UnderlyingPoolContext memory) {
-        (uint256 lowerTarget, uint256 upperTarget) = underlyingPool.getTargets();
+    /// @notice Main and wrapped indexes are packed into a single byte, 4 bits each
+    function _linearPoolMetadata(address linearPool)
+        private view returns (bytes32 poolId, address mainToken, uint8 linearIndexes) {
+        ILinearPool underlyingPool = ILinearPool(linearPool);
         uint256 mainIndex = underlyingPool.getMainIndex();
         uint256 wrappedIndex = underlyingPool.getWrappedIndex();
+        // Linear pools contain 3 tokens (main, wrapped and the linear pool BPT)
+        require(mainIndex < 3 && wrappedIndex < 3);
+
+        poolId = underlyingPool.getPoolId();
+        mainToken = underlyingPool.getMainToken();
+        linearIndexes = uint8(mainIndex << 4 | wrappedIndex);
+    }
+
+    function _underlyingPoolContext(
+        ILinearPool underlyingPool,
+        bytes32 poolId,
+        address mainToken,
+        uint8 linearIndexes
+    ) private view returns (UnderlyingPoolContext memory) {
+        (uint256 lowerTarget, uint256 upperTarget) = underlyingPool.getTargets();
+        uint256 mainIndex = linearIndexes >> 4;
+        uint256 wrappedIndex = linearIndexes & 0x0f;
 
         (
             /* address[] memory tokens */,
             uint256[] memory underlyingBalances,
             /* uint256 lastChangeBlock */
-        ) = Deployments.BALANCER_VAULT.getPoolTokens(underlyingPool.getPoolId());
+        ) = Deployments.BALANCER_VAULT.getPoolTokens(poolId);
 
         uint256[] memory underlyingScalingFactors = underlyingPool.getScalingFactors();
 
@@ -127,7 +179,9 @@ abstract contract Boosted3TokenPoolMixin is BalancerPoolMixin {
             virtualSupply: underlyingPool.getVirtualSupply(),
             fee: underlyingPool.getSwapFeePercentage(),
             lowerTarget: lowerTarget,
-            upperTarget: upperTarget    
+            upperTarget: upperTarget,
+            poolId: poolId,
+            mainToken: mainToken
         });
     }
 
@@ -150,9 +204,15 @@ abstract contract Boosted3TokenPoolMixin is BalancerPoolMixin {
             underlyingPools: new UnderlyingPoolContext[](3)
         });
 
-        boostedPoolContext.underlyingPools[0] = _underlyingPoolContext(ILinearPool(address(PRIMARY_TOKEN)));
-        boostedPoolContext.underlyingPools[1] = _underlyingPoolContext(ILinearPool(address(SECONDARY_TOKEN)));
-        boostedPoolContext.underlyingPools[2] = _underlyingPoolContext(ILinearPool(address(TERTIARY_TOKEN)));
+        boostedPoolContext.underlyingPools[0] = _underlyingPoolContext(
+            ILinearPool(address(PRIMARY_TOKEN)), PRIMARY_LINEAR_POOL_ID, PRIMARY_MAIN_TOKEN, PRIMARY_LINEAR_INDEXES
+        );
+        boostedPoolContext.underlyingPools[1] = _underlyingPoolContext(
+            ILinearPool(address(SECONDARY_TOKEN)), SECONDARY_LINEAR_POOL_ID, SECONDARY_MAIN_TOKEN, SECONDARY_LINEAR_INDEXES
+        );
+        boostedPoolContext.underlyingPools[2] = _underlyingPoolContext(
+            ILinearPool(address(TERTIARY_TOKEN)), TERTIARY_LINEAR_POOL_ID, TERTIARY_MAIN_TOKEN, TERTIARY_LINEAR_INDEXES
+        );
     }
 
     function _threeTokenPoolContext(uint256[] memory balances, uint256[] memory scalingFactors) 
@@ -6,6 +6,7 @@ import {IERC20} from "../../../interfaces/IERC20.sol";
 
 library VaultEvents {
     event RewardReinvested(address token, uint256 primaryAmount, uint256 secondaryAmount, uint256 poolClaimAmount);
+    event RewardsReinvested(address[] tokens, uint256 primaryAmount, uint256 secondaryAmount, uint256 poolClaimAmount);
     event StrategyVaultSettingsUpdated(StrategyVaultSettings settings);
     event VaultSettlement(
         uint256 maturity,
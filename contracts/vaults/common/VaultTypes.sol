@@ -29,6 +29,12 @@ struct RedeemParams {
     bytes secondaryTradeParams;
 }
 
+/// @notice Strategy tokens to redeem for a single maturity during batch settlement
+struct MaturitySettlement {
+    uint256 maturity;
+    uint256 strategyTokensToRedeem;
+}
+
 struct ReinvestRewardParams {
     bytes tradeData;
     uint256 minPoolClaim;
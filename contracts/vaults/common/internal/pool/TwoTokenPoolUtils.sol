@@ -45,17 +45,18 @@ library TwoTokenPoolUtils {
 
     /// @notice calculates the expected primary and secondary amounts based on
     /// the given spot price and oracle price
+    /// @param totalPoolSupply pool token supply at the time the pool balances were read
     function _getMinExitAmounts(
         TwoTokenPoolContext calldata poolContext,
         StrategyContext calldata strategyContext,
         uint256 spotPrice,
         uint256 oraclePrice,
-        uint256 poolClaim
+        uint256 poolClaim,
+        uint256 totalPoolSupply
     ) internal view returns (uint256 minPrimary, uint256 minSecondary) {
         strategyContext._checkPriceLimit(oraclePrice, spotPrice);
 
         // min amounts are calculated based on the share of the Balancer pool with a small discount applied
-        uint256 totalPoolSupply = poolContext.poolToken.totalSupply();
         minPrimary = (poolContext.primaryBalance * poolClaim * 
             strategyContext.vaultSettings.poolSlippageLimitPercent) / 
             (totalPoolSupply * uint256(VaultConstants.VAULT_PERCENT_BASIS));
@@ -64,20 +65,21 @@ library TwoTokenPoolUtils {
             (totalPoolSupply * uint256(VaultConstants.VAULT_PERCENT_BASIS));
     }
 
+    /// @param totalPoolSupply pool token supply at the time the pool balances were read
     function _getTimeWeightedPrimaryBalance(
         TwoTokenPoolContext memory poolContext,
         StrategyContext memory strategyContext,
         uint256 poolClaim,
         uint256 oraclePrice,
-        uint256 spotPrice
+        uint256 spotPrice,
+        uint256 totalPoolSupply
     ) internal view returns (uint256 primaryAmount) {
         // Make sure spot price is within oracleDeviationLimit of pairPrice
         strategyContext._checkPriceLimit(oraclePrice, spotPrice);
         
         // Get shares of primary and secondary balances with the provided poolClaim
-        uint256 totalSupply = poolContext.poolToken.totalSupply();
-        uint256 primaryBalance = poolContext.primaryBalance * poolClaim / totalSupply;
-        uint256 secondaryBalance = poolContext.secondaryBalance * poolClaim / totalSupply;
+        uint256 primaryBalance = poolContext.primaryBalance * poolClaim / totalPoolSupply;
+        uint256 secondaryBalance = poolContext.secondaryBalance * poolClaim / totalPoolSupply;
 
         // Value the secondary balance in terms of the primary token using the oraclePairPrice
         uint256 secondaryAmountInPrimary = secondaryBalance * strategyContext.poolClaimPrecision / oraclePrice;
@@ -154,37 +156,94 @@ library TwoTokenPoolUtils {
         ITradingModule tradingModule,
         bytes calldata data
     ) internal returns (address rewardToken, uint256 primaryAmount, uint256 secondaryAmount) {
-        Proportional2TokenRewardTradeParams memory params = abi.decode(
+        Proportional2TokenRewardTradeParams[] memory params = new Proportional2TokenRewardTradeParams[](1);
+        params[0] = abi.decode(data, (Proportional2TokenRewardTradeParams));
+
+        (primaryAmount, secondaryAmount) = _executeProportionalRewardTrades(
+            poolContext, rewardTokens, params, tradingModule
+        );
+
+        rewardToken = params[0].primaryTrade.sellToken;
+    }
+
+    /// @notice Sells multiple reward tokens proportionally into the primary and secondary tokens
+    /// so that they can be reinvested with a single pool join
+    /// @param data abi encoded Proportional2TokenRewardTradeParams[], one entry per reward token
+    function _executeRewardTradesBatch(
+        TwoTokenPoolContext calldata poolContext,
+        IERC20[] memory rewardTokens,
+        ITradingModule tradingModule,
+        bytes calldata data
+    ) internal returns (address[] memory rewardTokensSold, uint256 primaryAmount, uint256 secondaryAmount) {
+        Proportional2TokenRewardTradeParams[] memory params = abi.decode(
             data,
-            (Proportional2TokenRewardTradeParams)
+            (Proportional2TokenRewardTradeParams[])
         );
 
-        _validateTrades(
-            rewardTokens,
-            params.primaryTrade,
-            params.secondaryTrade,
-            poolContext.primaryToken,
-            poolContext.secondaryToken
+        (primaryAmount, secondaryAmount) = _executeProportionalRewardTrades(
+            poolContext, rewardTokens, params, tradingModule
         );
 
-        (/*uint256 amountSold*/, primaryAmount) = StrategyUtils._executeTradeExactIn({
-            params: params.primaryTrade.tradeParams,
-            tradingModule: tradingModule,
-            sellToken: params.primaryTrade.sellToken,
-            buyToken: params.primaryTrade.buyToken,
-            amount: params.primaryTrade.amount,
-            useDynamicSlippage: false
-        });
+        rewardTokensSold = new address[](params.length);
+        for (uint256 i; i < params.length; i++) {
+            rewardTokensSold[i] = params[i].primaryTrade.sellToken;
+        }
+    }
+
+    /// @notice Validates and executes all reward trades in a single trading module call so that
+    /// permission checks and oracle reads are shared
+    function _executeProportionalRewardTrades(
+        TwoTokenPoolContext calldata poolContext,
+        IERC20[] memory rewardTokens,
+        Proportional2TokenRewardTradeParams[] memory params,
+        ITradingModule tradingModule
+    ) private returns (uint256 primaryAmount, uint256 secondaryAmount) {
+        uint256 numTrades = params.length * 2;
+        TradeParams[] memory tradeParams = new TradeParams[](numTrades);
+        address[] memory sellTokens = new address[](numTrades);
+        address[] memory buyTokens = new address[](numTrades);
+        uint256[] memory amounts = new uint256[](numTrades);
+
+        for (uint256 i; i < params.length; i++) {
+            _validateTrades(
+                rewardTokens,
+                params[i].primaryTrade,
+                params[i].secondaryTrade,
+                poolContext.primaryToken,
+                poolContext.secondaryToken
+            );
+
+            // Primary trades are at even indexes, secondary trades at odd indexes
+            _setTrade(params[i].primaryTrade, i * 2, tradeParams, sellTokens, buyTokens, amounts);
+            _setTrade(params[i].secondaryTrade, i * 2 + 1, tradeParams, sellTokens, buyTokens, amounts);
+        }
 
-        (/*uint256 amountSold*/, secondaryAmount) = StrategyUtils._executeTradeExactIn({
-            params: params.secondaryTrade.tradeParams,
+        (/*uint256[] amountsSold*/, uint256[] memory amountsBought) = StrategyUtils._executeTradesExactIn({
+            params: tradeParams,
             tradingModule: tradingModule,
-            sellToken: params.secondaryTrade.sellToken,
-            buyToken: params.secondaryTrade.buyToken,
-            amount: params.secondaryTrade.amount,
+            sellTokens: sellTokens,
+            buyTokens: buyTokens,
+            amounts: amounts,
             useDynamicSlippage: false
         });
 
-        rewardToken = params.primaryTrade.sellToken;
+        for (uint256 i; i < numTrades; i += 2) {
+            primaryAmount += amountsBought[i];
+            secondaryAmount += amountsBought[i + 1];
+        }
+    }
+
+    function _setTrade(
+        SingleSidedRewardTradeParams memory trade,
+        uint256 index,
+        TradeParams[] memory tradeParams,
+        address[] memory sellTokens,
+        address[] memory buyTokens,
+        uint256[] memory amounts
+    ) private pure {
+        tradeParams[index] = trade.tradeParams;
+        sellTokens[index] = trade.sellToken;
+        buyTokens[index] = trade.buyToken;
+        amounts[index] = trade.amount;
     }
 }
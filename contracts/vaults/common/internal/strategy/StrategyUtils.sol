@@ -8,7 +8,7 @@ import {TokenUtils, IERC20} from "../../../../utils/TokenUtils.sol";
 import {TradeHandler} from "../../../../trading/TradeHandler.sol";
 import {Deployments} from "../../../../global/Deployments.sol";
 import {Constants} from "../../../../global/Constants.sol";
-import {ITradingModule, Trade, TradeType} from "../../../../../interfaces/trading/ITradingModule.sol";
+import {ITradingModule, Trade, TradeType, BatchTrade} from "../../../../../interfaces/trading/ITradingModule.sol";
 import {TypeConvert} from "../../../../global/TypeConvert.sol";
 import {VaultStorage} from "../../VaultStorage.sol";
 
@@ -67,6 +67,61 @@ library StrategyUtils {
         uint256 amount,
         bool useDynamicSlippage
     ) internal returns (uint256 amountSold, uint256 amountBought) {
+        Trade memory trade = _getTradeExactIn(params, sellToken, buyToken, amount, useDynamicSlippage);
+
+        if (useDynamicSlippage) {
+            /// @dev params.oracleSlippagePercentOrLimit checked in _getTradeExactIn
+            (amountSold, amountBought) = trade._executeTradeWithDynamicSlippage(
+                params.dexId, tradingModule, uint32(params.oracleSlippagePercentOrLimit)
+            );
+        } else {
+            (amountSold, amountBought) = trade._executeTrade(
+                params.dexId, tradingModule
+            );
+        }
+
+        (amountSold, amountBought) = _settleTradeExactIn(
+            params, trade, sellToken, buyToken, amount, amountSold, amountBought
+        );
+    }
+
+    /// @notice Executes multiple exact in trades with a single call to the trading module, permissions
+    /// and oracle prices are shared across the trades
+    function _executeTradesExactIn(
+        TradeParams[] memory params,
+        ITradingModule tradingModule,
+        address[] memory sellTokens,
+        address[] memory buyTokens,
+        uint256[] memory amounts,
+        bool useDynamicSlippage
+    ) internal returns (uint256[] memory amountsSold, uint256[] memory amountsBought) {
+        BatchTrade[] memory trades = new BatchTrade[](params.length);
+        for (uint256 i; i < params.length; i++) {
+            trades[i] = BatchTrade({
+                dexId: params[i].dexId,
+                trade: _getTradeExactIn(params[i], sellTokens[i], buyTokens[i], amounts[i], useDynamicSlippage),
+                useDynamicSlippage: useDynamicSlippage,
+                /// @dev params.oracleSlippagePercentOrLimit checked in _getTradeExactIn
+                dynamicSlippageLimit: useDynamicSlippage ? uint32(params[i].oracleSlippagePercentOrLimit) : 0
+            });
+        }
+
+        (amountsSold, amountsBought) = TradeHandler._executeTradeBatch(trades, tradingModule);
+
+        for (uint256 i; i < params.length; i++) {
+            (amountsSold[i], amountsBought[i]) = _settleTradeExactIn(
+                params[i], trades[i].trade, sellTokens[i], buyTokens[i], amounts[i], amountsSold[i], amountsBought[i]
+            );
+        }
+    }
+
+    function _getTradeExactIn(
+        TradeParams memory params,
+        address sellToken,
+        address buyToken,
+        uint256 amount,
+        bool useDynamicSlippage
+    ) private returns (Trade memory trade) {
         require(
             params.tradeType == TradeType.EXACT_IN_SINGLE || params.tradeType == TradeType.EXACT_IN_BATCH
         );
@@ -75,7 +130,7 @@ library StrategyUtils {
         }
 
         // Sell residual secondary balance
-        Trade memory trade = Trade(
+        trade = Trade(
             params.tradeType,
             sellToken,
             buyToken,
@@ -99,18 +154,17 @@ library StrategyUtils {
                 trade.buyToken = Deployments.WRAPPED_STETH.stETH();
             }
         }
+    }
 
-        if (useDynamicSlippage) {
-            /// @dev params.oracleSlippagePercentOrLimit checked above
-            (amountSold, amountBought) = trade._executeTradeWithDynamicSlippage(
-                params.dexId, tradingModule, uint32(params.oracleSlippagePercentOrLimit)
-            );
-        } else {
-            (amountSold, amountBought) = trade._executeTrade(
-                params.dexId, tradingModule
-            );
-        }
-
+    function _settleTradeExactIn(
+        TradeParams memory params,
+        Trade memory trade,
+        address sellToken,
+        address buyToken,
+        uint256 amount,
+        uint256 amountSold,
+        uint256 amountBought
+    ) private returns (uint256, uint256) {
         if (params.tradeUnwrapped) {
             if (sellToken == address(Deployments.WRAPPED_STETH)) {
                 // Setting amountSold to the original wstETH amount because _executeTradeWithDynamicSlippage
@@ -127,6 +181,8 @@ library StrategyUtils {
                 amountBought = Deployments.WRAPPED_STETH.balanceOf(address(this)) - amountBeforeWrap;
             }
         }
+
+        return (amountSold, amountBought);
     }
 
     function _mintStrategyTokens(
@@ -107,6 +107,13 @@ interface IBalancerVault {
         uint256 deadline
     ) external payable returns (int256[] memory);
 
+    function queryBatchSwap(
+        SwapKind kind,
+        BatchSwapStep[] memory swaps,
+        IAsset[] memory assets,
+        FundManagement memory funds
+    ) external returns (int256[] memory assetDeltas);
+
     function getPoolTokens(bytes32 poolId)
         external
         view
@@ -31,6 +31,15 @@ struct Trade {
     bytes exchangeData;
 }
 
+/// @notice A trade executed as part of a batch, the trade limit is calculated from the oracle
+/// price when useDynamicSlippage is set
+struct BatchTrade {
+    uint16 dexId;
+    Trade trade;
+    bool useDynamicSlippage;
+    uint32 dynamicSlippageLimit;
+}
+
 error InvalidTrade();
 
 interface ITradingModule {
@@ -72,6 +81,9 @@ interface ITradingModule {
     function getOraclePrice(address inToken, address outToken)
         external view returns (int256 answer, int256 decimals);
 
+    function getOraclePrices(address[] calldata inTokens, address outToken)
+        external view returns (int256[] memory answers, int256 decimals);
+
     function executeTrade(
         uint16 dexId,
         Trade calldata trade
@@ -83,6 +95,15 @@ interface ITradingModule {
         uint32 dynamicSlippageLimit
     ) external returns (uint256 amountSold, uint256 amountBought);
 
+    function executeTradeBatch(
+        BatchTrade[] calldata trades
+    ) external returns (uint256[] memory amountsSold, uint256[] memory amountsBought);
+
+    function getBatchLimitAmounts(
+        address from,
+        BatchTrade[] calldata trades
+    ) external view returns (uint256[] memory limitAmounts);
+
     function getLimitAmount(
         TradeType tradeType,
         address sellToken,
@@ -1,20 +1,17 @@
 import eth_abi
 from brownie import (
     network, 
-    nProxy,
-    nMockProxy,
     MetaStable2TokenAuraVault,
     Boosted3TokenAuraVault,
     Boosted3TokenAuraHelper,
     MetaStable2TokenAuraHelper,
-    FlashLiquidator,
-    nMockProxy
+    FlashLiquidator
 )
 from brownie.network.contract import Contract
 from brownie.convert.datatypes import Wei
 from brownie.network.state import Chain
 from brownie.convert import to_bytes
-from scripts.common import deployArtifact, get_vault_config, set_flags
+from scripts.common import deployArtifact, deployLibrary, get_vault_config, set_flags
 from scripts.EnvironmentConfig import Environment
 from eth_utils import keccak
 
@@ -141,10 +138,10 @@ class BalancerEnvironment(Environment):
     def deployBalancerVault(self, strat, vaultContract, libs=None):
         stratConfig = StrategyConfig["balancer2TokenStrats"][strat]
 
-        # Deploy external libs
+        # Deploy external libs, reusing any deployment that exists in the current chain state
         if libs != None:
             for lib in libs:
-                lib.deploy({"from": self.deployer})
+                deployLibrary(lib, self.deployer)
 
         return vaultContract.deploy(
             self.addresses["notional"],
@@ -162,31 +159,29 @@ class BalancerEnvironment(Environment):
             {"from": self.deployer}
         )
 
-    def deployVaultProxy(self, strat, impl, vaultContract, mockImpl=None):
+    def getVaultInitParams(self, strat):
         stratConfig = StrategyConfig["balancer2TokenStrats"][strat]
+        return [
+            stratConfig["name"],
+            stratConfig["primaryCurrency"],
+            [
+                stratConfig["maxUnderlyingSurplus"],
+                stratConfig["settlementSlippageLimitPercent"], 
+                stratConfig["postMaturitySettlementSlippageLimitPercent"], 
+                stratConfig["emergencySettlementSlippageLimitPercent"], 
+                stratConfig["maxPoolShare"],
+                stratConfig["settlementCoolDownInMinutes"],
+                stratConfig["oraclePriceDeviationLimitPercent"],
+                stratConfig["poolSlippageLimitPercent"]
+            ]
+        ]
+
+    def deployVaultProxy(self, strat, impl, vaultContract, mockImpl=None, useBeacon=False):
+        stratConfig = StrategyConfig["balancer2TokenStrats"][strat]
+        initParams = self.getVaultInitParams(strat)
 
-        if mockImpl == None:
-            proxy = nProxy.deploy(impl.address, bytes(0), {"from": self.deployer})
-        else:
-            proxy = nMockProxy.deploy(impl.address, bytes(0), mockImpl, {"from": self.deployer})
+        proxy = self.deployVaultProxyContract(impl, initParams, mockImpl, useBeacon)
         vaultProxy = Contract.from_abi(stratConfig["name"], proxy.address, vaultContract.abi)
-        vaultProxy.initialize(
-            [
-                stratConfig["name"],
-                stratConfig["primaryCurrency"],
-                [
-                    stratConfig["maxUnderlyingSurplus"],
-                    stratConfig["settlementSlippageLimitPercent"], 
-                    stratConfig["postMaturitySettlementSlippageLimitPercent"], 
-                    stratConfig["emergencySettlementSlippageLimitPercent"], 
-                    stratConfig["maxPoolShare"],
-                    stratConfig["settlementCoolDownInMinutes"],
-                    stratConfig["oraclePriceDeviationLimitPercent"],
-                    stratConfig["poolSlippageLimitPercent"]
-                ]
-            ],
-            {"from": self.notional.owner()}
-        )
 
         self.notional.updateVault(
             proxy.address,
@@ -2,11 +2,9 @@ from brownie import (
     network, 
     Contract,
     Wei,
-    Curve2TokenConvexVault,
-    nProxy,
-    nMockProxy
+    Curve2TokenConvexVault
 )
-from scripts.common import get_vault_config, set_flags
+from scripts.common import deployLibrary, get_vault_config, set_flags
 from scripts.EnvironmentConfig import Environment
 
 StrategyConfig = {
@@ -46,10 +44,10 @@ class CurveEnvironment(Environment):
     def deployVault(self, strat, vaultContract, libs=None):
         stratConfig = StrategyConfig[strat]
 
-        # Deploy external libs
+        # Deploy external libs, reusing any deployment that exists in the current chain state
         if libs != None:
             for lib in libs:
-                lib.deploy({"from": self.deployer})
+                deployLibrary(lib, self.deployer)
 
         return vaultContract.deploy(
             self.addresses["notional"],
@@ -65,32 +63,30 @@ class CurveEnvironment(Environment):
             {"from": self.deployer}
         )
 
-    def deployVaultProxy(self, strat, impl, vaultContract, mockImpl=None):
+    def getVaultInitParams(self, strat):
         stratConfig = StrategyConfig[strat]
+        return [
+            stratConfig["name"],
+            stratConfig["primaryCurrency"],
+            [
+                stratConfig["maxUnderlyingSurplus"],
+                stratConfig["settlementSlippageLimitPercent"], 
+                stratConfig["postMaturitySettlementSlippageLimitPercent"], 
+                stratConfig["emergencySettlementSlippageLimitPercent"], 
+                stratConfig["maxRewardTradeSlippageLimitPercent"], 
+                stratConfig["maxPoolShare"],
+                stratConfig["settlementCoolDownInMinutes"],
+                stratConfig["oraclePriceDeviationLimitPercent"],
+                stratConfig["poolSlippageLimitPercent"]
+            ]
+        ]
+
+    def deployVaultProxy(self, strat, impl, vaultContract, mockImpl=None, useBeacon=False):
+        stratConfig = StrategyConfig[strat]
+        initParams = self.getVaultInitParams(strat)
 
-        if mockImpl == None:
-            proxy = nProxy.deploy(impl.address, bytes(0), {"from": self.deployer})
-        else:
-            proxy = nMockProxy.deploy(impl.address, bytes(0), mockImpl, {"from": self.deployer})
+        proxy = self.deployVaultProxyContract(impl, initParams, mockImpl, useBeacon)
         vaultProxy = Contract.from_abi(stratConfig["name"], proxy.address, vaultContract.abi)
-        vaultProxy.initialize(
-            [
-                stratConfig["name"],
-                stratConfig["primaryCurrency"],
-                [
-                    stratConfig["maxUnderlyingSurplus"],
-                    stratConfig["settlementSlippageLimitPercent"], 
-                    stratConfig["postMaturitySettlementSlippageLimitPercent"], 
-                    stratConfig["emergencySettlementSlippageLimitPercent"], 
-                    stratConfig["maxRewardTradeSlippageLimitPercent"], 
-                    stratConfig["maxPoolShare"],
-                    stratConfig["settlementCoolDownInMinutes"],
-                    stratConfig["oraclePriceDeviationLimitPercent"],
-                    stratConfig["poolSlippageLimitPercent"]
-                ]
-            ],
-            {"from": self.notional.owner()}
-        )
 
         self.notional.updateVault(
             proxy.address,
@@ -5,6 +5,10 @@ from brownie import (
     interface,
     TradingModule,
     nProxy,
+    nMockProxy,
+    nBeaconProxy,
+    nMockBeaconProxy,
+    nUpgradeableBeacon,
     EmptyProxy,
     WstETHChainlinkOracle,
     BalancerPoolChainlinkAdapter,
@@ -12,7 +16,7 @@ from brownie import (
 )
 from brownie.network.contract import Contract
 from brownie.network.state import Chain
-from scripts.common import deployArtifact
+from scripts.common import deployArtifacts
 
 chain = Chain()
 
@@ -70,53 +74,68 @@ class Environment:
 
         self.owner = accounts.at(self.notional.owner(), force=True)
         self.balancerVault = interface.IBalancerVault(addresses["balancer"]["vault"])
+        # Vault implementation address to the beacon shared by all vault proxies using it
+        self.vaultBeacons = {}
 
         self.deployTradingModule()
 
+    def deployVaultBeacon(self, impl):
+        # Upgrading the beacon upgrades every vault that uses it. The vaults' own UUPS upgradeTo
+        # reverts behind a beacon proxy since the ERC1967 implementation slot is empty, so the beacon
+        # is the only upgrade path and is owned by the Notional owner like the vault upgrades.
+        if impl.address not in self.vaultBeacons:
+            beacon = nUpgradeableBeacon.deploy(impl.address, {"from": self.deployer})
+            beacon.transferOwnership(self.notional.owner(), {"from": self.deployer})
+            self.vaultBeacons[impl.address] = beacon
+        return self.vaultBeacons[impl.address]
+
+    def deployVaultProxyContract(self, impl, initParams, mockImpl=None, useBeacon=False):
+        """
+        Deploys and initializes a proxy for the vault implementation, returns the proxy
+        """
+        if useBeacon:
+            # Vaults sharing an implementation are deployed as beacon proxies and initialized in the
+            # same transaction, initialize is restricted to the Notional owner so it deploys the proxy
+            beacon = self.deployVaultBeacon(impl)
+            initData = impl.initialize.encode_input(initParams)
+            if mockImpl == None:
+                return nBeaconProxy.deploy(beacon.address, initData, {"from": self.notional.owner()})
+            return nMockBeaconProxy.deploy(beacon.address, initData, mockImpl, {"from": self.notional.owner()})
+
+        if mockImpl == None:
+            proxy = nProxy.deploy(impl.address, bytes(0), {"from": self.deployer})
+        else:
+            proxy = nMockProxy.deploy(impl.address, bytes(0), mockImpl, {"from": self.deployer})
+        Contract.from_abi("Vault", proxy.address, impl.abi).initialize(initParams, {"from": self.notional.owner()})
+        return proxy
+
     def upgradeNotional(self):
-        tradingAction = deployArtifact(
-            "scripts/artifacts/TradingAction.json",
-            [],
-            self.deployer,
-            "VaultAccountAction",
-            {"SettleAssetsExternal": "0x01713633a1b85a4a3d2f9430C68Bd4392c4a90eA"}
-        )
-        vaultAccountAction = deployArtifact(
-            "scripts/artifacts/VaultAccountAction.json",
-            [],
-            self.deployer,
-            "VaultAccountAction",
-            {"TradingAction": tradingAction.address}
-        )
-        vaultAction = deployArtifact(
-            "scripts/artifacts/VaultAction.json",
-            [],
-            self.deployer,
-            "VaultAction",
-            {"TradingAction": tradingAction.address}
-        )
-        newRouter = deployArtifact(
-            "scripts/artifacts/Router.json",
-            [[
-                "0x38A4DfC0ff6588fD0c2142d14D4963A97356A245",
-                "0xBf91ec7A64FCF0844e54d3198E50AD8fb4D68E93",
-                "0xe3E38607A1E2d6881A32F1D78C5C232f14bdef22",
-                "0xeA82Cfc621D5FA00E30c10531380846BB5aAfE79",
-                "0x1d1a531CBcb969040Da7527bf1092DfC4FF7DD46",
-                "0x8A096f6C6D89dBd3c3Df3EEBA45710Aa367F9A8c",
-                "0xBf12d7e41a25f449293AB8cd1364Fe74A175bFa5",
-                "0xa3707CD595F6AB810a84d04C92D8adE5f7593Db5",
-                "0xfB56271c976A8b446B6D33D1Ec76C84F6AA53F1B",
-                "0x4Ddc2D193948926D02f9B1fE9e1daa0718270ED5",
-                "0x5fd75e91Cc34DF9831Aa75903027FC34FeB9b931",
-                "0xbE4AbA25915BAd390edf83B7e1ca44b6145F261e",
-                vaultAccountAction.address,
-                vaultAction.address
-            ]],
-            self.deployer,
-            "Router"
-        )
-        self.notional.upgradeTo(newRouter.address, {'from': self.notional.owner()})
+        deployed = deployArtifacts({
+            "TradingAction": {"path": "scripts/artifacts/TradingAction.json"},
+            "VaultAccountAction": {"path": "scripts/artifacts/VaultAccountAction.json"},
+            "VaultAction": {"path": "scripts/artifacts/VaultAction.json"},
+            "Router": {
+                "path": "scripts/artifacts/Router.json",
+                "args": lambda a: [[
+                    "0x38A4DfC0ff6588fD0c2142d14D4963A97356A245",
+                    "0xBf91ec7A64FCF0844e54d3198E50AD8fb4D68E93",
+                    "0xe3E38607A1E2d6881A32F1D78C5C232f14bdef22",
+                    "0xeA82Cfc621D5FA00E30c10531380846BB5aAfE79",
+                    "0x1d1a531CBcb969040Da7527bf1092DfC4FF7DD46",
+                    "0x8A096f6C6D89dBd3c3Df3EEBA45710Aa367F9A8c",
+                    "0xBf12d7e41a25f449293AB8cd1364Fe74A175bFa5",
+                    "0xa3707CD595F6AB810a84d04C92D8adE5f7593Db5",
+                    "0xfB56271c976A8b446B6D33D1Ec76C84F6AA53F1B",
+                    "0x4Ddc2D193948926D02f9B1fE9e1daa0718270ED5",
+                    "0x5fd75e91Cc34DF9831Aa75903027FC34FeB9b931",
+                    "0xbE4AbA25915BAd390edf83B7e1ca44b6145F261e",
+                    a["VaultAccountAction"],
+                    a["VaultAction"]
+                ]],
+                "dependsOn": ["VaultAccountAction", "VaultAction"]
+            }
+        }, self.deployer, {"SettleAssetsExternal": "0x01713633a1b85a4a3d2f9430C68Bd4392c4a90eA"})
+        self.notional.upgradeTo(deployed["Router"].address, {'from': self.notional.owner()})
 
     def deployTradingModule(self, useFresh=False):
         if useFresh == False:
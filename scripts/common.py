@@ -1,12 +1,19 @@
 import json
 import re
+from functools import lru_cache
 import eth_abi
 import requests
-from brownie import network, Contract, Wei
+from brownie import network, interface, Contract, Wei
+from brownie.convert import to_bytes
+from brownie.exceptions import VirtualMachineError
 from brownie.network.state import Chain
+from eth_utils import keccak
 
 chain = Chain()
 
+ETH_ADDRESS = "0x0000000000000000000000000000000000000000"
+WETH_ADDRESS = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
+
 DEX_ID = {
     'UNUSED': 0,
     'UNISWAP_V2': 1,
@@ -31,18 +38,26 @@ def getDependencies(bytecode):
     result = list(deps)
     return result
 
-def deployArtifact(path, constructorArgs, deployer, name, libs=None):
+@lru_cache(maxsize=None)
+def loadArtifact(path):
+    """
+    Returns the parsed artifact and its library link markers, each artifact is only read once
+    """
     with open(path, "r") as a:
         artifact = json.load(a)
+    return (artifact, tuple(getDependencies(artifact["bytecode"])))
 
-    code = artifact["bytecode"]
-
-    # Resolve dependencies
-    deps = getDependencies(code)
-
+def linkBytecode(code, deps, libs):
     for dep in deps:
         library = dep.strip("_")
         code = code.replace(dep, libs[library][-40:])
+    return code
+
+def deployArtifact(path, constructorArgs, deployer, name, libs=None):
+    (artifact, deps) = loadArtifact(path)
+
+    # Resolve dependencies
+    code = linkBytecode(artifact["bytecode"], deps, libs)
 
     createdContract = network.web3.eth.contract(abi=artifact["abi"], bytecode=code)
     txn = createdContract.constructor(*constructorArgs).buildTransaction(
@@ -53,6 +68,102 @@ def deployArtifact(path, constructorArgs, deployer, name, libs=None):
 
     return Contract.from_abi(name, tx_receipt.contract_address, abi=artifact["abi"], owner=deployer)
 
+def getDeploymentLevels(artifacts, libs=None):
+    """
+    Groups the artifact names into levels where every artifact only depends on libs or on artifacts
+    in earlier levels. Dependencies are the link markers in the bytecode and the optional dependsOn
+    list, which is needed when the constructor arguments reference another artifact.
+    """
+    libs = libs or {}
+    deps = {}
+    for (name, spec) in artifacts.items():
+        (_, markers) = loadArtifact(spec["path"])
+        deps[name] = set(m.strip("_") for m in markers) | set(spec.get("dependsOn", []))
+        for dep in deps[name]:
+            if dep not in artifacts and dep not in libs:
+                raise ValueError("{} depends on {} which is not deployed".format(name, dep))
+
+    levels = []
+    resolved = set()
+    while len(resolved) < len(artifacts):
+        level = [
+            name for name in artifacts
+            if name not in resolved and all(d in resolved or d not in artifacts for d in deps[name])
+        ]
+        if len(level) == 0:
+            raise ValueError("Circular dependency between {}".format(sorted(set(artifacts) - resolved)))
+        levels.append(level)
+        resolved.update(level)
+    return levels
+
+# Artifact deployments keyed by the keccak hash of the linked deployment data
+artifactRegistry = {}
+
+def deployArtifacts(artifacts, deployer, libs=None, registry=artifactRegistry):
+    """
+    Deploys a batch of artifacts and returns a dict of name to Contract. artifacts is a dict of name to
+    {"path": ..., "args": [...], "dependsOn": [...]}, args may be a function of the deployed addresses.
+    Every level of the dependency graph is broadcast at once with explicit nonces and confirmed before
+    the next level is linked. Deployments with the same linked bytecode and constructor arguments as a
+    recorded address are skipped if the code still exists.
+    """
+    addresses = dict(libs or {})
+    for level in getDeploymentLevels(artifacts, libs):
+        pending = []
+        nonce = deployer.nonce
+        for name in level:
+            (artifact, deps) = loadArtifact(artifacts[name]["path"])
+            args = artifacts[name].get("args", [])
+            if callable(args):
+                args = args(addresses)
+            createdContract = network.web3.eth.contract(
+                abi=artifact["abi"], bytecode=linkBytecode(artifact["bytecode"], deps, addresses)
+            )
+            data = createdContract.constructor(*args).buildTransaction(
+                {"from": deployer.address, "nonce": nonce}
+            )["data"]
+
+            key = keccak(hexstr=data)
+            address = registry.get(key)
+            # Same as deployLibrary, chain reverts can remove a recorded deployment
+            if address != None and len(network.web3.eth.get_code(address)) > 0:
+                addresses[name] = address
+                continue
+
+            pending.append((name, key, deployer.transfer(data=data, nonce=nonce, required_confs=0)))
+            nonce += 1
+
+        for (name, key, tx) in pending:
+            tx.wait(1)
+            if tx.status == 0:
+                raise ValueError("Deployment of {} reverted".format(name))
+            registry[key] = tx.contract_address
+            addresses[name] = tx.contract_address
+
+    return {
+        name: Contract.from_abi(name, addresses[name], abi=loadArtifact(spec["path"])[0]["abi"], owner=deployer)
+        for (name, spec) in artifacts.items()
+    }
+
+# Library deployments keyed by the keccak hash of the library bytecode
+libraryRegistry = {}
+
+def deployLibrary(lib, deployer):
+    key = keccak(text=lib.bytecode)
+    address = libraryRegistry.get(key)
+
+    # Chain reverts (i.e. test snapshots) can remove a previously registered deployment,
+    # only reuse the library if the code still exists in the current chain state
+    if address != None and len(network.web3.eth.get_code(address)) > 0:
+        # Brownie links against the most recent deployment in the container
+        if len(lib) == 0 or lib[-1].address != address:
+            return lib.at(address)
+        return lib[-1]
+
+    deployed = lib.deploy({"from": deployer})
+    libraryRegistry[key] = deployed.address
+    return deployed
+
 def get_vault_config(**kwargs):
     return [
         kwargs.get("flags", 0),  # 0: flags
@@ -121,6 +232,18 @@ def get_univ3_batch_data(path):
         path,
     )]])
 
+def get_balancer_single_data(poolId):
+    return eth_abi.encode_abi(['(bytes32)'], [[to_bytes(poolId, "bytes32")]])
+
+def get_balancer_batch_data(swaps, assets, limits):
+    return eth_abi.encode_abi(
+        ['((bytes32,uint256,uint256,uint256,bytes)[],address[],int256[])'],
+        [[swaps, assets, limits]]
+    )
+
+def get_curve_batch_data(route, indices):
+    return eth_abi.encode_abi(['(address[6],uint256[8])'], [[route, indices]])
+
 def get_deposit_trade_params(dexId, tradeType, amount, slippage, unwrap, exchangeData):
     return eth_abi.encode_abi(
         ['(uint256,(uint16,uint8,uint256,bool,bytes))'],
@@ -167,6 +290,16 @@ def get_redeem_params(minPrimary, minSecondary, trade):
         ]]
     )
 
+def get_redeem_params_from_config(trade):
+    # Trade config as stored in keeper JSON files, dex and trade type are given by name
+    return get_redeem_params(0, 0, get_dynamic_trade_params(
+        DEX_ID[trade["dex"]],
+        TRADE_TYPE[trade["tradeType"]],
+        trade["slippage"],
+        trade["unwrap"],
+        bytes.fromhex(trade.get("exchangeData", "0x")[2:])
+    ))
+
 def set_dex_flags(flags, **kwargs):
     binList = list(format(flags, "b").rjust(16, "0"))
     if "UNISWAP_V2" in kwargs:
@@ -231,3 +364,26 @@ def get_remaining_strategy_tokens(address):
         "maturities": maturities,
         "amount": amount
     }
+
+def get_token_decimals(token):
+    return 18 if token == ETH_ADDRESS else interface.IERC20(token).decimals()
+
+def get_oracle_value(tradingModule, token, amount, quoteToken):
+    """
+    Values a token amount in quote token precision using the trading module oracles, returns None
+    if there is no oracle for the pair
+    """
+    if token == quoteToken:
+        return amount
+    try:
+        (answer, decimals) = tradingModule.getOraclePrice(token, quoteToken)
+    except (VirtualMachineError, ValueError):
+        return None
+    return amount * answer * 10**get_token_decimals(quoteToken) // (decimals * 10**get_token_decimals(token))
+
+def get_gas_cost(tradingModule, gas, gasPrice, quoteToken):
+    # Gas is paid in ETH, WETH has the same oracle as ETH
+    ethCost = gas * gasPrice
+    return ethCost if quoteToken in (ETH_ADDRESS, WETH_ADDRESS) else get_oracle_value(
+        tradingModule, ETH_ADDRESS, ethCost, quoteToken
+    )
@@ -0,0 +1,167 @@
+import json
+import os
+import sqlite3
+import time
+import requests
+from brownie import web3, interface, VaultEvents
+from eth_event import get_topic_map, decode_log
+
+# Indexes vault, Notional vault and trading module events into a local SQLite database. Each source
+# keeps its own checkpoint which is written in the same transaction as the events of a page, so an
+# interrupted run resumes from the last indexed block without duplicating or missing events.
+#
+# Configuration is read from the JSON file at INDEXER_CONFIG:
+# {
+#     "database": "reports/events.db",
+#     "notional": "0x...",
+#     "tradingModule": "0x...",
+#     "vaults": ["0x..."],
+#     "startBlock": 15000000,              # first block indexed by a new database
+#     "confirmations": 12,                 # only blocks this far behind the head are indexed
+#     "pollIntervalSeconds": 60
+# }
+
+DEFAULT_CONFIRMATIONS = 12
+DEFAULT_POLL_INTERVAL_SECONDS = 60
+# Block range used for the first eth_getLogs call, halved when the node rejects or times out a
+# range and doubled while pages return fewer than TARGET_LOGS_PER_PAGE logs
+INITIAL_BLOCK_RANGE = 10_000
+MAX_BLOCK_RANGE = 500_000
+TARGET_LOGS_PER_PAGE = 2_000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    source TEXT NOT NULL,
+    block_number INTEGER NOT NULL,
+    log_index INTEGER NOT NULL,
+    transaction_hash TEXT NOT NULL,
+    address TEXT NOT NULL,
+    name TEXT NOT NULL,
+    args TEXT NOT NULL,
+    PRIMARY KEY (block_number, log_index)
+);
+CREATE INDEX IF NOT EXISTS events_name ON events (name, address);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    source TEXT PRIMARY KEY,
+    block_number INTEGER NOT NULL
+);
+"""
+
+def open_database(path):
+    db = sqlite3.connect(path)
+    db.executescript(SCHEMA)
+    return db
+
+class EventIndexer:
+    def __init__(self, db, source, addresses, abi, startBlock, maxBlockRange=MAX_BLOCK_RANGE) -> None:
+        self.db = db
+        self.source = source
+        self.addresses = [web3.toChecksumAddress(a) for a in addresses]
+        self.topicMap = get_topic_map(abi)
+        self.startBlock = startBlock
+        self.maxBlockRange = maxBlockRange
+        self.blockRange = min(INITIAL_BLOCK_RANGE, maxBlockRange)
+
+    def get_checkpoint(self):
+        row = self.db.execute("SELECT block_number FROM checkpoints WHERE source = ?", (self.source,)).fetchone()
+        return self.startBlock - 1 if row == None else row[0]
+
+    def get_logs(self, fromBlock, toBlock):
+        return web3.eth.get_logs({
+            "address": self.addresses,
+            "fromBlock": fromBlock,
+            "toBlock": toBlock,
+            "topics": [list(self.topicMap.keys())]
+        })
+
+    def decode(self, log):
+        event = decode_log(log, self.topicMap)
+        return (
+            self.source,
+            log["blockNumber"],
+            log["logIndex"],
+            web3.toHex(log["transactionHash"]),
+            log["address"],
+            event["name"],
+            json.dumps({d["name"]: d["value"] for d in event["data"]}, default=str)
+        )
+
+    def write(self, logs, toBlock):
+        with self.db:
+            self.db.executemany(
+                "INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [self.decode(log) for log in logs]
+            )
+            self.db.execute(
+                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?)", (self.source, toBlock)
+            )
+
+    def index(self, toBlock):
+        """
+        Indexes every block after the checkpoint up to toBlock and returns the number of events written
+        """
+        fromBlock = self.get_checkpoint() + 1
+        written = 0
+        while fromBlock <= toBlock:
+            endBlock = min(fromBlock + self.blockRange - 1, toBlock)
+            try:
+                logs = self.get_logs(fromBlock, endBlock)
+            except (ValueError, requests.exceptions.RequestException):
+                # Nodes reject ranges with too many results and large ranges may time out
+                if self.blockRange == 1:
+                    raise
+                self.blockRange = max(self.blockRange // 2, 1)
+                continue
+
+            self.write(logs, endBlock)
+            written += len(logs)
+            fromBlock = endBlock + 1
+            if len(logs) < TARGET_LOGS_PER_PAGE:
+                self.blockRange = min(self.blockRange * 2, self.maxBlockRange)
+        return written
+
+def get_indexers(db, config):
+    return [
+        EventIndexer(db, "vaults", config["vaults"], VaultEvents.abi, config["startBlock"]),
+        EventIndexer(db, "notional", [config["notional"]], interface.NotionalProxy.abi, config["startBlock"]),
+        EventIndexer(db, "tradingModule", [config["tradingModule"]], interface.ITradingModule.abi, config["startBlock"])
+    ]
+
+def get_events(db, name, address=None):
+    """
+    Returns the args of every indexed event with the given name in log order
+    """
+    query = "SELECT block_number, args FROM events WHERE name = ?"
+    params = [name]
+    if address != None:
+        query += " AND address = ?"
+        params.append(web3.toChecksumAddress(address))
+    query += " ORDER BY block_number, log_index"
+    return [dict(json.loads(args), blockNumber=blockNumber) for (blockNumber, args) in db.execute(query, params)]
+
+def get_remaining_strategy_tokens(db, vault):
+    """
+    Indexed replacement for scripts.common.get_remaining_strategy_tokens, reads the remaining strategy
+    tokens of every settled maturity from the latest VaultSettledAssetsRemaining event
+    """
+    remaining = {}
+    for e in get_events(db, "VaultSettledAssetsRemaining"):
+        if e["vault"].lower() == vault.lower():
+            remaining[int(e["maturity"])] = int(e["remainingStrategyTokens"])
+    return {
+        "maturities": list(remaining.keys()),
+        "amount": sum(remaining.values())
+    }
+
+def main():
+    with open(os.environ["INDEXER_CONFIG"], "r") as f:
+        config = json.load(f)
+    db = open_database(config["database"])
+    indexers = get_indexers(db, config)
+
+    while True:
+        toBlock = web3.eth.block_number - config.get("confirmations", DEFAULT_CONFIRMATIONS)
+        for indexer in indexers:
+            written = indexer.index(toBlock)
+            print("Indexed {} {} events up to block {}".format(written, indexer.source, toBlock))
+        time.sleep(config.get("pollIntervalSeconds", DEFAULT_POLL_INTERVAL_SECONDS))
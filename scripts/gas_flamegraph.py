@@ -0,0 +1,153 @@
+import os
+from collections import defaultdict
+from brownie import chain, history, network
+from brownie.network.state import _find_contract
+
+# Folded stack output can be rendered with flamegraph.pl or loaded directly into speedscope.app
+OUTPUT_DIR = "reports/flamegraphs"
+
+CALL_OPS = {"CALL", "CALLCODE", "DELEGATECALL", "STATICCALL"}
+CREATE_OPS = {"CREATE", "CREATE2"}
+
+class CodeInfo:
+    def __init__(self, address) -> None:
+        contract = _find_contract(address) if address != None else None
+        self.pcMap = None
+        if contract == None:
+            self.name = address if address != None else "<create>"
+        else:
+            self.name = contract._name
+            build = getattr(contract, "_build", None)
+            if build != None and build.get("pcMap"):
+                self.pcMap = build["pcMap"]
+
+    def get(self, pc):
+        if self.pcMap == None:
+            return {}
+        return self.pcMap.get(pc) or self.pcMap.get(str(pc)) or {}
+
+class Frame:
+    def __init__(self, code, startGas, parentStack=[]) -> None:
+        self.code = code
+        self.stack = parentStack + [code.name]
+        # Number of entries in the stack before any functions of this frame are entered
+        self.base = len(self.stack)
+        self.startGas = startGas
+        self.pendingJump = False
+
+def _to_address(word):
+    return "0x" + "{:064x}".format(int(word, 16))[-40:]
+
+def _get_trace(txHash):
+    result = network.web3.provider.make_request(
+        "debug_traceTransaction", [txHash, {"disableStorage": True, "disableMemory": True}]
+    )
+    if "error" in result:
+        raise ValueError(result["error"])
+    return result["result"]["structLogs"]
+
+def get_folded_stacks(txn):
+    """
+    Replays the struct logs of a transaction and returns a mapping of call stack to the gas spent
+    exclusively in that stack frame. Internal functions are resolved from the brownie pcMap, external
+    calls to contracts without build artifacts are labelled with their address.
+    """
+    steps = _get_trace(txn.txid)
+    codeCache = {}
+
+    def get_code(address):
+        if address not in codeCache:
+            codeCache[address] = CodeInfo(address)
+        return codeCache[address]
+
+    folded = defaultdict(int)
+    frames = [Frame(get_code(txn.receiver or txn.contract_address), steps[0]["gas"] if steps else 0)]
+    # (step index, frame depth) of call ops waiting for their child frame to return
+    pendingCalls = []
+
+    for (i, step) in enumerate(steps):
+        op = step["op"]
+        frame = frames[-1]
+
+        # A child frame has returned to the caller
+        while pendingCalls and step["depth"] <= pendingCalls[-1][1]:
+            (callIndex, _) = pendingCalls.pop()
+            child = frames.pop()
+            previous = steps[i - 1]
+            childGasUsed = child.startGas - (previous["gas"] - previous["gasCost"])
+            # Call overhead (i.e. memory expansion, cold account access) is attributed to the caller
+            callCost = steps[callIndex]["gas"] - step["gas"] - childGasUsed
+            folded[";".join(frames[-1].stack)] += max(callCost, 0)
+            frame = frames[-1]
+
+        if frame.pendingJump:
+            fn = frame.code.get(step["pc"]).get("fn")
+            if fn:
+                frame.stack.append(fn)
+            frame.pendingJump = False
+        elif len(frame.stack) == frame.base:
+            # Entered an external function through the dispatcher
+            fn = frame.code.get(step["pc"]).get("fn")
+            if fn:
+                frame.stack.append(fn)
+
+        isCall = op in CALL_OPS or op in CREATE_OPS
+        nextStep = steps[i + 1] if i + 1 < len(steps) else None
+        if isCall and nextStep != None and nextStep["depth"] > step["depth"]:
+            if op in CREATE_OPS:
+                target = None
+            else:
+                target = _to_address(step["stack"][-2])
+            frames.append(Frame(get_code(target), nextStep["gas"], frame.stack))
+            pendingCalls.append((i, step["depth"]))
+            continue
+
+        if isCall:
+            # Call to an account without code or a precompile
+            cost = step["gas"] - nextStep["gas"] if nextStep != None else step["gasCost"]
+        else:
+            cost = step["gasCost"]
+        folded[";".join(frame.stack)] += cost
+
+        jump = frame.code.get(step["pc"]).get("jump")
+        if op == "JUMP" and jump == "i":
+            frame.pendingJump = True
+        elif op == "JUMP" and jump == "o" and len(frame.stack) > frame.base + 1:
+            frame.stack.pop()
+
+    return dict(folded)
+
+def write_flamegraph(txn, name=None, folded=None):
+    if folded == None:
+        folded = get_folded_stacks(txn)
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    path = os.path.join(OUTPUT_DIR, "{}.folded".format(name or txn.txid))
+    with open(path, "w") as f:
+        for (stack, gas) in sorted(folded.items()):
+            if gas > 0:
+                f.write("{} {}\n".format(stack, gas))
+    return path
+
+def get_function_summary(folded):
+    """
+    Returns (self gas, inclusive gas) per function from folded stacks
+    """
+    exclusive = defaultdict(int)
+    inclusive = defaultdict(int)
+    for (stack, gas) in folded.items():
+        names = stack.split(";")
+        exclusive[names[-1]] += gas
+        # Recursive frames are only counted once per stack
+        for fn in set(names):
+            inclusive[fn] += gas
+    return (exclusive, inclusive)
+
+def main(txHash=None, limit=25):
+    txn = chain.get_transaction(txHash) if txHash != None else history[-1]
+    folded = get_folded_stacks(txn)
+    path = write_flamegraph(txn, folded=folded)
+    (exclusive, inclusive) = get_function_summary(folded)
+    print("Folded stacks written to {}".format(path))
+    print("{:<70}{:>12}{:>12}".format("Function", "Self", "Inclusive"))
+    for fn in sorted(inclusive, key=inclusive.get, reverse=True)[:int(limit)]:
+        print("{:<70}{:>12}{:>12}".format(fn[:69], exclusive.get(fn, 0), inclusive[fn]))
@@ -0,0 +1,152 @@
+import json
+import os
+from brownie import chain, interface, FlashLiquidator, VaultLens
+from brownie.exceptions import VirtualMachineError
+from scripts.common import ETH_ADDRESS, WETH_ADDRESS, get_redeem_params_from_config
+
+# Scans vault accounts for liquidations on every new block and ranks them by the profit estimated by the
+# FlashLiquidator. Vault accounts are read from VaultEnterPosition events once and then extended with the
+# entries in each new block.
+#
+# Configuration is read from the JSON file at SCANNER_CONFIG:
+# {
+#     "notional": "0x...",
+#     "liquidator": "0x...",
+#     "lens": "0x...",
+#     "fromBlock": 15000000,               # block to start reading vault entries from
+#     "vaults": [{
+#         "address": "0x...",
+#         "useVaultDeleverage": true,
+#         "trade": {"dex": "CURVE", "tradeType": "EXACT_IN_SINGLE", "slippage": 5e6, "unwrap": true, "exchangeData": "0x"}
+#     }]
+# }
+
+# Number of accounts read from the lens in a single eth_call
+ACCOUNTS_PER_CALL = 200
+# Flash loan buffer on top of the deposit required by Notional, covers asset rate accrual
+FLASH_LOAN_BUFFER = 1.2
+
+def get_entered_accounts(notional, fromBlock, toBlock=None):
+    """
+    Returns a dict of vault to the accounts that entered it between fromBlock and toBlock
+    """
+    entered = {}
+    for e in notional.events.get_sequence(fromBlock, toBlock, event_type="VaultEnterPosition"):
+        accounts = entered.setdefault(e.args["vault"], [])
+        if e.args["account"] not in accounts:
+            accounts.append(e.args["account"])
+    return entered
+
+def get_vault_accounts(notional, vault, fromBlock, toBlock=None):
+    """
+    Returns every account that has entered the vault since fromBlock. Accounts that have since
+    exited are filtered out by the collateral ratio scan.
+    """
+    return get_entered_accounts(notional, fromBlock, toBlock).get(vault, [])
+
+def get_collateral_ratios(lens, vault, vaultAccounts):
+    collateral = []
+    for i in range(0, len(vaultAccounts), ACCOUNTS_PER_CALL):
+        collateral += lens.getCollateralRatios(vault, vaultAccounts[i:i + ACCOUNTS_PER_CALL])
+    return collateral
+
+def get_flash_loan_asset(notional, currencyId):
+    underlying = notional.getCurrency(currencyId)[1]["tokenAddress"]
+    return WETH_ADDRESS if underlying == ETH_ADDRESS else underlying
+
+def get_flash_loan_amount(notional, currencyId, maxLiquidatorDepositAssetCash):
+    # Converts the asset cash deposit into underlying external precision
+    assetRate = notional.getCurrencyAndRates(currencyId)["assetRate"]
+    return int(assetRate["rate"] * maxLiquidatorDepositAssetCash / assetRate["underlyingDecimals"] * FLASH_LOAN_BUFFER)
+
+def estimate_profit(liquidator, asset, amount, params):
+    try:
+        return liquidator.estimateProfit.call(asset, amount, params, {"from": liquidator.owner()})
+    except (VirtualMachineError, ValueError):
+        # Liquidation does not cover the flash loan or the redemption trade fails
+        return None
+
+def scan_vault(notional, liquidator, lens, vault, vaultAccounts, redeemParams, useVaultDeleverage=True):
+    """
+    Returns the liquidation queue for a vault, a list of accounts below the minimum collateral ratio
+    sorted by estimated profit. Accounts where the liquidation cannot be simulated are dropped.
+    """
+    currencyId = notional.getVaultConfig(vault)["borrowCurrencyId"]
+    asset = get_flash_loan_asset(notional, currencyId)
+
+    queue = []
+    for c in get_collateral_ratios(lens, vault, vaultAccounts):
+        if not c["isValid"] or c["collateralRatio"] >= c["minCollateralRatio"]:
+            continue
+        if c["maxLiquidatorDepositAssetCash"] <= 0:
+            continue
+
+        amount = get_flash_loan_amount(notional, currencyId, c["maxLiquidatorDepositAssetCash"])
+        params = [currencyId, c["account"], vault, useVaultDeleverage, redeemParams]
+        profit = estimate_profit(liquidator, asset, amount, params)
+        if profit == None:
+            continue
+
+        queue.append({
+            "account": c["account"],
+            "vault": vault,
+            "currencyId": currencyId,
+            "collateralRatio": c["collateralRatio"],
+            "minCollateralRatio": c["minCollateralRatio"],
+            "asset": asset,
+            "flashLoanAmount": amount,
+            "estimatedProfit": profit,
+            "params": params
+        })
+
+    return sorted(queue, key=lambda q: q["estimatedProfit"], reverse=True)
+
+def update_vault_accounts(notional, vaultAccounts, fromBlock, toBlock):
+    """
+    Appends the accounts that entered each vault between fromBlock and toBlock to vaultAccounts,
+    a dict of vault to accounts
+    """
+    for (vault, entered) in get_entered_accounts(notional, fromBlock, toBlock).items():
+        if vault in vaultAccounts:
+            vaultAccounts[vault] += [a for a in entered if a not in vaultAccounts[vault]]
+
+def scan_all(notional, liquidator, lens, vaultConfigs, vaultAccounts):
+    queue = []
+    for vaultConfig in vaultConfigs:
+        vault = vaultConfig["address"]
+        try:
+            queue += scan_vault(
+                notional,
+                liquidator,
+                lens,
+                vault,
+                vaultAccounts[vault],
+                get_redeem_params_from_config(vaultConfig["trade"]),
+                vaultConfig.get("useVaultDeleverage", True)
+            )
+        except (VirtualMachineError, ValueError) as e:
+            print("{} scan failed: {}".format(vault, e))
+
+    # Vaults may be in different currencies, profits are compared in their own asset precision
+    return sorted(queue, key=lambda q: q["estimatedProfit"], reverse=True)
+
+def main():
+    with open(os.environ["SCANNER_CONFIG"], "r") as f:
+        config = json.load(f)
+    notional = interface.NotionalProxy(config["notional"])
+    liquidator = FlashLiquidator.at(config["liquidator"])
+    lens = VaultLens.at(config["lens"])
+
+    vaultAccounts = {v["address"]: [] for v in config["vaults"]}
+    lastBlock = config["fromBlock"] - 1
+    for block in chain.new_blocks():
+        # Only entries since the last scanned block are read
+        update_vault_accounts(notional, vaultAccounts, lastBlock + 1, block["number"])
+        lastBlock = block["number"]
+
+        queue = scan_all(notional, liquidator, lens, config["vaults"], vaultAccounts)
+        print("Liquidation queue at block {}".format(block["number"]))
+        for q in queue:
+            print("{} {} ratio {} / {} profit {} {}".format(
+                q["vault"], q["account"], q["collateralRatio"], q["minCollateralRatio"], q["estimatedProfit"], q["asset"]
+            ))
@@ -0,0 +1,163 @@
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from brownie import chain, Contract, VaultLens, MetaStable2TokenAuraVault, Boosted3TokenAuraVault
+from brownie.exceptions import VirtualMachineError
+from scripts.stable_math import calc_spot_price, calculate_invariant
+
+# Streams the deviation between each vault's spot price and the oracle price checked by the vault
+# before deposits, redemptions and settlements. Each vault is read with a single lens call per block,
+# MetaStable spot prices are calculated off chain from the returned strategy context and boosted
+# spot prices are read by the lens.
+#
+# Configuration is read from the JSON file at MONITOR_CONFIG:
+# {
+#     "lens": "0x...",
+#     "vaults": [{"address": "0x...", "contract": "MetaStable2TokenAuraVault"}],
+#     "warnAtLimitPercent": 75,            # warn when the deviation reaches this share of the limit
+#     "metricsFile": "reports/oracle_monitor.jsonl"
+# }
+
+VAULT_CONTRACTS = {
+    "MetaStable2TokenAuraVault": MetaStable2TokenAuraVault,
+    "Boosted3TokenAuraVault": Boosted3TokenAuraVault
+}
+VAULT_PERCENT_BASIS = 1e4
+BALANCER_PRECISION = 10**18
+DEFAULT_WARN_AT_LIMIT_PERCENT = 75
+MAX_WORKERS = 16
+
+OK = "ok"
+WARN = "warn"
+BREACH = "breach"
+
+def get_metastable_spot_price(ctx):
+    """
+    Off chain port of Stable2TokenOracleMath._getSpotPrice for the primary token index
+    """
+    poolContext = ctx["poolContext"]
+    basePool = poolContext["basePool"]
+    oracleContext = ctx["oracleContext"]
+    balanceX = basePool["primaryBalance"] * poolContext["primaryScaleFactor"] // BALANCER_PRECISION
+    balanceY = basePool["secondaryBalance"] * poolContext["secondaryScaleFactor"] // BALANCER_PRECISION
+
+    (invariant, _) = calculate_invariant(oracleContext["ampParam"], [balanceX, balanceY], True)
+    if invariant == None:
+        return None
+    spotPrice = calc_spot_price(oracleContext["ampParam"], invariant, balanceX, balanceY)
+
+    scaleFactor = poolContext["secondaryScaleFactor"] * BALANCER_PRECISION // poolContext["primaryScaleFactor"]
+    spotPrice = spotPrice * BALANCER_PRECISION // scaleFactor
+    return spotPrice * BALANCER_PRECISION // 10**basePool["primaryDecimals"]
+
+def get_lens_params(vault, ctx):
+    """
+    Returns (numTokens, quoteToken, baseTokens) for the lens call. numTokens is zero for MetaStable
+    vaults since their spot price is calculated off chain. Oracle pairs match the ones validated by
+    the vault: MetaStable vaults price the primary token in the secondary, boosted vaults price the
+    secondary and tertiary underlying in the primary underlying.
+    """
+    if "underlyingPools" in ctx["oracleContext"]:
+        mainTokens = [pool["mainToken"] for pool in ctx["oracleContext"]["underlyingPools"]]
+        return (3, mainTokens[0], mainTokens[1:])
+    basePool = ctx["poolContext"]["basePool"]
+    return (0, basePool["secondaryToken"], [basePool["primaryToken"]])
+
+def get_deviation(spotPrice, oraclePrice, limit, warnAtLimitPercent):
+    deviation = abs(spotPrice - oraclePrice) * VAULT_PERCENT_BASIS / oraclePrice
+    if deviation > limit:
+        status = BREACH
+    elif deviation >= limit * warnAtLimitPercent / 100:
+        status = WARN
+    else:
+        status = OK
+    return {
+        "spotPrice": spotPrice,
+        "oraclePrice": oraclePrice,
+        # In VAULT_PERCENT_BASIS, the same units as oraclePriceDeviationLimitPercent
+        "deviation": deviation,
+        "limit": limit,
+        "status": status
+    }
+
+class VaultMonitor:
+    def __init__(self, lens, vault) -> None:
+        self.lens = lens
+        self.vault = vault
+        (self.numTokens, self.quoteToken, self.baseTokens) = get_lens_params(vault, vault.getStrategyContext())
+
+    def check(self, block, warnAtLimitPercent=DEFAULT_WARN_AT_LIMIT_PERCENT):
+        snapshot = self.lens.getVaultSnapshot(
+            self.vault.address,
+            [], # past maturities are not needed
+            self.numTokens,
+            self.quoteToken,
+            self.baseTokens,
+            block_identifier=block
+        )
+        ctx = self.vault.getStrategyContext.decode_output(snapshot["strategyContext"])
+        limit = ctx["baseStrategy"]["vaultSettings"]["oraclePriceDeviationLimitPercent"]
+
+        deviations = []
+        if self.numTokens == 0:
+            spotPrice = get_metastable_spot_price(ctx)
+            p = snapshot["oraclePrices"][0]
+            if spotPrice != None and p["isValid"]:
+                # Oracle pair price is scaled to pool claim precision by the vault
+                oraclePrice = p["answer"] * ctx["baseStrategy"]["poolClaimPrecision"] // p["decimals"]
+                deviations.append(dict(get_deviation(spotPrice, oraclePrice, limit, warnAtLimitPercent), tokenIndex=0))
+        else:
+            # Lens spot prices are indexed by token, oracle prices by base token starting at index 1
+            for (i, p) in enumerate(snapshot["oraclePrices"]):
+                if p["isValid"]:
+                    deviations.append(dict(
+                        get_deviation(snapshot["spotPrices"][i + 1], p["answer"], limit, warnAtLimitPercent),
+                        tokenIndex=i + 1
+                    ))
+
+        return {
+            "vault": self.vault.address,
+            "blockNumber": snapshot["blockNumber"],
+            "blockTimestamp": snapshot["blockTimestamp"],
+            "deviations": deviations,
+            "status": max([d["status"] for d in deviations], key=[OK, WARN, BREACH].index, default=OK)
+        }
+
+def check_all(monitors, block, warnAtLimitPercent=DEFAULT_WARN_AT_LIMIT_PERCENT):
+    """
+    Checks every vault at the same block in parallel, vaults that fail to read are reported with
+    an error instead of a status
+    """
+    def _check(monitor):
+        try:
+            return monitor.check(block, warnAtLimitPercent)
+        except (VirtualMachineError, ValueError) as e:
+            return {"vault": monitor.vault.address, "blockNumber": block, "error": str(e)}
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        return list(executor.map(_check, monitors))
+
+def emit(result, metricsFile=None):
+    if result.get("status") in (WARN, BREACH) or "error" in result:
+        print("{} {} at block {}: {}".format(
+            result.get("status", "error").upper(), result["vault"], result["blockNumber"],
+            result.get("error", result.get("deviations"))
+        ))
+    if metricsFile != None:
+        with open(metricsFile, "a") as f:
+            f.write(json.dumps(result, default=str) + "\n")
+
+def main():
+    with open(os.environ["MONITOR_CONFIG"], "r") as f:
+        config = json.load(f)
+    lens = VaultLens.at(config["lens"])
+    monitors = [
+        VaultMonitor(lens, Contract.from_abi(v["contract"], v["address"], VAULT_CONTRACTS[v["contract"]].abi))
+        for v in config["vaults"]
+    ]
+    warnAtLimitPercent = config.get("warnAtLimitPercent", DEFAULT_WARN_AT_LIMIT_PERCENT)
+    metricsFile = config.get("metricsFile")
+
+    for block in chain.new_blocks():
+        for result in check_all(monitors, block["number"], warnAtLimitPercent):
+            emit(result, metricsFile)
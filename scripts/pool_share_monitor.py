@@ -0,0 +1,248 @@
+import json
+import os
+import time
+from brownie import web3, interface, Contract, MetaStable2TokenAuraVault, Boosted3TokenAuraVault
+from brownie.convert import to_bytes
+from brownie.exceptions import VirtualMachineError
+from scripts.common import get_all_active_maturities
+
+# Tracks the share of each Balancer pool held by the vaults against maxPoolShare. Once totalPoolClaim
+# exceeds maxPoolShare of the pool supply the vault is eligible for emergency settlement, which can
+# happen without any vault activity when other LPs exit the pool. Pool supply is only re-read when
+# the Balancer vault emits a join, exit or swap for one of the monitored pools.
+#
+# Configuration is read from the JSON file at POOL_SHARE_CONFIG:
+# {
+#     "notional": "0x...",
+#     "vaults": [{"address": "0x...", "contract": "MetaStable2TokenAuraVault"}],
+#     "minHeadroomPercent": 10,            # emit the emergency settlement schedule below this headroom
+#     "scheduleOvershootPercent": 1,       # pool share past maxPoolShare used for the schedule before the crossing
+#     "projectionWindowSeconds": 86400,    # pool share samples used to project the crossing time
+#     "pollIntervalSeconds": 15,           # interval for reading new entries from the event filter
+#     "metricsFile": "reports/pool_share_monitor.jsonl"
+# }
+
+VAULT_CONTRACTS = {
+    "MetaStable2TokenAuraVault": MetaStable2TokenAuraVault,
+    "Boosted3TokenAuraVault": Boosted3TokenAuraVault
+}
+BALANCER_VAULT = "0xBA12222222228d8Ba445958a75a0704d566BF2C8"
+# Proportional joins and exits emit PoolBalanceChanged, boosted pools are joined and exited
+# by swapping into and out of the phantom BPT which emits Swap
+POOL_BALANCE_CHANGED = web3.keccak(text="PoolBalanceChanged(bytes32,address,address[],int256[],uint256[])")
+SWAP = web3.keccak(text="Swap(bytes32,address,address,uint256,uint256)")
+
+# Matches VaultConstants
+VAULT_PERCENT_BASIS = 10**4
+POOL_SHARE_BUFFER = 8_000
+DEFAULT_MIN_HEADROOM_PERCENT = 10
+DEFAULT_SCHEDULE_OVERSHOOT_PERCENT = 1
+DEFAULT_PROJECTION_WINDOW_SECONDS = 86400
+DEFAULT_POLL_INTERVAL_SECONDS = 15
+
+def get_pool_claim_threshold(totalPoolSupply, maxPoolShare):
+    return totalPoolSupply * maxPoolShare // VAULT_PERCENT_BASIS
+
+def get_schedule_supply(totalPoolClaim, maxPoolShare, overshootPercent):
+    """
+    Returns the pool supply at which the vault holds overshootPercent more than maxPoolShare of the
+    pool. The vault is only eligible for emergency settlement strictly past the threshold, so the
+    overshoot must be positive for the schedule to be non empty.
+    """
+    return totalPoolClaim * VAULT_PERCENT_BASIS * 100 // (maxPoolShare * (100 + overshootPercent))
+
+def get_emergency_pool_claim_amount(totalPoolSupply, maxPoolShare, totalPoolClaim, poolClaimInMaturity):
+    """
+    Off chain port of SettlementUtils._getEmergencySettlementPoolClaimAmount
+    """
+    desiredPoolShare = maxPoolShare * POOL_SHARE_BUFFER // VAULT_PERCENT_BASIS
+    desiredPoolClaimAmount = totalPoolSupply * desiredPoolShare // VAULT_PERCENT_BASIS
+    return min(totalPoolClaim - desiredPoolClaimAmount, poolClaimInMaturity)
+
+def get_emergency_schedule(totalPoolSupply, maxPoolShare, vaultState, maturityStrategyTokens):
+    """
+    Returns the sequence of settleVaultEmergency calls that brings the vault back under maxPoolShare.
+    Each call settles at most the pool claim held in its maturity and exits the pool, so the pool supply,
+    pool claim and strategy tokens are carried over to the next call. Calls stop once the vault is under
+    the threshold since settleVaultEmergency reverts from then on. Maturities with the largest share are
+    settled first to minimize the number of calls.
+
+    maturityStrategyTokens is a dict of maturity to totalStrategyTokens, it should only contain maturities
+    outside of their settlement window.
+    """
+    totalPoolClaim = vaultState["totalPoolClaim"]
+    totalStrategyTokenGlobal = vaultState["totalStrategyTokenGlobal"]
+    schedule = []
+    for (maturity, strategyTokens) in sorted(maturityStrategyTokens.items(), key=lambda m: m[1], reverse=True):
+        if totalPoolClaim <= get_pool_claim_threshold(totalPoolSupply, maxPoolShare):
+            break
+        if strategyTokens == 0 or totalStrategyTokenGlobal == 0:
+            continue
+
+        poolClaimInMaturity = totalPoolClaim * strategyTokens // totalStrategyTokenGlobal
+        poolClaimToSettle = get_emergency_pool_claim_amount(
+            totalPoolSupply, maxPoolShare, totalPoolClaim, poolClaimInMaturity
+        )
+        # Matches StrategyUtils._convertPoolClaimToStrategyTokens
+        strategyTokensToRedeem = poolClaimToSettle * totalStrategyTokenGlobal // totalPoolClaim
+        schedule.append({
+            "maturity": maturity,
+            "poolClaimToSettle": poolClaimToSettle,
+            "strategyTokensToRedeem": strategyTokensToRedeem
+        })
+
+        totalPoolClaim -= poolClaimToSettle
+        totalStrategyTokenGlobal -= strategyTokensToRedeem
+        totalPoolSupply -= poolClaimToSettle
+    return schedule
+
+def project_crossing(samples, maxPoolShare):
+    """
+    Projects the number of seconds until the pool share crosses maxPoolShare from the change in
+    pool share across the samples, a list of (timestamp, poolShare). Returns zero if the share is
+    already over the limit and None if the share is not growing.
+    """
+    (lastTimestamp, lastShare) = samples[-1]
+    if lastShare > maxPoolShare:
+        return 0
+    (firstTimestamp, firstShare) = samples[0]
+    if lastTimestamp == firstTimestamp or lastShare <= firstShare:
+        return None
+    rate = (lastShare - firstShare) / (lastTimestamp - firstTimestamp)
+    return int((maxPoolShare - lastShare) / rate)
+
+class PoolShareMonitor:
+    def __init__(self, notional, vault, minHeadroomPercent, projectionWindowSeconds,
+        scheduleOvershootPercent=DEFAULT_SCHEDULE_OVERSHOOT_PERCENT) -> None:
+        self.notional = notional
+        self.vault = vault
+        self.minHeadroomPercent = minHeadroomPercent
+        self.projectionWindowSeconds = projectionWindowSeconds
+        self.scheduleOvershootPercent = scheduleOvershootPercent
+        self.currencyId = notional.getVaultConfig(vault.address)["borrowCurrencyId"]
+        self.poolId = web3.toHex(to_bytes(vault.getStrategyContext()["poolContext"]["poolId"], "bytes32"))
+        # (timestamp, poolShare) within the projection window
+        self.samples = []
+
+    def get_pool_supply(self, ctx, block):
+        # Boosted pools hold their own BPT, the vault checks maxPoolShare against the actual supply
+        if "underlyingPools" in ctx["oracleContext"]:
+            return ctx["oracleContext"]["virtualSupply"]
+        poolToken = ctx["poolContext"]["basePool"]["poolToken"]
+        return interface.IERC20(poolToken).totalSupply(block_identifier=block)
+
+    def get_maturity_strategy_tokens(self, ctx, timestamp, block):
+        # settleVaultEmergency reverts for maturities inside their settlement window
+        settlementPeriod = ctx["baseStrategy"]["settlementPeriodInSeconds"]
+        return {
+            maturity: self.notional.getVaultState(self.vault.address, maturity, block_identifier=block)["totalStrategyTokens"]
+            for maturity in get_all_active_maturities(self.notional, self.currencyId)
+            if timestamp < maturity - settlementPeriod
+        }
+
+    def check(self, block):
+        timestamp = web3.eth.get_block(block)["timestamp"]
+        ctx = self.vault.getStrategyContext(block_identifier=block)
+        baseStrategy = ctx["baseStrategy"]
+        maxPoolShare = baseStrategy["vaultSettings"]["maxPoolShare"]
+        totalPoolClaim = baseStrategy["vaultState"]["totalPoolClaim"]
+        totalPoolSupply = self.get_pool_supply(ctx, block)
+
+        threshold = get_pool_claim_threshold(totalPoolSupply, maxPoolShare)
+        poolShare = totalPoolClaim * VAULT_PERCENT_BASIS / totalPoolSupply if totalPoolSupply > 0 else 0
+        headroomPercent = (threshold - totalPoolClaim) * 100 / threshold if threshold > 0 else 0
+
+        self.samples = [s for s in self.samples if s[0] >= timestamp - self.projectionWindowSeconds]
+        self.samples.append((timestamp, poolShare))
+
+        result = {
+            "vault": self.vault.address,
+            "blockNumber": block,
+            "blockTimestamp": timestamp,
+            "totalPoolClaim": totalPoolClaim,
+            "totalPoolSupply": totalPoolSupply,
+            # In VAULT_PERCENT_BASIS, the same units as maxPoolShare
+            "poolShare": poolShare,
+            "maxPoolShare": maxPoolShare,
+            "headroomPercent": headroomPercent,
+            "secondsToCrossing": project_crossing(self.samples, maxPoolShare),
+            "isEligible": totalPoolClaim > threshold,
+            "schedule": None
+        }
+
+        if headroomPercent < self.minHeadroomPercent:
+            # Before the crossing the schedule is calculated at a supply just past the threshold, this
+            # is what the vault will settle if other LPs keep exiting
+            scheduleSupply = totalPoolSupply if result["isEligible"] or maxPoolShare == 0 else get_schedule_supply(
+                totalPoolClaim, maxPoolShare, self.scheduleOvershootPercent
+            )
+            result["schedule"] = get_emergency_schedule(
+                scheduleSupply,
+                maxPoolShare,
+                baseStrategy["vaultState"],
+                self.get_maturity_strategy_tokens(ctx, timestamp, block)
+            )
+        return result
+
+def get_pool_filter(monitors, fromBlock):
+    return web3.eth.filter({
+        "address": BALANCER_VAULT,
+        "fromBlock": fromBlock,
+        "topics": [
+            [web3.toHex(POOL_BALANCE_CHANGED), web3.toHex(SWAP)],
+            list(set(m.poolId for m in monitors))
+        ]
+    })
+
+def get_changed_pools(entries):
+    """
+    Returns the latest block with an event for each pool id in the log entries
+    """
+    changed = {}
+    for entry in entries:
+        poolId = web3.toHex(entry["topics"][1])
+        changed[poolId] = max(changed.get(poolId, 0), entry["blockNumber"])
+    return changed
+
+def emit(result, metricsFile=None):
+    if result.get("schedule") != None or "error" in result:
+        print("{} at block {} pool share {} / {} headroom {}%: {}".format(
+            result["vault"], result["blockNumber"], result.get("poolShare"), result.get("maxPoolShare"),
+            result.get("headroomPercent"), result.get("error", result.get("schedule"))
+        ))
+    if metricsFile != None:
+        with open(metricsFile, "a") as f:
+            f.write(json.dumps(result, default=str) + "\n")
+
+def check(monitor, block, metricsFile=None):
+    try:
+        emit(monitor.check(block), metricsFile)
+    except (VirtualMachineError, ValueError) as e:
+        emit({"vault": monitor.vault.address, "blockNumber": block, "error": str(e)}, metricsFile)
+
+def main():
+    with open(os.environ["POOL_SHARE_CONFIG"], "r") as f:
+        config = json.load(f)
+    notional = interface.NotionalProxy(config["notional"])
+    monitors = [
+        PoolShareMonitor(
+            notional,
+            Contract.from_abi(v["contract"], v["address"], VAULT_CONTRACTS[v["contract"]].abi),
+            config.get("minHeadroomPercent", DEFAULT_MIN_HEADROOM_PERCENT),
+            config.get("projectionWindowSeconds", DEFAULT_PROJECTION_WINDOW_SECONDS),
+            config.get("scheduleOvershootPercent", DEFAULT_SCHEDULE_OVERSHOOT_PERCENT)
+        )
+        for v in config["vaults"]
+    ]
+    metricsFile = config.get("metricsFile")
+
+    block = web3.eth.block_number
+    poolFilter = get_pool_filter(monitors, block + 1)
+    for monitor in monitors:
+        check(monitor, block, metricsFile)
+
+    while True:
+        for (poolId, block) in get_changed_pools(poolFilter.get_new_entries()).items():
+            for monitor in [m for m in monitors if m.poolId == poolId]:
+                check(monitor, block, metricsFile)
+        time.sleep(config.get("pollIntervalSeconds", DEFAULT_POLL_INTERVAL_SECONDS))
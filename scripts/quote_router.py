@@ -0,0 +1,267 @@
+from concurrent.futures import ThreadPoolExecutor
+from brownie import chain, interface
+from brownie.convert import to_address, to_bytes
+from brownie.exceptions import VirtualMachineError
+from scripts.common import (
+    DEX_ID,
+    TRADE_TYPE,
+    ETH_ADDRESS,
+    WETH_ADDRESS,
+    get_balancer_batch_data,
+    get_balancer_single_data,
+    get_curve_batch_data,
+    get_gas_cost,
+    get_univ2_data,
+    get_univ3_batch_data,
+    get_univ3_single_data
+)
+
+# Quotes every route the trading module supports for a token pair and returns the exchange data for
+# the route with the highest output net of gas. Quotes are eth_calls to the DEX quoting functions,
+# pinned to a single block so that routes are compared against the same state.
+
+UNIV2_ROUTER = "0x7a250d5630B4cF539739dF2C5dAcb4c659F2488D"
+UNIV3_QUOTER = "0xb27308f9F90D607463bb33eA1BeBb41C6265062e"
+BALANCER_VAULT = "0xBA12222222228d8Ba445958a75a0704d566BF2C8"
+CURVE_REGISTRY = "0x90E00ACe148ca3b23Ac1bC8C240C2a7Dd9c2d7f5"
+CURVE_ROUTER = "0xfA9a30350048B2BF66865ee20363067c66f67e58"
+# Curve represents ETH with this address
+CURVE_ETH_ADDRESS = "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE"
+
+UNIV3_FEE_TIERS = [100, 500, 3000, 10000]
+# Intermediate tokens used for two hop routes
+DEFAULT_CONNECTORS = [
+    WETH_ADDRESS,
+    "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48", # USDC
+    "0x6B175474E89094C44Da98b954EedeAC495271d0F"  # DAI
+]
+# Approximate gas used by a trade through the trading module, per DEX hop
+TRADE_GAS_BASE = 60_000
+TRADE_GAS_PER_HOP = {
+    DEX_ID["UNISWAP_V2"]: 90_000,
+    DEX_ID["UNISWAP_V3"]: 110_000,
+    DEX_ID["BALANCER_V2"]: 100_000,
+    DEX_ID["CURVE"]: 150_000
+}
+MAX_WORKERS = 16
+
+def _wrapped(token):
+    return WETH_ADDRESS if token == ETH_ADDRESS else token
+
+def _route(dexId, tradeType, exchangeData, hops, quote, description):
+    return {
+        "dexId": dexId,
+        "tradeType": tradeType,
+        "exchangeData": exchangeData,
+        "hops": hops,
+        "quote": quote,
+        "description": description
+    }
+
+def get_univ2_routes(sellToken, buyToken, amount, connectors):
+    router = interface.IUniV2Router2(UNIV2_ROUTER)
+    paths = [[_wrapped(sellToken), _wrapped(buyToken)]] + [
+        [_wrapped(sellToken), c, _wrapped(buyToken)] for c in connectors
+    ]
+    return [
+        _route(
+            DEX_ID["UNISWAP_V2"],
+            TRADE_TYPE["EXACT_IN_SINGLE"] if len(path) == 2 else TRADE_TYPE["EXACT_IN_BATCH"],
+            get_univ2_data(path),
+            len(path) - 1,
+            lambda block, path=path: router.getAmountsOut(amount, path, block_identifier=block)[-1],
+            "UniV2 {}".format(path)
+        ) for path in paths
+    ]
+
+def get_univ3_routes(sellToken, buyToken, amount, connectors):
+    quoter = interface.IQuoter(UNIV3_QUOTER)
+    (sell, buy) = (_wrapped(sellToken), _wrapped(buyToken))
+    routes = [
+        _route(
+            DEX_ID["UNISWAP_V3"],
+            TRADE_TYPE["EXACT_IN_SINGLE"],
+            get_univ3_single_data(fee),
+            1,
+            lambda block, fee=fee: quoter.quoteExactInputSingle.call(sell, buy, fee, amount, 0, block_identifier=block),
+            "UniV3 fee {}".format(fee)
+        ) for fee in UNIV3_FEE_TIERS
+    ]
+
+    for c in connectors:
+        for fee1 in UNIV3_FEE_TIERS:
+            for fee2 in UNIV3_FEE_TIERS:
+                path = [sell, fee1, c, fee2, buy]
+                # Quoter takes the packed path, the adapter takes it abi encoded in a tuple
+                packedPath = _pack_univ3_path(path)
+                routes.append(_route(
+                    DEX_ID["UNISWAP_V3"],
+                    TRADE_TYPE["EXACT_IN_BATCH"],
+                    get_univ3_batch_data(path),
+                    2,
+                    lambda block, p=packedPath: quoter.quoteExactInput.call(p, amount, block_identifier=block),
+                    "UniV3 {}".format(path)
+                ))
+    return routes
+
+def _pack_univ3_path(path):
+    packed = b""
+    for (i, p) in enumerate(path):
+        packed += to_bytes(p, "bytes20") if i % 2 == 0 else p.to_bytes(3, "big")
+    return packed
+
+def _get_balancer_pool_tokens(vault, poolIds):
+    poolTokens = {}
+    for poolId in poolIds:
+        poolTokens[poolId] = [t.lower() for t in vault.getPoolTokens(poolId)[0]]
+    return poolTokens
+
+def get_balancer_routes(sellToken, buyToken, amount, poolIds):
+    """
+    Single swaps through every pool holding both tokens and two hop batch swaps through pairs of pools
+    that share a token. Balancer pools hold WETH, ETH is sent as the zero address asset.
+    """
+    vault = interface.IBalancerVault(BALANCER_VAULT)
+    poolTokens = _get_balancer_pool_tokens(vault, poolIds)
+    (sell, buy) = (_wrapped(sellToken).lower(), _wrapped(buyToken).lower())
+    funds = [ETH_ADDRESS, False, ETH_ADDRESS, False]
+    # GIVEN_IN swap kind
+    query = lambda swaps, assets: lambda block: -vault.queryBatchSwap.call(
+        0, swaps, assets, funds, block_identifier=block
+    )[-1]
+
+    routes = []
+    for (poolId, tokens) in poolTokens.items():
+        if sell in tokens and buy in tokens:
+            swaps = [[to_bytes(poolId, "bytes32"), 0, 1, amount, bytes()]]
+            routes.append(_route(
+                DEX_ID["BALANCER_V2"],
+                TRADE_TYPE["EXACT_IN_SINGLE"],
+                get_balancer_single_data(poolId),
+                1,
+                query(swaps, [sellToken, buyToken]),
+                "Balancer pool {}".format(poolId)
+            ))
+
+    for (poolId1, tokens1) in poolTokens.items():
+        for (poolId2, tokens2) in poolTokens.items():
+            if poolId1 == poolId2 or sell not in tokens1 or buy not in tokens2:
+                continue
+            for c in set(tokens1) & set(tokens2) - {sell, buy}:
+                # Amount of zero uses the entire output of the previous swap
+                swaps = [
+                    [to_bytes(poolId1, "bytes32"), 0, 1, amount, bytes()],
+                    [to_bytes(poolId2, "bytes32"), 1, 2, 0, bytes()]
+                ]
+                assets = [sellToken, to_address(c), buyToken]
+                routes.append(_route(
+                    DEX_ID["BALANCER_V2"],
+                    TRADE_TYPE["EXACT_IN_BATCH"],
+                    get_balancer_batch_data(swaps, assets, [amount, 0, 0]),
+                    2,
+                    query(swaps, assets),
+                    "Balancer pools {} {}".format(poolId1, poolId2)
+                ))
+    return routes
+
+def _curve_token(token):
+    return CURVE_ETH_ADDRESS if token in (ETH_ADDRESS, WETH_ADDRESS) else token
+
+def get_curve_routes(sellToken, buyToken, amount, block):
+    """
+    The curve adapter finds the pool for single trades from the registry and takes a router route
+    for batch trades, both are read at the quoted block
+    """
+    routes = []
+    (sell, buy) = (_curve_token(sellToken), _curve_token(buyToken))
+    pool = interface.ICurveRegistry(CURVE_REGISTRY).find_pool_for_coins(sell, buy, block_identifier=block)
+    if int(pool, 16) != 0:
+        curvePool = interface.ICurvePool(pool)
+        coins = []
+        for c in range(4):
+            try:
+                coins.append(curvePool.coins(c, block_identifier=block).lower())
+            except (VirtualMachineError, ValueError):
+                break
+        if sell.lower() in coins and buy.lower() in coins:
+            (i, j) = (coins.index(sell.lower()), coins.index(buy.lower()))
+            routes.append(_route(
+                DEX_ID["CURVE"],
+                TRADE_TYPE["EXACT_IN_SINGLE"],
+                bytes(),
+                1,
+                lambda block: curvePool.get_dy(i, j, amount, block_identifier=block),
+                "Curve pool {}".format(pool)
+            ))
+
+    router = interface.ICurveRouter(CURVE_ROUTER)
+    try:
+        (route, indices, _) = router.get_exchange_routing(sell, buy, amount, block_identifier=block)
+        # Routes alternate tokens and pools, unused entries are the zero address
+        hops = max(len([r for r in route if int(r, 16) != 0]) // 2, 1)
+        routes.append(_route(
+            DEX_ID["CURVE"],
+            TRADE_TYPE["EXACT_IN_BATCH"],
+            get_curve_batch_data(route, indices),
+            hops,
+            lambda block: router.get_exchange_routing(sell, buy, amount, block_identifier=block)[2],
+            "Curve router {}".format(route)
+        ))
+    except (VirtualMachineError, ValueError):
+        # No route between the tokens
+        pass
+    return routes
+
+def get_routes(sellToken, buyToken, amount, block, connectors=None, balancerPoolIds=()):
+    connectors = [
+        c for c in (DEFAULT_CONNECTORS if connectors == None else connectors)
+        if c.lower() not in (_wrapped(sellToken).lower(), _wrapped(buyToken).lower())
+    ]
+    return (
+        get_univ2_routes(sellToken, buyToken, amount, connectors) +
+        get_univ3_routes(sellToken, buyToken, amount, connectors) +
+        get_balancer_routes(sellToken, buyToken, amount, balancerPoolIds) +
+        get_curve_routes(sellToken, buyToken, amount, block)
+    )
+
+def _quote(route, block):
+    try:
+        return route["quote"](block)
+    except (VirtualMachineError, ValueError):
+        # Pool does not exist or does not have enough liquidity
+        return None
+
+def quote_routes(tradingModule, sellToken, buyToken, amount, gasPrice, block=None, **kwargs):
+    """
+    Quotes every route in parallel at the given block and returns them sorted by output net of gas.
+    Routes that fail to quote are dropped. Gas is valued in the buy token using the trading module
+    oracles, if there is no oracle for the buy token routes are ranked on output alone.
+    """
+    block = chain.height if block == None else block
+    routes = get_routes(sellToken, buyToken, amount, block, **kwargs)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        amountsOut = list(executor.map(lambda r: _quote(r, block), routes))
+
+    quotes = []
+    for (route, amountOut) in zip(routes, amountsOut):
+        if amountOut == None or amountOut == 0:
+            continue
+        gas = TRADE_GAS_BASE + TRADE_GAS_PER_HOP[route["dexId"]] * route["hops"]
+        gasCost = get_gas_cost(tradingModule, gas, gasPrice, buyToken) or 0
+        quotes.append({
+            "dexId": route["dexId"],
+            "tradeType": route["tradeType"],
+            "exchangeData": route["exchangeData"],
+            "description": route["description"],
+            "amountOut": amountOut,
+            "gas": gas,
+            "gasCost": gasCost,
+            "netAmountOut": amountOut - gasCost,
+            "block": block
+        })
+
+    return sorted(quotes, key=lambda q: q["netAmountOut"], reverse=True)
+
+def get_best_route(tradingModule, sellToken, buyToken, amount, gasPrice, block=None, **kwargs):
+    quotes = quote_routes(tradingModule, sellToken, buyToken, amount, gasPrice, block, **kwargs)
+    return quotes[0] if len(quotes) > 0 else None
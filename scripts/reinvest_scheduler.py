@@ -0,0 +1,197 @@
+import json
+import os
+import time
+import eth_abi
+from brownie import accounts, web3, interface, Contract, MetaStable2TokenAuraVault, Boosted3TokenAuraVault
+from brownie.exceptions import VirtualMachineError
+from scripts.common import (
+    DEX_ID,
+    TRADE_TYPE,
+    get_gas_cost,
+    get_oracle_value,
+    get_token_decimals
+)
+from scripts.vault_lens import get_vault_tokens
+
+# Claims and reinvests Aura rewards only when the value of the rewards exceeds the gas cost of the
+# claim and reinvestment by the configured threshold.
+#
+# Configuration is read from the JSON file at SCHEDULER_CONFIG:
+# {
+#     "tradingModule": "0x...",
+#     "account": "KEEPER",                 # brownie account id, granted the reward reinvestment role
+#     "pollIntervalSeconds": 3600,
+#     # Routes are shared by all vaults and keyed by "sellToken:buyToken"
+#     "routes": {
+#         "0xba10...:0x6b17...": {"dex": "UNISWAP_V3", "tradeType": "EXACT_IN_BATCH", "slippage": 0, "unwrap": false, "exchangeData": "0x..."}
+#     },
+#     "vaults": [{
+#         "address": "0x...",
+#         "contract": "Boosted3TokenAuraVault",
+#         "minNetYield": 100e18,           # in primary token precision
+#         "reinvestGas": 800000            # optional, refined from executed reinvestments
+#     }]
+# }
+
+VAULT_CONTRACTS = {
+    "MetaStable2TokenAuraVault": MetaStable2TokenAuraVault,
+    "Boosted3TokenAuraVault": Boosted3TokenAuraVault
+}
+DEFAULT_POLL_INTERVAL_SECONDS = 3600
+# Used until a reinvestment has been executed for the vault
+DEFAULT_REINVEST_GAS = 800_000
+
+TRADE_PARAMS = "(uint16,uint8,uint256,bool,bytes)"
+SINGLE_SIDED_REWARD_TRADE_PARAMS = "(address,address,uint256,{})".format(TRADE_PARAMS)
+PROPORTIONAL_2TOKEN_REWARD_TRADE_PARAMS = "({},{})".format(
+    SINGLE_SIDED_REWARD_TRADE_PARAMS, SINGLE_SIDED_REWARD_TRADE_PARAMS
+)
+
+def get_route_params(routes, sellToken, buyToken):
+    route = routes["{}:{}".format(sellToken, buyToken).lower()]
+    return [
+        DEX_ID[route["dex"]],
+        TRADE_TYPE[route["tradeType"]],
+        int(route["slippage"]),
+        route["unwrap"],
+        bytes.fromhex(route.get("exchangeData", "0x")[2:])
+    ]
+
+def get_reinvest_params(vault, ctx, routes, rewardAmounts):
+    """
+    Builds reinvestRewardBatch params selling every reward token in rewardAmounts. Boosted vaults sell
+    into the primary underlying, two token vaults split each trade in proportion to the pool balances.
+    """
+    (_, primaryToken, _) = get_vault_tokens(vault, ctx)
+    trade = lambda sellToken, buyToken, amount: [
+        sellToken, buyToken, amount, get_route_params(routes, sellToken, buyToken)
+    ]
+
+    if "underlyingPools" in ctx["oracleContext"]:
+        trades = [trade(token, primaryToken, amount) for (token, amount) in rewardAmounts.items()]
+        return [eth_abi.encode_abi(["{}[]".format(SINGLE_SIDED_REWARD_TRADE_PARAMS)], [trades]), 0]
+
+    basePool = ctx["poolContext"]["basePool"]
+    primaryBalance = basePool["primaryBalance"]
+    totalBalance = primaryBalance + basePool["secondaryBalance"]
+    trades = []
+    for (token, amount) in rewardAmounts.items():
+        primaryAmount = amount * primaryBalance // totalBalance
+        trades.append([
+            trade(token, basePool["primaryToken"], primaryAmount),
+            trade(token, basePool["secondaryToken"], amount - primaryAmount)
+        ])
+    return [eth_abi.encode_abi(["{}[]".format(PROPORTIONAL_2TOKEN_REWARD_TRADE_PARAMS)], [trades]), 0]
+
+class ReinvestScheduler:
+    def __init__(self, tradingModule, account, routes) -> None:
+        self.tradingModule = tradingModule
+        self.account = account
+        self.routes = {k.lower(): v for (k, v) in routes.items()}
+        # Observed gas used by reinvestments, keyed by vault address
+        self.reinvestGas = {}
+
+    def get_claimable(self, vault, rewardTokens):
+        claimed = vault.claimRewardTokens.call({"from": self.account})
+        return {
+            token: interface.IERC20(token).balanceOf(vault.address) + amount
+            for (token, amount) in zip(rewardTokens, claimed)
+        }
+
+    def plan(self, vault, vaultConfig, gasPrice, prices=None):
+        """
+        Returns a dict with the claimable rewards, their value, the estimated gas cost and the reinvest
+        params, shouldReinvest is set if the net yield exceeds the vault's threshold. Prices are cached
+        in the prices dict so that vaults sharing reward tokens only read each oracle once.
+        """
+        prices = {} if prices == None else prices
+        ctx = vault.getStrategyContext()
+        (_, quoteToken, _) = get_vault_tokens(vault, ctx)
+        rewardTokens = list(ctx["stakingContext"]["rewardTokens"])
+        claimable = self.get_claimable(vault, rewardTokens)
+
+        # Two token vaults buy both pool tokens with each reward token
+        buyTokens = [quoteToken] if "underlyingPools" in ctx["oracleContext"] else [
+            ctx["poolContext"]["basePool"]["primaryToken"], ctx["poolContext"]["basePool"]["secondaryToken"]
+        ]
+
+        # Reward tokens without an oracle or a route cannot be sold by the trading module
+        rewardAmounts = {}
+        rewardValue = 0
+        for (token, amount) in claimable.items():
+            key = (token, quoteToken)
+            if key not in prices:
+                prices[key] = get_oracle_value(self.tradingModule, token, 10**get_token_decimals(token), quoteToken)
+            hasRoutes = all("{}:{}".format(token, buyToken).lower() in self.routes for buyToken in buyTokens)
+            if amount == 0 or prices[key] == None or not hasRoutes:
+                continue
+            rewardAmounts[token] = amount
+            rewardValue += amount * prices[key] // 10**get_token_decimals(token)
+
+        gas = vault.claimRewardTokens.estimate_gas({"from": self.account}) + self.reinvestGas.get(
+            vault.address, vaultConfig.get("reinvestGas", DEFAULT_REINVEST_GAS)
+        )
+        gasCost = get_gas_cost(self.tradingModule, gas, gasPrice, quoteToken)
+        netYield = rewardValue - gasCost
+
+        return {
+            "vault": vault.address,
+            "rewardAmounts": rewardAmounts,
+            "rewardValue": rewardValue,
+            "gas": gas,
+            "gasCost": gasCost,
+            "netYield": netYield,
+            "shouldReinvest": len(rewardAmounts) > 0 and netYield >= vaultConfig.get("minNetYield", 0),
+            "params": get_reinvest_params(vault, ctx, self.routes, rewardAmounts) if len(rewardAmounts) > 0 else None
+        }
+
+    def execute(self, vault, plan):
+        vault.claimRewardTokens({"from": self.account})
+        # All reward tokens are sold before a single pool join
+        txn = vault.reinvestRewardBatch(plan["params"], {"from": self.account})
+        self.reinvestGas[vault.address] = txn.gas_used
+        return txn
+
+    def run_once(self, vaults, gasPrice):
+        """
+        Plans every vault against the same oracle prices and reinvests the vaults that pass their
+        threshold. vaults is a list of (vault, vaultConfig).
+        """
+        prices = {}
+        plans = []
+        for (vault, vaultConfig) in vaults:
+            try:
+                plan = self.plan(vault, vaultConfig, gasPrice, prices)
+            except (VirtualMachineError, ValueError) as e:
+                print("{} plan failed: {}".format(vault.address, e))
+                continue
+            plans.append(plan)
+
+            if plan["shouldReinvest"]:
+                try:
+                    txn = self.execute(vault, plan)
+                    print("{} reinvested {} net yield {} in {}".format(
+                        vault.address, plan["rewardValue"], plan["netYield"], txn.txid
+                    ))
+                except (VirtualMachineError, ValueError) as e:
+                    print("{} reinvest failed: {}".format(vault.address, e))
+            else:
+                print("{} skipped, reward value {} gas cost {}".format(
+                    vault.address, plan["rewardValue"], plan["gasCost"]
+                ))
+        return plans
+
+def main():
+    with open(os.environ["SCHEDULER_CONFIG"], "r") as f:
+        config = json.load(f)
+    account = accounts.load(config["account"])
+    tradingModule = interface.ITradingModule(config["tradingModule"])
+    scheduler = ReinvestScheduler(tradingModule, account, config["routes"])
+    vaults = [
+        (Contract.from_abi(v["contract"], v["address"], VAULT_CONTRACTS[v["contract"]].abi), v)
+        for v in config["vaults"]
+    ]
+
+    while True:
+        scheduler.run_once(vaults, web3.eth.gas_price)
+        time.sleep(config.get("pollIntervalSeconds", DEFAULT_POLL_INTERVAL_SECONDS))
@@ -0,0 +1,255 @@
+import json
+import os
+from multiprocessing import Pool
+import numpy as np
+from brownie import interface, Contract, MetaStable2TokenAuraVault, Boosted3TokenAuraVault
+from scripts.common import get_token_decimals
+from scripts.liquidation_scanner import get_vault_accounts
+from scripts.vault_lens import get_vault_tokens
+
+# Monte Carlo simulation of vault account liquidations under correlated price paths of the pool
+# tokens against each vault's primary token. Account values are the strategy token value at the
+# start of the simulation scaled by the price moves of the pool tokens weighted by their share of
+# the pool. Debt is valued at par.
+#
+# Configuration is read from the JSON file at RISK_CONFIG:
+# {
+#     "notional": "0x...",
+#     "fromBlock": 15000000,               # block to start reading vault entries from
+#     "vaults": [{
+#         "address": "0x...",
+#         "contract": "MetaStable2TokenAuraVault"
+#     }],
+#     # Price of each token in the primary token of the vaults that hold it, annualized volatility
+#     "assets": {"0xae7a...": 0.05, "0xa0b8...": 0.01, "0xdac1...": 0.01},
+#     "correlations": [[1, 0, 0], [0, 1, 0.8], [0, 0.8, 1]],   # in the order of assets
+#     "horizonDays": 30,
+#     "stepsPerDay": 1,
+#     "paths": 100000,
+#     "pathsPerChunk": 500,
+#     "processes": 8,
+#     "percentiles": [50, 90, 95, 99, 99.9]
+# }
+
+DEFAULT_HORIZON_DAYS = 30
+DEFAULT_STEPS_PER_DAY = 1
+DEFAULT_PATHS = 100_000
+DEFAULT_PATHS_PER_CHUNK = 500
+DEFAULT_PERCENTILES = [50, 90, 95, 99, 99.9]
+INTERNAL_TOKEN_PRECISION = 10**8
+RATE_PRECISION = 10**9
+
+def get_risk_params(vaultConfig):
+    """
+    Returns (minCollateralRatio, liquidationRate, maxDeleverageCollateralRatio) as decimals from the
+    vault config returned by notional.getVaultConfig, where all three are in rate precision
+    """
+    return (
+        vaultConfig["minCollateralRatio"] / RATE_PRECISION,
+        vaultConfig["liquidationRate"] / RATE_PRECISION,
+        vaultConfig["maxDeleverageCollateralRatio"] / RATE_PRECISION
+    )
+
+def get_pool_weights(ctx):
+    """
+    Returns (tokens, weights), the share of each pool token in the pool using scaled balances.
+    Boosted pools are weighted by the linear pool BPT held for each main token.
+    """
+    (_, primaryToken, baseTokens) = get_vault_tokens(None, ctx)
+    poolContext = ctx["poolContext"]
+    if "underlyingPools" in ctx["oracleContext"]:
+        basePool = poolContext["basePool"]["basePool"]
+        balances = [
+            basePool["primaryBalance"] * poolContext["primaryScaleFactor"],
+            basePool["secondaryBalance"] * poolContext["secondaryScaleFactor"],
+            poolContext["basePool"]["tertiaryBalance"] * poolContext["tertiaryScaleFactor"]
+        ]
+    else:
+        basePool = poolContext["basePool"]
+        balances = [
+            basePool["primaryBalance"] * poolContext["primaryScaleFactor"],
+            basePool["secondaryBalance"] * poolContext["secondaryScaleFactor"]
+        ]
+    total = sum(balances)
+    return ([primaryToken] + list(baseTokens), [b / total for b in balances])
+
+def get_book(notional, vault, vaultAccounts):
+    """
+    Returns the accounts of a vault with their strategy token value and debt in primary precision
+    """
+    ctx = vault.getStrategyContext()
+    (_, primaryToken, _) = get_vault_tokens(vault, ctx)
+    primaryPrecision = 10**get_token_decimals(primaryToken)
+
+    values = []
+    debts = []
+    valuePerVaultShare = {}
+    for account in vaultAccounts:
+        vaultAccount = notional.getVaultAccount(account, vault.address)
+        maturity = vaultAccount["maturity"]
+        if vaultAccount["vaultShares"] == 0 or vaultAccount["fCash"] >= 0:
+            continue
+        # Every account in a maturity holds the same strategy tokens per vault share
+        if maturity not in valuePerVaultShare:
+            vaultState = notional.getVaultState(vault.address, maturity)
+            strategyTokens = INTERNAL_TOKEN_PRECISION * vaultState["totalStrategyTokens"] // vaultState["totalVaultShares"]
+            valuePerVaultShare[maturity] = vault.convertStrategyToUnderlying(account, strategyTokens, maturity)
+        values.append(vaultAccount["vaultShares"] * valuePerVaultShare[maturity] / INTERNAL_TOKEN_PRECISION)
+        debts.append(-vaultAccount["fCash"] * primaryPrecision / INTERNAL_TOKEN_PRECISION)
+
+    (tokens, weights) = get_pool_weights(ctx)
+    return {
+        "vault": vault.address,
+        "tokens": tokens,
+        "weights": weights,
+        "values": values,
+        "debts": debts
+    }
+
+def get_model(books, riskParams, assets):
+    """
+    Flattens the books into per account arrays. exposures has one row per vault and one column per
+    asset plus a leading column for the primary token, whose price against itself is constant.
+    """
+    assetIndex = {a.lower(): i + 1 for (i, a) in enumerate(assets)}
+    exposures = np.zeros((len(books), len(assets) + 1))
+    for (v, book) in enumerate(books):
+        exposures[v, 0] = book["weights"][0]
+        for (token, weight) in zip(book["tokens"][1:], book["weights"][1:]):
+            # Tokens without a configured asset keep their starting price
+            exposures[v, assetIndex.get(token.lower(), 0)] += weight
+
+    vaultIndex = np.concatenate([np.full(len(b["values"]), v, dtype=np.int64) for (v, b) in enumerate(books)])
+    return {
+        "exposures": exposures,
+        "vaultIndex": vaultIndex,
+        "values": np.concatenate([np.array(b["values"], dtype=np.float64) for b in books]),
+        "debts": np.concatenate([np.array(b["debts"], dtype=np.float64) for b in books]),
+        "minCollateralRatio": np.array([riskParams[v][0] for v in range(len(books))])[vaultIndex],
+        "liquidationRate": np.array([riskParams[v][1] for v in range(len(books))])[vaultIndex],
+        "maxDeleverageCollateralRatio": np.array([riskParams[v][2] for v in range(len(books))])[vaultIndex]
+    }
+
+def get_deposit_amount(values, debts, liquidationRate, maxDeleverageCollateralRatio):
+    """
+    Deposit required to bring the account back to maxDeleverageCollateralRatio, where the liquidator
+    repays debt and receives vault shares worth the deposit times liquidationRate. Capped at the debt
+    and at the vault shares available to the liquidator.
+    """
+    deposit = (debts * (1 + maxDeleverageCollateralRatio) - values) / (1 + maxDeleverageCollateralRatio - liquidationRate)
+    return np.clip(deposit, 0, np.minimum(debts, values / liquidationRate))
+
+def simulate_chunk(args):
+    """
+    Simulates a chunk of paths and returns (liquidationVolume, liquidatedAccounts), the deposit required
+    to liquidate every account that falls below the min collateral ratio per path and vault, and the
+    number of accounts liquidated per path. Accounts are liquidated at most once per path.
+    """
+    (model, vols, correlations, horizonDays, stepsPerDay, paths, seed) = args
+    rng = np.random.default_rng(seed)
+    steps = horizonDays * stepsPerDay
+    dt = 1 / (365 * stepsPerDay)
+    cholesky = np.linalg.cholesky(correlations)
+    vaultIndex = model["vaultIndex"]
+    numVaults = model["exposures"].shape[0]
+    # An account is liquidated the first time its vault's pool claim value falls below this
+    # share of the starting value, i.e. when values / debts - 1 < minCollateralRatio
+    criticalFactors = model["debts"] * (1 + model["minCollateralRatio"]) / model["values"]
+
+    logPrices = np.zeros((paths, len(vols)))
+    prices = np.ones((paths, len(vols) + 1))
+    # Lowest value of each vault's pool claim so far, accounts above it have not been liquidated
+    minFactors = np.ones((paths, numVaults))
+    # Accounts already below the min collateral ratio are liquidated at the starting value on every path
+    (a,) = np.nonzero(criticalFactors > 1)
+    startingDeposits = get_deposit_amount(
+        model["values"][a], model["debts"][a], model["liquidationRate"][a], model["maxDeleverageCollateralRatio"][a]
+    )
+    liquidationVolume = np.tile(np.bincount(vaultIndex[a], weights=startingDeposits, minlength=numVaults), (paths, 1))
+    for _ in range(steps):
+        shocks = rng.standard_normal((paths, len(vols))) @ cholesky.T
+        logPrices += shocks * vols * np.sqrt(dt) - 0.5 * vols**2 * dt
+        prices[:, 1:] = np.exp(logPrices)
+
+        # (paths, vaults) value of the pool claim relative to the start
+        vaultFactors = prices @ model["exposures"].T
+        # Only paths where a vault reaches a new low can liquidate new accounts
+        newLowPaths = np.flatnonzero((vaultFactors < minFactors).any(axis=1))
+        if len(newLowPaths) > 0:
+            accountFactors = vaultFactors[newLowPaths][:, vaultIndex]
+            previousMin = minFactors[newLowPaths][:, vaultIndex]
+            (p, a) = np.nonzero((accountFactors < criticalFactors) & (previousMin >= criticalFactors))
+            deposits = get_deposit_amount(
+                accountFactors[p, a] * model["values"][a],
+                model["debts"][a],
+                model["liquidationRate"][a],
+                model["maxDeleverageCollateralRatio"][a]
+            )
+            liquidationVolume[newLowPaths] += np.bincount(
+                p * numVaults + vaultIndex[a], weights=deposits, minlength=len(newLowPaths) * numVaults
+            ).reshape(len(newLowPaths), numVaults)
+        np.minimum(minFactors, vaultFactors, out=minFactors)
+
+    liquidatedAccounts = (minFactors[:, vaultIndex] < criticalFactors).sum(axis=1)
+    return (liquidationVolume, liquidatedAccounts)
+
+def run_simulation(model, vols, correlations, horizonDays=DEFAULT_HORIZON_DAYS, stepsPerDay=DEFAULT_STEPS_PER_DAY,
+    paths=DEFAULT_PATHS, pathsPerChunk=DEFAULT_PATHS_PER_CHUNK, processes=None, seed=None):
+    """
+    Returns (liquidationVolume, liquidatedAccounts) for every path, chunks of paths are simulated in
+    separate processes with independent random streams
+    """
+    vols = np.array(vols, dtype=np.float64)
+    correlations = np.array(correlations, dtype=np.float64)
+    chunks = [min(pathsPerChunk, paths - i) for i in range(0, paths, pathsPerChunk)]
+    seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+    tasks = [(model, vols, correlations, horizonDays, stepsPerDay, n, s) for (n, s) in zip(chunks, seeds)]
+    with Pool(processes) as pool:
+        results = pool.map(simulate_chunk, tasks)
+    return (
+        np.concatenate([r[0] for r in results]),
+        np.concatenate([r[1] for r in results])
+    )
+
+def get_percentiles(liquidationVolume, liquidatedAccounts, percentiles=DEFAULT_PERCENTILES):
+    return {
+        # Per vault in primary precision
+        "liquidationVolume": np.percentile(liquidationVolume, percentiles, axis=0).T.tolist(),
+        "liquidatedAccounts": np.percentile(liquidatedAccounts, percentiles).tolist(),
+        "liquidationProbability": float((liquidatedAccounts > 0).mean()),
+        "percentiles": percentiles
+    }
+
+def main():
+    with open(os.environ["RISK_CONFIG"], "r") as f:
+        config = json.load(f)
+    notional = interface.NotionalProxy(config["notional"])
+    vaultContracts = {
+        "MetaStable2TokenAuraVault": MetaStable2TokenAuraVault,
+        "Boosted3TokenAuraVault": Boosted3TokenAuraVault
+    }
+
+    books = []
+    riskParams = []
+    for v in config["vaults"]:
+        vault = Contract.from_abi(v["contract"], v["address"], vaultContracts[v["contract"]].abi)
+        vaultAccounts = get_vault_accounts(notional, vault.address, config["fromBlock"])
+        books.append(get_book(notional, vault, vaultAccounts))
+        riskParams.append(get_risk_params(notional.getVaultConfig(vault.address)))
+        print("Loaded {} accounts for {}".format(len(books[-1]["values"]), vault.address))
+
+    model = get_model(books, riskParams, list(config["assets"].keys()))
+    (liquidationVolume, liquidatedAccounts) = run_simulation(
+        model,
+        list(config["assets"].values()),
+        config["correlations"],
+        config.get("horizonDays", DEFAULT_HORIZON_DAYS),
+        config.get("stepsPerDay", DEFAULT_STEPS_PER_DAY),
+        config.get("paths", DEFAULT_PATHS),
+        config.get("pathsPerChunk", DEFAULT_PATHS_PER_CHUNK),
+        config.get("processes")
+    )
+    results = get_percentiles(liquidationVolume, liquidatedAccounts, config.get("percentiles", DEFAULT_PERCENTILES))
+    for (book, volumes) in zip(books, results["liquidationVolume"]):
+        print("{} liquidation volume percentiles {}: {}".format(book["vault"], results["percentiles"], volumes))
+    print("Liquidated accounts percentiles {}: {}".format(results["percentiles"], results["liquidatedAccounts"]))
@@ -0,0 +1,240 @@
+import json
+import os
+from itertools import product
+from multiprocessing import Pool
+from brownie import web3, interface, Contract, MetaStable2TokenAuraVault
+from scripts.oracle_monitor import get_metastable_spot_price
+from scripts.pool_share_monitor import get_emergency_pool_claim_amount, get_pool_claim_threshold
+from scripts.stable_math import ONE, calc_out_given_in, calculate_invariant
+
+# Replays archived pool states through the off chain StableMath model to compare settlement slippage
+# limits. For each state the settlement exits the pool proportionally and sells the secondary token
+# for the primary token, the sale is modeled as a swap through the same pool after the exit. A
+# settlement reverts if the spot price is outside the oracle deviation limit or if the sale returns
+# less than the trading module limit amount for the candidate slippage.
+#
+# Only MetaStable vaults are modeled, boosted vaults exit single sided into the primary token and
+# have no secondary trade for the settlement slippage limits to apply to.
+#
+# Configuration is read from the JSON file at BACKTEST_CONFIG:
+# {
+#     "snapshots": "reports/snapshots_eth_steth.jsonl",   # written by record_snapshots
+#     # Optional, appends snapshots from an archive node before running the sweep
+#     "record": {"vault": "0x...", "tradingModule": "0x...", "fromBlock": 15500000, "toBlock": 15700000, "step": 1000},
+#     "windows": [[15500000, 15600000], [15600000, 15700000]],
+#     "slippageLimits": [1e6, 2e6, 5e6],                   # in SLIPPAGE_LIMIT_PRECISION
+#     "actions": ["normal", "postMaturity", "emergency"],
+#     "maturityShare": 0.5,                                # share of the vault held in the settled maturity
+#     "normalChunkPercent": 10,                            # percent of the maturity settled per normal settlement
+#     "processes": 8,
+#     "output": "reports/settlement_backtest.json"
+# }
+
+SLIPPAGE_LIMIT_PRECISION = 10**8
+VAULT_PERCENT_BASIS = 10**4
+DEFAULT_MATURITY_SHARE = 0.5
+DEFAULT_NORMAL_CHUNK_PERCENT = 10
+
+NORMAL = "normal"
+POST_MATURITY = "postMaturity"
+EMERGENCY = "emergency"
+
+INVALID_PRICE = "InvalidPrice"
+TRADE_LIMIT = "TradeLimit"
+DID_NOT_CONVERGE = "DidNotConverge"
+
+def record_snapshot(vault, tradingModule, block):
+    ctx = vault.getStrategyContext(block_identifier=block)
+    basePool = ctx["poolContext"]["basePool"]
+    baseStrategy = ctx["baseStrategy"]
+    precision = baseStrategy["poolClaimPrecision"]
+    # Pair price checked by the vault and the price used by the trading module for the secondary sale
+    (pairRate, pairDecimals) = tradingModule.getOraclePrice(basePool["primaryToken"], basePool["secondaryToken"], block_identifier=block)
+    (tradeRate, tradeDecimals) = tradingModule.getOraclePrice(basePool["secondaryToken"], basePool["primaryToken"], block_identifier=block)
+    return {
+        "blockNumber": block,
+        "timestamp": web3.eth.get_block(block)["timestamp"],
+        "poolContext": {
+            "basePool": {
+                "primaryBalance": basePool["primaryBalance"],
+                "secondaryBalance": basePool["secondaryBalance"],
+                "primaryDecimals": basePool["primaryDecimals"],
+                "secondaryDecimals": basePool["secondaryDecimals"]
+            },
+            "primaryScaleFactor": ctx["poolContext"]["primaryScaleFactor"],
+            "secondaryScaleFactor": ctx["poolContext"]["secondaryScaleFactor"]
+        },
+        "oracleContext": {
+            "ampParam": ctx["oracleContext"]["ampParam"]
+        },
+        "totalSupply": interface.IERC20(basePool["poolToken"]).totalSupply(block_identifier=block),
+        "swapFeePercentage": interface.IBalancerPool(basePool["poolToken"]).getSwapFeePercentage(block_identifier=block),
+        "oraclePrice": pairRate * precision // pairDecimals,
+        "tradeOraclePrice": tradeRate,
+        "tradeOracleDecimals": tradeDecimals,
+        "poolClaimPrecision": precision,
+        "oraclePriceDeviationLimitPercent": baseStrategy["vaultSettings"]["oraclePriceDeviationLimitPercent"],
+        "maxPoolShare": baseStrategy["vaultSettings"]["maxPoolShare"],
+        "totalPoolClaim": baseStrategy["vaultState"]["totalPoolClaim"]
+    }
+
+def record_snapshots(vault, tradingModule, fromBlock, toBlock, step, path):
+    """
+    Appends a snapshot every step blocks to the JSON lines file at path, requires an archive node
+    """
+    with open(path, "a") as f:
+        for block in range(fromBlock, toBlock, step):
+            f.write(json.dumps(record_snapshot(vault, tradingModule, block)) + "\n")
+
+def load_snapshots(path):
+    with open(path, "r") as f:
+        return [json.loads(line) for line in f if line.strip() != ""]
+
+def get_settlement_pool_claim(snapshot, action, maturityShare, normalChunkPercent):
+    """
+    Returns the pool claim settled by the action, None if the vault is not eligible for emergency settlement
+    """
+    poolClaimInMaturity = int(snapshot["totalPoolClaim"] * maturityShare)
+    if action == NORMAL:
+        return poolClaimInMaturity * normalChunkPercent // 100
+    if action == POST_MATURITY:
+        return poolClaimInMaturity
+
+    threshold = get_pool_claim_threshold(snapshot["totalSupply"], snapshot["maxPoolShare"])
+    if snapshot["totalPoolClaim"] <= threshold:
+        return None
+    return get_emergency_pool_claim_amount(
+        snapshot["totalSupply"], snapshot["maxPoolShare"], snapshot["totalPoolClaim"], poolClaimInMaturity
+    )
+
+def simulate_settlement(snapshot, poolClaim, slippageLimit):
+    """
+    Returns (revertReason, expectedPrimary, primaryReceived), revertReason is None if the settlement passes.
+    expectedPrimary values the exit at the oracle price as the vault does for the settlement surplus check.
+    """
+    basePool = snapshot["poolContext"]["basePool"]
+    primaryScaleFactor = snapshot["poolContext"]["primaryScaleFactor"]
+    secondaryScaleFactor = snapshot["poolContext"]["secondaryScaleFactor"]
+    oraclePrice = snapshot["oraclePrice"]
+    precision = snapshot["poolClaimPrecision"]
+
+    spotPrice = get_metastable_spot_price(snapshot)
+    if spotPrice == None:
+        return (DID_NOT_CONVERGE, 0, 0)
+    # Matches StrategyUtils._checkPriceLimit
+    deviationLimit = snapshot["oraclePriceDeviationLimitPercent"]
+    lowerLimit = oraclePrice * (VAULT_PERCENT_BASIS - deviationLimit) // VAULT_PERCENT_BASIS
+    upperLimit = oraclePrice * (VAULT_PERCENT_BASIS + deviationLimit) // VAULT_PERCENT_BASIS
+    if spotPrice < lowerLimit or upperLimit < spotPrice:
+        return (INVALID_PRICE, 0, 0)
+
+    # Proportional exit
+    primaryExited = basePool["primaryBalance"] * poolClaim // snapshot["totalSupply"]
+    secondaryExited = basePool["secondaryBalance"] * poolClaim // snapshot["totalSupply"]
+    secondaryInPrimary = secondaryExited * precision // oraclePrice
+    expectedPrimary = (primaryExited + secondaryInPrimary) * 10**basePool["primaryDecimals"] // precision
+
+    # Secondary sale through the pool after the exit, fees are taken from the amount in
+    balances = [
+        (basePool["primaryBalance"] - primaryExited) * primaryScaleFactor // ONE,
+        (basePool["secondaryBalance"] - secondaryExited) * secondaryScaleFactor // ONE
+    ]
+    (invariant, _) = calculate_invariant(snapshot["oracleContext"]["ampParam"], balances, True)
+    fee = (secondaryExited * snapshot["swapFeePercentage"] + ONE - 1) // ONE
+    amountIn = (secondaryExited - fee) * secondaryScaleFactor // ONE
+    (amountOut, _) = (None, 0) if invariant == None else calc_out_given_in(
+        snapshot["oracleContext"]["ampParam"], balances, 1, 0, amountIn, invariant
+    )
+    if amountOut == None:
+        return (DID_NOT_CONVERGE, expectedPrimary, 0)
+    primaryPurchased = amountOut * ONE // primaryScaleFactor
+
+    # Matches TradingUtils._getLimitAmount for exact in trades
+    tradeOraclePrice = snapshot["tradeOraclePrice"]
+    limitAmount = (
+        (tradeOraclePrice - tradeOraclePrice * int(slippageLimit) // SLIPPAGE_LIMIT_PRECISION) * secondaryExited
+        // snapshot["tradeOracleDecimals"]
+    ) * 10**basePool["primaryDecimals"] // 10**basePool["secondaryDecimals"]
+    if primaryPurchased < limitAmount:
+        return (TRADE_LIMIT, expectedPrimary, 0)
+
+    return (None, expectedPrimary, primaryExited + primaryPurchased)
+
+def run_window(args):
+    (snapshots, window, action, slippageLimit, maturityShare, normalChunkPercent) = args
+    settlements = 0
+    reverts = {}
+    valueLost = 0
+    valueLostPercent = []
+    for snapshot in snapshots:
+        if not window[0] <= snapshot["blockNumber"] < window[1]:
+            continue
+        poolClaim = get_settlement_pool_claim(snapshot, action, maturityShare, normalChunkPercent)
+        if poolClaim == None or poolClaim == 0:
+            continue
+
+        settlements += 1
+        (revertReason, expectedPrimary, primaryReceived) = simulate_settlement(snapshot, poolClaim, slippageLimit)
+        if revertReason != None:
+            reverts[revertReason] = reverts.get(revertReason, 0) + 1
+            continue
+        valueLost += expectedPrimary - primaryReceived
+        valueLostPercent.append((expectedPrimary - primaryReceived) * 100 / expectedPrimary)
+
+    revertCount = sum(reverts.values())
+    return {
+        "window": window,
+        "action": action,
+        "slippageLimit": slippageLimit,
+        "settlements": settlements,
+        "reverts": reverts,
+        "revertRate": revertCount / settlements if settlements > 0 else None,
+        # In primary token precision, summed over settlements that pass
+        "valueLost": valueLost,
+        "meanValueLostPercent": sum(valueLostPercent) / len(valueLostPercent) if len(valueLostPercent) > 0 else None,
+        "maxValueLostPercent": max(valueLostPercent, default=None)
+    }
+
+def run_sweep(snapshots, windows, slippageLimits, actions, maturityShare=DEFAULT_MATURITY_SHARE,
+    normalChunkPercent=DEFAULT_NORMAL_CHUNK_PERCENT, processes=None):
+    """
+    Runs every window, action and slippage limit in a separate task. Snapshots are split by window
+    before they are sent to the worker processes.
+    """
+    tasks = []
+    for (window, action, slippageLimit) in product(windows, actions, slippageLimits):
+        windowSnapshots = [s for s in snapshots if window[0] <= s["blockNumber"] < window[1]]
+        tasks.append((windowSnapshots, window, action, slippageLimit, maturityShare, normalChunkPercent))
+    with Pool(processes) as pool:
+        return pool.map(run_window, tasks)
+
+def main():
+    with open(os.environ["BACKTEST_CONFIG"], "r") as f:
+        config = json.load(f)
+    if "record" in config:
+        record = config["record"]
+        vault = Contract.from_abi("MetaStable2TokenAuraVault", record["vault"], MetaStable2TokenAuraVault.abi)
+        record_snapshots(
+            vault,
+            interface.ITradingModule(record["tradingModule"]),
+            record["fromBlock"],
+            record["toBlock"],
+            record["step"],
+            config["snapshots"]
+        )
+
+    results = run_sweep(
+        load_snapshots(config["snapshots"]),
+        config["windows"],
+        config["slippageLimits"],
+        config.get("actions", [NORMAL, POST_MATURITY, EMERGENCY]),
+        config.get("maturityShare", DEFAULT_MATURITY_SHARE),
+        config.get("normalChunkPercent", DEFAULT_NORMAL_CHUNK_PERCENT),
+        config.get("processes")
+    )
+    with open(config["output"], "w") as f:
+        json.dump(results, f, indent=4)
+    for r in results:
+        print("{} {} slippage {}: {} settlements, revert rate {}, mean value lost {}%".format(
+            r["window"], r["action"], r["slippageLimit"], r["settlements"], r["revertRate"], r["meanValueLostPercent"]
+        ))
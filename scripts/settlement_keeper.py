@@ -0,0 +1,221 @@
+import asyncio
+import json
+import os
+from brownie import accounts, chain, network, web3, interface, Contract, MetaStable2TokenAuraVault, Boosted3TokenAuraVault
+from brownie.exceptions import VirtualMachineError
+from scripts.common import (
+    get_all_active_maturities,
+    get_all_past_maturities,
+    get_redeem_params_from_config
+)
+
+# Long running settlement keeper. Every vault is polled in its own task, settlement calls are
+# simulated with eth_call and only chunks that pass are submitted.
+#
+# Configuration is read from the JSON file at KEEPER_CONFIG:
+# {
+#     "notional": "0x...",
+#     "account": "KEEPER",                 # brownie account id, loaded with accounts.load
+#     "pollIntervalSeconds": 60,
+#     "vaults": [{
+#         "address": "0x...",
+#         "contract": "MetaStable2TokenAuraVault",
+#         # Secondary trade used to sell non primary tokens on redemption
+#         "trade": {"dex": "CURVE", "tradeType": "EXACT_IN_SINGLE", "slippage": 5e6, "unwrap": true, "exchangeData": "0x"}
+#     }]
+# }
+
+VAULT_CONTRACTS = {
+    "MetaStable2TokenAuraVault": MetaStable2TokenAuraVault,
+    "Boosted3TokenAuraVault": Boosted3TokenAuraVault
+}
+DEFAULT_POLL_INTERVAL_SECONDS = 60
+# Chunks are halved after a failed simulation until they fall below this share of the maturity
+MIN_CHUNK_PERCENT = 0.01
+
+NORMAL = "normal"
+POST_MATURITY = "postMaturity"
+EMERGENCY = "emergency"
+
+def get_settlement_action(now, maturity, vaultState, settlementPeriod, lastSettlement, coolDownInSeconds):
+    """
+    Returns (action, readyAt) for a maturity, action is None if the maturity does not need settlement.
+    Normal settlement happens inside the settlement window and is rate limited by the cool down,
+    post maturity settlement happens any time after maturity.
+    """
+    if vaultState["isSettled"] or vaultState["totalStrategyTokens"] == 0:
+        return (None, None)
+    if now >= maturity:
+        return (POST_MATURITY, now)
+
+    windowStart = maturity - settlementPeriod
+    return (NORMAL, max(windowStart, lastSettlement + coolDownInSeconds))
+
+class NonceManager:
+    """
+    Hands out sequential nonces to concurrent vault tasks so that transactions from the same
+    account can be submitted without waiting for each other to be mined
+    """
+    def __init__(self, account) -> None:
+        self.account = account
+        self.lock = asyncio.Lock()
+        self.nonce = None
+
+    async def next(self):
+        async with self.lock:
+            if self.nonce == None:
+                self.nonce = await asyncio.to_thread(lambda: self.account.nonce)
+            nonce = self.nonce
+            self.nonce += 1
+            return nonce
+
+    async def reset(self, nonce):
+        """
+        Called after a failed submission with the nonce it was given. Other tasks may already hold
+        later nonces, so the counter is only moved back when the failed transaction never reached
+        the mempool and left a gap at the account's pending nonce.
+        """
+        async with self.lock:
+            pending = await asyncio.to_thread(
+                lambda: web3.eth.get_transaction_count(self.account.address, "pending")
+            )
+            if pending <= nonce:
+                # Never broadcast, the next submission fills the gap
+                self.nonce = pending
+
+class VaultKeeper:
+    def __init__(self, notional, vault, account, nonces, redeemParams) -> None:
+        self.notional = notional
+        self.vault = vault
+        self.account = account
+        self.nonces = nonces
+        self.redeemParams = redeemParams
+        self.currencyId = notional.getVaultConfig(vault.address)["borrowCurrencyId"]
+
+    def get_pending_settlements(self, now):
+        """
+        Returns a list of (action, maturity, readyAt, strategyTokens) for every maturity that needs settlement
+        """
+        baseStrategy = self.vault.getStrategyContext()["baseStrategy"]
+        settlementPeriod = baseStrategy["settlementPeriodInSeconds"]
+        lastSettlement = baseStrategy["vaultState"]["lastSettlementTimestamp"]
+        coolDownInSeconds = baseStrategy["vaultSettings"]["settlementCoolDownInMinutes"] * 60
+
+        pending = []
+        activeMaturities = get_all_active_maturities(self.notional, self.currencyId)
+        for maturity in get_all_past_maturities(self.notional, self.currencyId) + activeMaturities:
+            vaultState = self.notional.getVaultState(self.vault.address, maturity)
+            (action, readyAt) = get_settlement_action(
+                now, maturity, vaultState, settlementPeriod, lastSettlement, coolDownInSeconds
+            )
+            if action == NORMAL and now < maturity - settlementPeriod and maturity in activeMaturities:
+                # Emergency settlement is only allowed outside of the settlement window
+                if self.has_emergency_settlement(maturity):
+                    (action, readyAt) = (EMERGENCY, now)
+            if action != None:
+                pending.append((action, maturity, readyAt, vaultState["totalStrategyTokens"]))
+        return pending
+
+    def has_emergency_settlement(self, maturity):
+        try:
+            return self.vault.getEmergencySettlementPoolClaimAmount(maturity) > 0
+        except (VirtualMachineError, ValueError):
+            # Reverts with InvalidEmergencySettlement while the vault is under its max pool share
+            return False
+
+    def get_settlement_call(self, action, maturity, strategyTokens):
+        if action == NORMAL:
+            return (self.vault.settleVaultNormal, [maturity, strategyTokens, self.redeemParams])
+        if action == POST_MATURITY:
+            return (self.vault.settleVaultPostMaturity, [maturity, strategyTokens, self.redeemParams])
+        # Emergency settlement amounts are calculated by the vault
+        return (self.vault.settleVaultEmergency, [maturity, self.redeemParams])
+
+    def find_passing_chunk(self, action, maturity, strategyTokens):
+        """
+        Simulates the settlement with eth_call, halving the amount until it passes. Returns the
+        amount of strategy tokens that can be settled or None if no chunk passes.
+        """
+        minChunk = max(int(strategyTokens * MIN_CHUNK_PERCENT), 1)
+        amount = strategyTokens
+        while amount >= minChunk:
+            (method, args) = self.get_settlement_call(action, maturity, amount)
+            try:
+                method.call(*args, {"from": self.account})
+                return amount
+            except (VirtualMachineError, ValueError):
+                # Emergency settlement has no amount to reduce
+                if action == EMERGENCY:
+                    return None
+                amount //= 2
+        return None
+
+    async def settle(self, action, maturity, strategyTokens):
+        amount = await asyncio.to_thread(self.find_passing_chunk, action, maturity, strategyTokens)
+        if amount == None:
+            print("{} {} settlement for {} did not pass simulation".format(self.vault.address, action, maturity))
+            return None
+
+        (method, args) = self.get_settlement_call(action, maturity, amount)
+        nonce = await self.nonces.next()
+        try:
+            txn = await asyncio.to_thread(method, *args, {"from": self.account, "nonce": nonce})
+        except (VirtualMachineError, ValueError) as e:
+            await self.nonces.reset(nonce)
+            print("{} {} settlement for {} failed: {}".format(self.vault.address, action, maturity, e))
+            return None
+
+        print("{} {} settlement for {} settled {} strategy tokens in {}".format(
+            self.vault.address, action, maturity, amount, txn.txid
+        ))
+        return txn
+
+    async def run_once(self):
+        """
+        Settles every maturity that is ready and returns the number of seconds until the next
+        maturity becomes ready, or None if nothing is pending
+        """
+        now = await asyncio.to_thread(lambda: chain.time())
+        pending = await asyncio.to_thread(self.get_pending_settlements, now)
+        nextReadyAt = None
+        settledNormal = False
+        for (action, maturity, readyAt, strategyTokens) in pending:
+            # The settlement cool down applies to the whole vault, so at most one normal settlement
+            # is submitted per run and the rest are picked up on the following run
+            if readyAt <= now and not (action == NORMAL and settledNormal):
+                txn = await self.settle(action, maturity, strategyTokens)
+                settledNormal = settledNormal or (action == NORMAL and txn != None)
+            elif nextReadyAt == None or readyAt < nextReadyAt:
+                nextReadyAt = readyAt
+        return None if nextReadyAt == None else nextReadyAt - now
+
+    async def run(self, pollIntervalSeconds):
+        while True:
+            try:
+                delay = await self.run_once()
+            except Exception as e:
+                print("{} keeper error: {}".format(self.vault.address, e))
+                delay = None
+            # Wake up at the start of the next settlement window, polling at least every interval
+            await asyncio.sleep(pollIntervalSeconds if delay == None else min(max(delay, 1), pollIntervalSeconds))
+
+def get_keepers(config, account):
+    notional = interface.NotionalProxy(config["notional"])
+    nonces = NonceManager(account)
+    keepers = []
+    for vaultConfig in config["vaults"]:
+        vaultContract = VAULT_CONTRACTS[vaultConfig["contract"]]
+        vault = Contract.from_abi(vaultConfig["contract"], vaultConfig["address"], vaultContract.abi)
+        keepers.append(VaultKeeper(notional, vault, account, nonces, get_redeem_params_from_config(vaultConfig["trade"])))
+    return keepers
+
+async def run_keepers(keepers, pollIntervalSeconds):
+    await asyncio.gather(*[keeper.run(pollIntervalSeconds) for keeper in keepers])
+
+def main():
+    with open(os.environ["KEEPER_CONFIG"], "r") as f:
+        config = json.load(f)
+    account = accounts.load(config["account"])
+    keepers = get_keepers(config, account)
+    print("Running settlement keeper for {} vaults on {}".format(len(keepers), network.show_active()))
+    asyncio.run(run_keepers(keepers, config.get("pollIntervalSeconds", DEFAULT_POLL_INTERVAL_SECONDS)))
@@ -0,0 +1,131 @@
+# Integer port of contracts/vaults/balancer/internal/math/StableMath.sol that also reports the
+# number of Newton-Raphson iterations used. Rounding matches the Solidity implementation exactly.
+
+AMP_PRECISION = 1000
+ONE = 10**18
+MAX_ITERATIONS = 255
+MAX_WARM_START_ITERATIONS = 64
+
+def div_down(a, b):
+    return a // b
+
+def div_up(a, b):
+    if a == 0:
+        return 0
+    return 1 + (a - 1) // b
+
+def div(a, b, roundUp):
+    return div_up(a, b) if roundUp else div_down(a, b)
+
+def mul_down_fixed(a, b):
+    return a * b // ONE
+
+def div_up_fixed(a, b):
+    if a == 0:
+        return 0
+    return (a * ONE - 1) // b + 1
+
+def calculate_invariant(amplificationParameter, balances, roundUp):
+    """
+    Returns (invariant, iterations), invariant is None if the calculation does not converge
+    """
+    return calculate_invariant_with_prior(amplificationParameter, balances, roundUp, 0)
+
+def calculate_invariant_with_prior(amplificationParameter, balances, roundUp, priorInvariant):
+    """
+    Returns (invariant, iterations) seeding the iteration with priorInvariant, iterations include
+    any iterations spent on the prior before restarting from the sum of balances. Only used for
+    profiling, StableMath.sol always starts from the sum of balances.
+    """
+    total = sum(balances)
+    if total == 0:
+        return (0, 0)
+
+    iterations = 0
+    if total // 2 <= priorInvariant < total:
+        (invariant, iterations) = _iterate_invariant(
+            amplificationParameter, balances, roundUp, total, priorInvariant, MAX_WARM_START_ITERATIONS
+        )
+        if invariant != None:
+            return (invariant, iterations)
+
+    (invariant, coldIterations) = _iterate_invariant(
+        amplificationParameter, balances, roundUp, total, total, MAX_ITERATIONS
+    )
+    return (invariant, iterations + coldIterations)
+
+def _iterate_invariant(amplificationParameter, balances, roundUp, total, invariant, maxIterations):
+    numTokens = len(balances)
+    ampTimesTotal = amplificationParameter * numTokens
+
+    for i in range(maxIterations):
+        P_D = balances[0] * numTokens
+        for j in range(1, numTokens):
+            P_D = div(P_D * balances[j] * numTokens, invariant, roundUp)
+        prevInvariant = invariant
+        invariant = div(
+            numTokens * invariant * invariant + div(ampTimesTotal * total * P_D, AMP_PRECISION, roundUp),
+            (numTokens + 1) * invariant + div((ampTimesTotal - AMP_PRECISION) * P_D, AMP_PRECISION, not roundUp),
+            roundUp
+        )
+        if abs(invariant - prevInvariant) <= 1:
+            return (invariant, i + 1)
+
+    return (None, maxIterations)
+
+def get_token_balance_given_invariant_and_all_other_balances(amplificationParameter, balances, invariant, tokenIndex):
+    """
+    Returns (tokenBalance, iterations), tokenBalance is None if the calculation does not converge
+    """
+    ampTimesTotal = amplificationParameter * len(balances)
+    total = balances[0]
+    P_D = balances[0] * len(balances)
+    for j in range(1, len(balances)):
+        P_D = div_down(P_D * balances[j] * len(balances), invariant)
+        total += balances[j]
+    total = total - balances[tokenIndex]
+
+    inv2 = invariant * invariant
+    c = div_up(inv2, ampTimesTotal * P_D) * AMP_PRECISION * balances[tokenIndex]
+    b = total + div_down(invariant, ampTimesTotal) * AMP_PRECISION
+
+    tokenBalance = div_up(inv2 + c, invariant + b)
+
+    for i in range(MAX_ITERATIONS):
+        prevTokenBalance = tokenBalance
+        denominator = tokenBalance * 2 + b - invariant
+        # FixedPoint.sub reverts on underflow
+        if denominator <= 0:
+            return (None, i + 1)
+        tokenBalance = div_up(tokenBalance * tokenBalance + c, denominator)
+        if abs(tokenBalance - prevTokenBalance) <= 1:
+            return (tokenBalance, i + 1)
+
+    return (None, MAX_ITERATIONS)
+
+def calc_spot_price(amplificationParameter, invariant, balanceX, balanceY):
+    """
+    Returns the spot price of Y in terms of X for a two token pool
+    """
+    a = amplificationParameter * 2 // AMP_PRECISION
+    b = invariant * a - invariant
+    axy2 = mul_down_fixed(a * 2 * balanceX, balanceY)
+    derivativeX = axy2 + mul_down_fixed(a * balanceY, balanceY) - mul_down_fixed(b, balanceY)
+    derivativeY = axy2 + mul_down_fixed(a * balanceX, balanceX) - mul_down_fixed(b, balanceX)
+    return div_up_fixed(derivativeX, derivativeY)
+
+def calc_out_given_in(amplificationParameter, balances, tokenIndexIn, tokenIndexOut, tokenAmountIn, invariant):
+    """
+    Returns (amountOut, iterations), amountOut is None if the calculation does not converge. Balances
+    and amounts are upscaled and the amount in is net of swap fees, as in the Solidity implementation.
+    """
+    balances = list(balances)
+    balances[tokenIndexIn] += tokenAmountIn
+    (finalBalanceOut, iterations) = get_token_balance_given_invariant_and_all_other_balances(
+        amplificationParameter, balances, invariant, tokenIndexOut
+    )
+    if finalBalanceOut == None:
+        return (None, iterations)
+    amountOut = balances[tokenIndexOut] - finalBalanceOut - 1
+    # FixedPoint.sub reverts on underflow
+    return (amountOut if amountOut >= 0 else None, iterations)
@@ -0,0 +1,108 @@
+import csv
+import json
+import os
+from brownie import accounts, MockStableMath
+from brownie.exceptions import VirtualMachineError
+from scripts.stable_math import (
+    AMP_PRECISION,
+    calculate_invariant,
+    calculate_invariant_with_prior,
+    get_token_balance_given_invariant_and_all_other_balances
+)
+
+OUTPUT_DIR = "reports"
+TOTAL_BALANCE = 1_000_000 * 10**18
+# Share of the pool held by the first token, 0.5 is a balanced pool
+IMBALANCES = [0.5, 0.6, 0.7, 0.8, 0.9, 0.95, 0.98, 0.99, 0.995, 0.999, 0.9995, 0.9999]
+AMPLIFICATIONS = [1, 5, 10, 25, 50, 100, 200, 500, 1000, 2000, 5000]
+# Size of the trade into the first token used to profile the token balance calculation
+TRADE_SIZE_PERCENT = 0.01
+# Balance drift since the prior invariant was calculated, used to profile warm started invariants
+PRIOR_DRIFT_PERCENT = 0.001
+
+def get_balances(imbalance):
+    primary = int(TOTAL_BALANCE * imbalance)
+    return [primary, TOTAL_BALANCE - primary]
+
+def measure(func, *args):
+    try:
+        (result, gasUsed) = func.call(*args)
+        return (result, gasUsed)
+    except (VirtualMachineError, ValueError):
+        # CalculationDidNotConverge
+        return (None, None)
+
+def profile_point(stableMath, amp, imbalance):
+    ampParameter = amp * AMP_PRECISION
+    balances = get_balances(imbalance)
+    (invariant, invariantIterations) = calculate_invariant(ampParameter, balances, True)
+    (_, invariantGas) = measure(stableMath.calculateInvariant, ampParameter, balances, True)
+
+    # Prior invariant from before a small trade into the second token, i.e. the pool's last invariant
+    priorBalances = [balances[0] - int(TOTAL_BALANCE * PRIOR_DRIFT_PERCENT), balances[1] + int(TOTAL_BALANCE * PRIOR_DRIFT_PERCENT)]
+    (priorInvariant, _) = calculate_invariant(ampParameter, priorBalances, True)
+    # Warm starts only exist in the integer port, iterations are compared against the cold start
+    (_, warmInvariantIterations) = calculate_invariant_with_prior(ampParameter, balances, True, priorInvariant or 0)
+
+    tokenBalanceIterations = None
+    tokenBalanceGas = None
+    if invariant != None:
+        tradeBalances = [balances[0] + int(TOTAL_BALANCE * TRADE_SIZE_PERCENT), balances[1]]
+        (_, tokenBalanceIterations) = get_token_balance_given_invariant_and_all_other_balances(
+            ampParameter, tradeBalances, invariant, 1
+        )
+        (_, tokenBalanceGas) = measure(
+            stableMath.getTokenBalanceGivenInvariantAndAllOtherBalances, ampParameter, tradeBalances, invariant, 1
+        )
+
+    return {
+        "amp": amp,
+        "imbalance": imbalance,
+        "invariantIterations": invariantIterations,
+        "invariantGas": invariantGas,
+        "invariantConverged": invariant != None,
+        "warmInvariantIterations": warmInvariantIterations,
+        "tokenBalanceIterations": tokenBalanceIterations,
+        "tokenBalanceGas": tokenBalanceGas
+    }
+
+def to_heatmap(points, key):
+    # Rows are amplification values, columns are imbalances
+    return [[points[(amp, imbalance)][key] for imbalance in IMBALANCES] for amp in AMPLIFICATIONS]
+
+def main():
+    stableMath = MockStableMath.deploy({"from": accounts[0]})
+    points = {}
+    for amp in AMPLIFICATIONS:
+        for imbalance in IMBALANCES:
+            points[(amp, imbalance)] = profile_point(stableMath, amp, imbalance)
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    with open(os.path.join(OUTPUT_DIR, "stable_math_profile.json"), "w") as f:
+        json.dump({
+            "amplifications": AMPLIFICATIONS,
+            "imbalances": IMBALANCES,
+            "tradeSizePercent": TRADE_SIZE_PERCENT,
+            "priorDriftPercent": PRIOR_DRIFT_PERCENT,
+            "invariantIterations": to_heatmap(points, "invariantIterations"),
+            "invariantGas": to_heatmap(points, "invariantGas"),
+            "warmInvariantIterations": to_heatmap(points, "warmInvariantIterations"),
+            "tokenBalanceIterations": to_heatmap(points, "tokenBalanceIterations"),
+            "tokenBalanceGas": to_heatmap(points, "tokenBalanceGas")
+        }, f, indent=4)
+
+    with open(os.path.join(OUTPUT_DIR, "stable_math_profile.csv"), "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(next(iter(points.values())).keys()))
+        writer.writeheader()
+        for point in points.values():
+            writer.writerow(point)
+
+    for (title, key) in [
+        ("Invariant gas", "invariantGas"),
+        ("Invariant iterations", "invariantIterations"),
+        ("Warm started invariant iterations", "warmInvariantIterations")
+    ]:
+        print("{} (rows: amp, columns: imbalance)".format(title))
+        print("amp".rjust(6) + "".join(str(i).rjust(8) for i in IMBALANCES))
+        for (amp, row) in zip(AMPLIFICATIONS, to_heatmap(points, key)):
+            print(str(amp).rjust(6) + "".join(str(n).rjust(8) for n in row))
@@ -0,0 +1,45 @@
+from brownie import VaultLens
+from scripts.common import get_all_past_maturities
+
+def deploy_lens(env, deployer):
+    return VaultLens.deploy(env.notional.address, env.tradingModule.address, {"from": deployer})
+
+def get_vault_tokens(vault, strategyContext):
+    """
+    Returns (numTokens, quoteToken, baseTokens) for the vault, oracle prices are quoted in the
+    primary token. Boosted pools are priced using the main tokens of the underlying linear pools.
+    """
+    oracleContext = strategyContext["oracleContext"]
+    if "underlyingPools" in oracleContext:
+        mainTokens = [pool["mainToken"] for pool in oracleContext["underlyingPools"]]
+        return (3, mainTokens[0], mainTokens[1:])
+    basePool = strategyContext["poolContext"]["basePool"]
+    return (2, basePool["primaryToken"], [basePool["secondaryToken"]])
+
+def get_vault_snapshot(lens, env, vault):
+    """
+    Returns the strategy context, vault state for every active and past maturity, emergency settlement
+    amounts, spot prices and oracle prices read in a single call at the same block
+    """
+    currencyId = env.notional.getVaultConfig(vault.address)["borrowCurrencyId"]
+    pastMaturities = get_all_past_maturities(env.notional, currencyId)
+    (numTokens, quoteToken, baseTokens) = get_vault_tokens(vault, vault.getStrategyContext())
+    snapshot = lens.getVaultSnapshot(vault.address, pastMaturities, numTokens, quoteToken, baseTokens)
+
+    return {
+        "blockNumber": snapshot["blockNumber"],
+        "blockTimestamp": snapshot["blockTimestamp"],
+        "currencyId": snapshot["currencyId"],
+        "strategyContext": vault.getStrategyContext.decode_output(snapshot["strategyContext"]),
+        "maturities": {
+            m["vaultState"]["maturity"]: {
+                "vaultState": m["vaultState"],
+                "emergencySettlementPoolClaim":
+                    m["emergencySettlementPoolClaim"] if m["hasEmergencySettlement"] else None
+            } for m in snapshot["maturities"]
+        },
+        "spotPrices": list(snapshot["spotPrices"]),
+        "oraclePrices": {
+            p["base"]: (p["answer"], p["decimals"]) for p in snapshot["oraclePrices"] if p["isValid"]
+        }
+    }
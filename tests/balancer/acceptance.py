@@ -1,7 +1,7 @@
 import math
 import pytest
 import brownie
-from brownie import ZERO_ADDRESS, accounts
+from brownie import ZERO_ADDRESS, accounts, interface
 from brownie.network.state import Chain
 from scripts.common import (
     get_updated_vault_settings, 
@@ -330,6 +330,83 @@ def post_maturity_settlement(context, depositAmount, primaryBorrowAmount, maturi
     assert pytest.approx(totalUnderlyingCash, rel=1e-2) == underlyingCashBefore
     check_invariants(env, vault, [depositor], currencyId, snapshot)
 
+def post_maturity_batch_settlement(
+    context, depositAmounts, primaryBorrowAmounts, maturityIndexes, depositors, operator, redeemParams,
+    checkFirstPoolShare=False
+):
+    env = context.env
+    notional = env.notional
+    vault = context.vault
+    currencyId = context.currencyId
+    maturities = [env.notional.getActiveMarkets(currencyId)[i][1] for i in maturityIndexes]
+    snapshot = snapshot_invariants(env, vault, currencyId)
+
+    # Vault accounts can only hold a single maturity
+    for (maturity, depositor, depositAmount, primaryBorrowAmount) in zip(
+        maturities, depositors, depositAmounts, primaryBorrowAmounts
+    ):
+        context.approve(depositor, notional.address)
+        context.transfer(depositor, depositAmount)
+        enterMaturity(env, vault, currencyId, maturity, depositAmount, primaryBorrowAmount, depositor)
+
+    tradeParams = redeemParams[2]
+    redeemParamsEncoded = get_redeem_params(
+        redeemParams[0], 
+        redeemParams[1], 
+        get_dynamic_trade_params(
+            tradeParams[0], tradeParams[1], tradeParams[2], tradeParams[3], tradeParams[4]
+        )
+    )
+    vault.grantRole(vault.getRoles()["postMaturitySettlement"], operator, {"from": env.notional.owner()})
+
+    # Leave 1e8 strategy tokens in each maturity, the cash raised by the rest already repays the
+    # maturity's debt so Notional still marks it as settled with the residual strategy tokens
+    settlements = [
+        [maturity, env.notional.getVaultState(vault.address, maturity)["totalStrategyTokens"] - 1e8]
+        for maturity in maturities
+    ]
+
+    # Can't settle the batch until every maturity has matured
+    with brownie.reverts():
+        vault.settleVaultPostMaturityBatch.call(settlements, redeemParamsEncoded, {"from": operator})
+
+    settlementTime = max(maturities) + 1 - chain.time()
+    if settlementTime > 0:
+        chain.sleep(settlementTime)
+    chain.mine(5)
+    # Disable oracle freshness check
+    env.tradingModule.setMaxOracleFreshness(2 ** 32 - 1, {"from": env.notional.owner()})
+
+    # Role check
+    with brownie.reverts():
+        vault.settleVaultPostMaturityBatch.call(settlements, redeemParamsEncoded, {"from": context.whale})
+
+    underlyingCashBefore = [
+        vault.convertStrategyToUnderlying(ZERO_ADDRESS, s[1], s[0]) for s in settlements
+    ]
+
+    if checkFirstPoolShare:
+        # The first maturity exits more of the pool than the pool slippage limit allows for, later
+        # maturities only settle if their min amounts account for the pool after the earlier exits
+        ctx = vault.getStrategyContext()
+        if "underlyingPools" in ctx["oracleContext"]:
+            # Boosted pools hold their own BPT, the vault values BPT against the virtual supply
+            poolSupply = ctx["oracleContext"]["virtualSupply"]
+        else:
+            poolSupply = interface.IERC20(ctx["poolContext"]["basePool"]["poolToken"]).totalSupply()
+        firstPoolShare = vault.convertStrategyTokensToPoolClaim(settlements[0][1]) * 1e4 / poolSupply
+        assert firstPoolShare > 1e4 - ctx["baseStrategy"]["vaultSettings"]["poolSlippageLimitPercent"]
+
+    vault.settleVaultPostMaturityBatch(settlements, redeemParamsEncoded, {"from": operator})
+
+    for (settlement, expectedCash) in zip(settlements, underlyingCashBefore):
+        vaultState = env.notional.getVaultState(vault.address, settlement[0])
+        assert vaultState["totalStrategyTokens"] == 1e8
+        assert vaultState["isSettled"] == True
+        totalUnderlyingCash = convert_to_underlying(env, currencyId, vaultState["totalAssetCash"], context.primaryPrecision)
+        assert pytest.approx(totalUnderlyingCash, rel=1e-2) == expectedCash
+    check_invariants(env, vault, depositors, currencyId, snapshot)
+
 def emergency_settlement(context, depositAmount, primaryBorrowAmount, maturityIndex, depositor, operator, redeemParams):
     env = context.env
     notional = env.notional
@@ -459,16 +536,20 @@ def claim_rewards(context, depositAmount, primaryBorrowAmount, depositor, expect
         i += 1
     check_invariants(env, vault, [depositor], currencyId, snapshot)
 
-def reinvest_reward(context, depositor, rewardAmount, rewardParams, bptBefore, expectedBPTAmount, shouldRevert=False):
+def reinvest_reward(
+    context, depositor, rewardAmount, rewardParams, bptBefore, expectedBPTAmount, shouldRevert=False, batch=False
+):
     env = context.env
     vault = context.vault
     currencyId = context.currencyId   
+    # Batch reward params sell multiple reward tokens with a single pool join
+    reinvest = vault.reinvestRewardBatch if batch else vault.reinvestReward
     env.tokens["BAL"].transfer(vault.address, rewardAmount, {"from": env.whales["BAL"]})
     snapshot = snapshot_invariants(env, vault, currencyId)
 
     # Cannot reinvest without the proper role assigned
     with brownie.reverts():
-        vault.reinvestReward.call(rewardParams, {"from": depositor})
+        reinvest.call(rewardParams, {"from": depositor})
 
     # Only Notional owner can grant roles
     with brownie.reverts():
@@ -477,9 +558,9 @@ def reinvest_reward(context, depositor, rewardAmount, rewardParams, bptBefore, e
     
     if shouldRevert == True:
         with brownie.reverts():
-            vault.reinvestReward.call(rewardParams, {"from": depositor})
+            reinvest.call(rewardParams, {"from": depositor})
     else:
-        vault.reinvestReward(rewardParams, {"from": depositor})
+        reinvest(rewardParams, {"from": depositor})
         bptAfter = vault.getStrategyContext()["baseStrategy"]["vaultState"]["totalPoolClaim"]
         assert bptAfter - bptBefore >= expectedBPTAmount
 
@@ -67,6 +67,54 @@ def test_single_maturity_success(StratStableETHstETH):
     expectedProfit = valuationFix + underlyingRedeemed * 0.02
     assert pytest.approx(env.tokens["WETH"].balanceOf(env.liquidator.owner()), rel=5e-2) == expectedProfit
 
+def test_batch_multiple_accounts_success(StratStableETHstETH):
+    (env, vault, mock) = StratStableETHstETH
+    currencyId = 1
+    primaryBorrowAmount = 150e8
+    depositAmount = 20e18
+    maturity = env.notional.getActiveMarkets(currencyId)[0][1]
+    liquidatedAccounts = [accounts[0], accounts[2]]
+    for account in liquidatedAccounts:
+        enterMaturity(env, mock, currencyId, maturity, depositAmount, primaryBorrowAmount, account)
+        mock.setValuationFactor(account, 0.8e8, {"from": account})
+
+    assetRate = env.notional.getCurrencyAndRates(currencyId)["assetRate"]
+    flashLoanAmount = 0
+    batchParams = []
+    for account in liquidatedAccounts:
+        collateralInfo = env.notional.getVaultAccountCollateralRatio(account, mock.address)
+        assert collateralInfo["collateralRatio"] < collateralInfo["minCollateralRatio"]
+        flashLoanAmount += assetRate["rate"] * collateralInfo["maxLiquidatorDepositAssetCash"] / assetRate["underlyingDecimals"]
+        batchParams.append([currencyId, account.address, mock.address, True, get_redeem_params(0, 0, get_dynamic_trade_params(
+            DEX_ID["CURVE"], TRADE_TYPE["EXACT_IN_SINGLE"], 5e6, True, bytes(0)
+        ))])
+    vaultSharesBefore = [env.notional.getVaultAccount(account, mock.address)["vaultShares"] for account in liquidatedAccounts]
+
+    # All accounts in a batch must be liquidated in the same currency
+    with brownie.reverts():
+        env.liquidator.flashLiquidateBatch.call(
+            env.tokens["WETH"], 
+            Wei(flashLoanAmount * 1.2), 
+            [batchParams[0], [2] + batchParams[1][1:]], 
+            {"from": env.liquidator.owner()}
+        )
+
+    estimatedProfit = env.liquidator.estimateProfitBatch.call(
+        env.tokens["WETH"], Wei(flashLoanAmount * 1.2), batchParams, {"from": env.liquidator.owner()}
+    )
+    assert estimatedProfit > 0
+
+    env.liquidator.flashLiquidateBatch(
+        env.tokens["WETH"], 
+        Wei(flashLoanAmount * 1.2), 
+        batchParams, 
+        {"from": env.liquidator.owner()}
+    )
+
+    for (account, vaultShares) in zip(liquidatedAccounts, vaultSharesBefore):
+        assert env.notional.getVaultAccount(account, mock.address)["vaultShares"] < vaultShares
+    assert pytest.approx(env.tokens["WETH"].balanceOf(env.liquidator.owner()), rel=1e-2) == estimatedProfit
+
 def test_callback_reentrancy(StratStableETHstETH):
     (env, vault, mock) = StratStableETHstETH
     currencyId = 1
@@ -0,0 +1,56 @@
+import pytest
+from brownie import accounts
+from brownie.network.state import Chain
+from tests.balancer.helpers import enterMaturity
+from scripts.common import get_redeem_params, get_dynamic_trade_params, DEX_ID, TRADE_TYPE
+from scripts.liquidation_scanner import get_vault_accounts, scan_vault, update_vault_accounts
+from scripts.vault_lens import deploy_lens
+
+chain = Chain()
+
+def test_liquidation_scanner_ranks_accounts(StratStableETHstETH):
+    (env, vault, mock) = StratStableETHstETH
+    currencyId = 1
+    primaryBorrowAmount = 150e8
+    depositAmount = 20e18
+    maturity = env.notional.getActiveMarkets(currencyId)[0][1]
+    fromBlock = chain.height
+    for account in [accounts[0], accounts[2], accounts[3]]:
+        enterMaturity(env, mock, currencyId, maturity, depositAmount, primaryBorrowAmount, account)
+    # accounts[3] stays healthy, accounts[2] is further below the min collateral ratio
+    mock.setValuationFactor(accounts[0], 0.85e8, {"from": accounts[0]})
+    mock.setValuationFactor(accounts[2], 0.8e8, {"from": accounts[2]})
+
+    lens = deploy_lens(env, accounts[0])
+    vaultAccounts = get_vault_accounts(env.notional, mock.address, fromBlock)
+    assert sorted(vaultAccounts) == sorted([accounts[0].address, accounts[2].address, accounts[3].address])
+
+    redeemParams = get_redeem_params(0, 0, get_dynamic_trade_params(
+        DEX_ID["CURVE"], TRADE_TYPE["EXACT_IN_SINGLE"], 5e6, True, bytes(0)
+    ))
+    queue = scan_vault(env.notional, env.liquidator, lens, mock.address, vaultAccounts, redeemParams)
+    assert [q["account"] for q in queue] == [accounts[2].address, accounts[0].address]
+    assert queue[0]["estimatedProfit"] > queue[1]["estimatedProfit"]
+
+    # The top of the queue can be liquidated with its simulated params
+    top = queue[0]
+    env.liquidator.flashLiquidate(top["asset"], top["flashLoanAmount"], top["params"], {"from": env.liquidator.owner()})
+    assert pytest.approx(env.tokens["WETH"].balanceOf(env.liquidator.owner()), rel=1e-2) == top["estimatedProfit"]
+
+def test_liquidation_scanner_updates_accounts_incrementally(StratStableETHstETH):
+    (env, vault, mock) = StratStableETHstETH
+    currencyId = 1
+    maturity = env.notional.getActiveMarkets(currencyId)[0][1]
+    fromBlock = chain.height
+    vaultAccounts = {mock.address: []}
+
+    enterMaturity(env, mock, currencyId, maturity, 20e18, 60e8, accounts[0])
+    update_vault_accounts(env.notional, vaultAccounts, fromBlock, chain.height)
+    assert vaultAccounts[mock.address] == [accounts[0].address]
+
+    # Only blocks after the last scan are read, accounts are not duplicated
+    lastBlock = chain.height
+    enterMaturity(env, mock, currencyId, maturity, 20e18, 60e8, accounts[2])
+    update_vault_accounts(env.notional, vaultAccounts, lastBlock + 1, chain.height)
+    update_vault_accounts(env.notional, vaultAccounts, fromBlock, chain.height)
+    assert vaultAccounts[mock.address] == [accounts[0].address, accounts[2].address]
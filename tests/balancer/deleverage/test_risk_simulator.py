@@ -0,0 +1,25 @@
+import pytest
+from scripts.common import ETH_ADDRESS
+from scripts.risk_simulator import get_model, get_risk_params, get_deposit_amount, get_percentiles, run_simulation
+
+def test_risk_simulator_liquidation_volume(StratStableETHstETH):
+    (env, vault, mock) = StratStableETHstETH
+    stETH = "0xae7ab96520DE3A18E5e111B5EaAb095312D7fE84"
+    book = {"vault": ETH_ADDRESS, "tokens": [ETH_ADDRESS, stETH], "weights": [0.5, 0.5], "values": [110, 200, 104], "debts": [100, 100, 100]}
+    # Risk params are read from the vault config stored in Notional
+    riskParams = get_risk_params(env.notional.getVaultConfig(vault.address))
+    assert pytest.approx(riskParams) == (0.09, 1.02, 0.2)
+    model = get_model([book], [riskParams], [stETH])
+
+    # Without price moves only the account that starts below the min collateral ratio is liquidated
+    (volume, liquidated) = run_simulation(model, [0], [[1]], horizonDays=5, paths=10, pathsPerChunk=4, processes=2, seed=1)
+    deposit = get_deposit_amount(104, 100, riskParams[1], riskParams[2])
+    # Deleveraging restores the max deleverage collateral ratio
+    assert pytest.approx((104 - deposit * riskParams[1]) / (100 - deposit) - 1) == riskParams[2]
+    assert list(liquidated) == [1] * 10
+    assert pytest.approx(list(volume[:, 0])) == [deposit] * 10
+
+    (volume, liquidated) = run_simulation(model, [0.8], [[1]], paths=1000, pathsPerChunk=250, processes=2, seed=1)
+    results = get_percentiles(volume, liquidated)
+    assert results["liquidationVolume"][0] == sorted(results["liquidationVolume"][0])
+    assert min(liquidated) >= 1 and max(liquidated) <= 3
@@ -0,0 +1,59 @@
+import brownie
+from brownie import accounts, network, history, Boosted3TokenAuraVault, Boosted3TokenAuraHelper
+from tests.fixtures import *
+from scripts.BalancerEnvironment import getEnvironment
+
+def test_beacon_proxies_share_implementation():
+    env = getEnvironment(network.show_active())
+    strat = "StratBoostedPoolDAIPrimary"
+    impl = env.deployBalancerVault(strat, Boosted3TokenAuraVault, [Boosted3TokenAuraHelper])
+
+    vault1 = env.deployVaultProxy(strat, impl, Boosted3TokenAuraVault, useBeacon=True)
+    vault2 = env.deployVaultProxy(strat, impl, Boosted3TokenAuraVault, useBeacon=True)
+    beacon = env.vaultBeacons[impl.address]
+    assert beacon.implementation() == impl.address
+    assert len(env.vaultBeacons) == 1
+
+    for vault in [vault1, vault2]:
+        assert vault.name() == env.getStratConfig(strat)["name"]
+        assert vault.getStrategyContext()["baseStrategy"]["vaultSettings"]["maxPoolShare"] == \
+            env.getStratConfig(strat)["maxPoolShare"]
+        assert env.notional.getVaultConfig(vault.address)["borrowCurrencyId"] == 2
+
+def test_beacon_upgrade_restricted_to_notional_owner():
+    env = getEnvironment(network.show_active())
+    strat = "StratBoostedPoolDAIPrimary"
+    impl = env.deployBalancerVault(strat, Boosted3TokenAuraVault, [Boosted3TokenAuraHelper])
+    vault = env.deployVaultProxy(strat, impl, Boosted3TokenAuraVault, useBeacon=True)
+    beacon = env.vaultBeacons[impl.address]
+    newImpl = env.deployBalancerVault(strat, Boosted3TokenAuraVault, [Boosted3TokenAuraHelper])
+    assert beacon.owner() == env.notional.owner()
+
+    for account in [env.deployer, accounts[1]]:
+        with brownie.reverts():
+            beacon.upgradeTo(newImpl.address, {"from": account})
+
+    # The UUPS entry point is unusable behind a beacon proxy, even for the Notional owner
+    with brownie.reverts():
+        vault.upgradeTo(newImpl.address, {"from": env.notional.owner()})
+
+    beacon.upgradeTo(newImpl.address, {"from": env.notional.owner()})
+    assert beacon.implementation() == newImpl.address
+    assert vault.name() == env.getStratConfig(strat)["name"]
+
+def test_beacon_proxy_deployment_gas():
+    env = getEnvironment(network.show_active())
+    strat = "StratBoostedPoolDAIPrimary"
+    impl = env.deployBalancerVault(strat, Boosted3TokenAuraVault, [Boosted3TokenAuraHelper])
+    env.deployVaultBeacon(impl)
+
+    start = len(history)
+    env.deployVaultProxy(strat, impl, Boosted3TokenAuraVault)
+    proxyGas = sum(txn.gas_used for txn in history[start:])
+
+    start = len(history)
+    env.deployVaultProxy(strat, impl, Boosted3TokenAuraVault, useBeacon=True)
+    beaconGas = sum(txn.gas_used for txn in history[start:])
+
+    # Initialization happens in the proxy deployment transaction
+    assert beaconGas < proxyGas
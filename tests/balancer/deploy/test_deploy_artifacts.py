@@ -0,0 +1,38 @@
+import pytest
+from brownie import network
+from scripts.common import ETH_ADDRESS, deployArtifacts, getDeploymentLevels
+from scripts.EnvironmentConfig import getEnvironment
+
+SETTLE_ASSETS_EXTERNAL = "0x01713633a1b85a4a3d2f9430C68Bd4392c4a90eA"
+
+def get_artifacts(names):
+    return {name: {"path": "scripts/artifacts/{}.json".format(name)} for name in names}
+
+def test_artifact_deployment_levels():
+    artifacts = get_artifacts(["Router", "VaultAction", "VaultAccountAction", "TradingAction"])
+    artifacts["Router"]["dependsOn"] = ["VaultAccountAction", "VaultAction"]
+
+    levels = getDeploymentLevels(artifacts, {"SettleAssetsExternal": ETH_ADDRESS})
+    assert levels == [["TradingAction"], ["VaultAction", "VaultAccountAction"], ["Router"]]
+
+    # TradingAction links against a library that is neither in the batch nor deployed
+    with pytest.raises(ValueError):
+        getDeploymentLevels(artifacts)
+
+def test_deploy_artifacts_reuses_recorded_addresses():
+    env = getEnvironment(network.show_active())
+    artifacts = get_artifacts(["TradingAction", "VaultAccountAction", "VaultAction"])
+    libs = {"SettleAssetsExternal": SETTLE_ASSETS_EXTERNAL}
+    registry = {}
+
+    deployed = deployArtifacts(artifacts, env.deployer, libs, registry)
+    nonce = env.deployer.nonce
+    redeployed = deployArtifacts(artifacts, env.deployer, libs, registry)
+    # Nothing is broadcast when every artifact matches a recorded deployment
+    assert env.deployer.nonce == nonce
+    assert {n: c.address for (n, c) in redeployed.items()} == {n: c.address for (n, c) in deployed.items()}
+
+    # Without a recorded deployment every artifact is deployed again
+    fresh = deployArtifacts(artifacts, env.deployer, libs, {})
+    assert env.deployer.nonce == nonce + len(artifacts)
+    assert all(fresh[n].address != deployed[n].address for n in artifacts)
@@ -1,8 +1,14 @@
 import pytest
 import time
-from brownie import interface
+from brownie import accounts, interface, MockStableMath
 from brownie.network.state import Chain
 from scripts.common import set_dex_flags, set_trade_type_flags
+from scripts.stable_math import (
+    calculate_invariant,
+    calculate_invariant_with_prior,
+    calc_out_given_in,
+    get_token_balance_given_invariant_and_all_other_balances
+)
 from tests.trading.helpers import balancer_trade_exact_in_single
 
 chain = Chain()
@@ -59,4 +65,41 @@ def test_spot_price_within_1_perc_of_pair_price_after_trading(StratStableETHstET
     spotPrice0 = vault.getSpotPrice(0)/1e18
     pairPrice = interface.IPriceOracle(pool).getLatest(0)/1e18
     balancerPrice = 1/(pairPrice * secondaryScaleFactor)
-    assert pytest.approx(spotPrice0/balancerPrice, rel=1e-2) == 1
\ No newline at end of file
+    assert pytest.approx(spotPrice0/balancerPrice, rel=1e-2) == 1
+
+@pytest.mark.parametrize("amp", [1, 50, 200, 5000])
+@pytest.mark.parametrize("imbalance", [0.5, 0.9, 0.99])
+def test_python_stable_math_matches_contract(amp, imbalance):
+    stableMath = MockStableMath.deploy({"from": accounts[0]})
+    ampParameter = amp * 1000
+    primary = int(1_000_000e18 * imbalance)
+    balances = [primary, int(1_000_000e18) - primary]
+
+    (invariant, _) = calculate_invariant(ampParameter, balances, True)
+    assert stableMath.calculateInvariant(ampParameter, balances, True)[0] == invariant
+
+    balances[0] += int(10_000e18)
+    (tokenBalance, _) = get_token_balance_given_invariant_and_all_other_balances(ampParameter, balances, invariant, 1)
+    assert stableMath.getTokenBalanceGivenInvariantAndAllOtherBalances(ampParameter, balances, invariant, 1)[0] == tokenBalance
+
+    balances[0] -= int(10_000e18)
+    (amountOut, _) = calc_out_given_in(ampParameter, balances, 0, 1, int(10_000e18), invariant)
+    assert amountOut == balances[1] - tokenBalance - 1
+
+@pytest.mark.parametrize("amp", [1, 50, 200, 5000])
+@pytest.mark.parametrize("imbalance", [0.5, 0.9, 0.99])
+def test_warm_started_invariant_matches_cold_start(amp, imbalance):
+    ampParameter = amp * 1000
+    primary = int(1_000_000e18 * imbalance)
+    balances = [primary, int(1_000_000e18) - primary]
+    (invariant, _) = calculate_invariant(ampParameter, balances, True)
+
+    # Priors outside of [sum / 2, sum) fall back to the regular calculation
+    for prior in [0, int(1_000_000e18), int(1_000_000e18) * 2, int(250_000e18)]:
+        assert calculate_invariant_with_prior(ampParameter, balances, True, prior)[0] == invariant
+
+    priorBalances = [balances[0] - int(1_000e18), balances[1] + int(1_000e18)]
+    (prior, _) = calculate_invariant(ampParameter, priorBalances, True)
+    (warmInvariant, _) = calculate_invariant_with_prior(ampParameter, balances, True, prior)
+    # Iteration stops within 1 wei of the previous step, the starting point can shift the result by 1
+    assert abs(warmInvariant - invariant) <= 1
@@ -0,0 +1,74 @@
+import pytest
+from brownie import accounts
+from brownie.network.state import Chain
+from tests.fixtures import *
+from scripts.common import get_all_active_maturities, get_all_past_maturities
+from scripts.vault_lens import deploy_lens, get_vault_snapshot
+
+chain = Chain()
+
+def check_snapshot(env, vault, snapshot, numTokens):
+    currencyId = env.notional.getVaultConfig(vault.address)["borrowCurrencyId"]
+    assert snapshot["currencyId"] == currencyId
+    assert snapshot["strategyContext"] == vault.getStrategyContext()
+
+    maturities = get_all_past_maturities(env.notional, currencyId) + get_all_active_maturities(env.notional, currencyId)
+    assert sorted(snapshot["maturities"].keys()) == sorted(maturities)
+    for maturity in maturities:
+        assert snapshot["maturities"][maturity]["vaultState"] == env.notional.getVaultState(vault.address, maturity)
+
+    assert snapshot["spotPrices"] == [vault.getSpotPrice(i) for i in range(numTokens)]
+
+def test_snapshot_stable_eth_steth(StratStableETHstETH):
+    (env, vault, mock) = StratStableETHstETH
+    lens = deploy_lens(env, accounts[0])
+    snapshot = get_vault_snapshot(lens, env, vault)
+    check_snapshot(env, vault, snapshot, 2)
+
+    poolContext = vault.getStrategyContext()["poolContext"]["basePool"]
+    assert snapshot["oraclePrices"][poolContext["secondaryToken"]] == env.tradingModule.getOraclePrice(
+        poolContext["secondaryToken"], poolContext["primaryToken"]
+    )
+
+def test_snapshot_boosted_dai(StratBoostedPoolDAIPrimary):
+    (env, vault, mock) = StratBoostedPoolDAIPrimary
+    lens = deploy_lens(env, accounts[0])
+    snapshot = get_vault_snapshot(lens, env, vault)
+    check_snapshot(env, vault, snapshot, 3)
+
+    for token in [env.tokens["USDC"].address, env.tokens["USDT"].address]:
+        assert snapshot["oraclePrices"][token] == env.tradingModule.getOraclePrice(token, env.tokens["DAI"].address)
+
+def test_monitor_stable_eth_steth(StratStableETHstETH):
+    from scripts.oracle_monitor import VaultMonitor, get_metastable_spot_price, OK, BREACH
+    from scripts.common import get_updated_vault_settings
+    (env, vault, mock) = StratStableETHstETH
+    lens = deploy_lens(env, accounts[0])
+
+    # Off chain spot price matches the vault exactly
+    assert get_metastable_spot_price(vault.getStrategyContext()) == vault.getSpotPrice(0)
+
+    monitor = VaultMonitor(lens, vault)
+    result = monitor.check(chain.height)
+    assert result["status"] == OK
+    deviation = result["deviations"][0]
+    assert deviation["spotPrice"] == vault.getSpotPrice(0)
+    poolContext = vault.getStrategyContext()["poolContext"]["basePool"]
+    (answer, decimals) = env.tradingModule.getOraclePrice(poolContext["primaryToken"], poolContext["secondaryToken"])
+    assert deviation["oraclePrice"] == answer * 10**18 // decimals
+
+    settings = vault.getStrategyContext()["baseStrategy"]["vaultSettings"]
+    vault.setStrategyVaultSettings(
+        get_updated_vault_settings(settings, oraclePriceDeviationLimitPercent=0), {"from": env.notional.owner()}
+    )
+    assert monitor.check(chain.height)["status"] == BREACH
+
+def test_monitor_boosted_dai(StratBoostedPoolDAIPrimary):
+    from scripts.oracle_monitor import VaultMonitor, OK
+    (env, vault, mock) = StratBoostedPoolDAIPrimary
+    lens = deploy_lens(env, accounts[0])
+    result = VaultMonitor(lens, vault).check(chain.height)
+    assert result["status"] == OK
+    assert [d["tokenIndex"] for d in result["deviations"]] == [1, 2]
+    for d in result["deviations"]:
+        assert d["spotPrice"] == vault.getSpotPrice(d["tokenIndex"])
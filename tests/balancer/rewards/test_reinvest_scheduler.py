@@ -0,0 +1,36 @@
+from brownie import Wei, accounts
+from tests.balancer.acceptance import DAIPrimaryContext
+from scripts.common import get_univ3_batch_data
+from scripts.reinvest_scheduler import ReinvestScheduler
+
+def test_reinvest_scheduler_threshold(StratBoostedPoolDAIPrimary):
+    context = DAIPrimaryContext(*StratBoostedPoolDAIPrimary)
+    env = context.env
+    vault = context.vault
+    rewardAmount = Wei(50e18)
+    env.tokens["BAL"].transfer(vault.address, rewardAmount, {"from": env.whales["BAL"]})
+    vault.grantRole(vault.getRoles()["rewardReinvestment"], accounts[0], {"from": env.notional.owner()})
+    exchangeData = get_univ3_batch_data([
+        env.tokens["BAL"].address, 3000, env.tokens["WETH"].address, 500, env.tokens["DAI"].address
+    ])
+    routes = {
+        "{}:{}".format(env.tokens["BAL"].address, env.tokens["DAI"].address): {
+            "dex": "UNISWAP_V3", "tradeType": "EXACT_IN_BATCH", "slippage": 0, "unwrap": False,
+            "exchangeData": "0x" + exchangeData.hex()
+        }
+    }
+    scheduler = ReinvestScheduler(env.tradingModule, accounts[0], routes)
+    gasPrice = Wei(20e9)
+
+    # Rewards are worth less than the threshold, nothing is reinvested
+    plans = scheduler.run_once([(vault, {"minNetYield": Wei(10_000e18)})], gasPrice)
+    assert plans[0]["rewardAmounts"][env.tokens["BAL"].address] >= rewardAmount
+    assert plans[0]["gasCost"] > 0
+    assert not plans[0]["shouldReinvest"]
+    assert env.tokens["BAL"].balanceOf(vault.address) >= rewardAmount
+
+    bptBefore = vault.getStrategyContext()["baseStrategy"]["vaultState"]["totalPoolClaim"]
+    plans = scheduler.run_once([(vault, {"minNetYield": 0})], gasPrice)
+    assert plans[0]["shouldReinvest"]
+    assert plans[0]["netYield"] == plans[0]["rewardValue"] - plans[0]["gasCost"]
+    assert vault.getStrategyContext()["baseStrategy"]["vaultState"]["totalPoolClaim"] > bptBefore
@@ -46,3 +46,33 @@ def test_reinvest_rewards_success(StratBoostedPoolDAIPrimary):
     ), 0]
 
     reinvest_reward(context, accounts[0], rewardAmount, rewardParams, bptBefore, 290374198729029913290)
+
+def test_reinvest_rewards_batch_success(StratBoostedPoolDAIPrimary):
+    context = DAIPrimaryContext(*StratBoostedPoolDAIPrimary)
+    env = context.env
+    rewardAmount = Wei(50e18)
+    tradeParams = "(uint16,uint8,uint256,bool,bytes)"
+    singleSidedRewardTradeParams = "(address,address,uint256,{})".format(tradeParams)
+    bptBefore = context.vault.getStrategyContext()["baseStrategy"]["vaultState"]["totalPoolClaim"]
+    trade = lambda amount: [
+        env.tokens["BAL"].address,
+        env.tokens["DAI"].address,
+        amount,
+        [
+            DEX_ID["UNISWAP_V3"],
+            TRADE_TYPE["EXACT_IN_BATCH"],
+            0,
+            False,
+            get_univ3_batch_data([
+                env.tokens["BAL"].address, 3000, env.tokens["WETH"].address, 500, env.tokens["DAI"].address
+            ])
+        ]
+    ]
+    # Both trades are sold before a single pool join
+    rewardParams = [eth_abi.encode_abi(
+        ["{}[]".format(singleSidedRewardTradeParams)],
+        [[trade(rewardAmount // 2), trade(rewardAmount // 2)]]
+    ), 0]
+
+    # Within 1% of the single trade reinvestment, the two trades move the same Uniswap pools
+    reinvest_reward(context, accounts[0], rewardAmount, rewardParams, bptBefore, 287470456741736620157, batch=True)
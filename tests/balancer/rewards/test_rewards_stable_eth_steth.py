@@ -1,4 +1,4 @@
-from brownie import ZERO_ADDRESS, Wei, accounts
+from brownie import ZERO_ADDRESS, Wei, accounts, interface
 from brownie.convert import to_bytes
 from tests.fixtures import *
 from tests.balancer.helpers import get_metastable_amounts
@@ -138,3 +138,13 @@ def test_reinvest_0x_trade(StratStableETHstETH, request):
         {"from": env.notional.owner()})
 
     reinvest_reward(context, accounts[0], rewardAmount, rewardParams, bptBefore, 110619154787465048)
+
+def test_reward_tokens_match_gauge(StratStableETHstETH):
+    context = ETHPrimaryContext(*StratStableETHstETH)
+    env = context.env
+    stakingContext = context.vault.getStrategyContext()["stakingContext"]
+    gauge = interface.ILiquidityGauge(stakingContext["liquidityGauge"])
+    expected = [env.tokens["BAL"].address, env.tokens["AURA"].address] + [
+        gauge.reward_tokens(i) for i in range(gauge.reward_count())
+    ]
+    assert list(stakingContext["rewardTokens"]) == expected
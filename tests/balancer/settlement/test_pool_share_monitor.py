@@ -0,0 +1,57 @@
+from brownie import accounts
+from brownie.network.state import Chain
+from tests.balancer.helpers import enterMaturity
+from scripts.pool_share_monitor import (
+    PoolShareMonitor,
+    get_emergency_schedule,
+    get_pool_claim_threshold,
+    get_schedule_supply,
+    project_crossing
+)
+
+chain = Chain()
+
+def test_pool_share_emergency_schedule():
+    supply = 1000 * 10**18
+    vaultState = {"totalPoolClaim": 250 * 10**18, "totalStrategyTokenGlobal": 250 * 10**8}
+    # 25% of the pool held against a max of 20%, settling down to the 16% buffer takes one call
+    schedule = get_emergency_schedule(supply, 2000, vaultState, {1: 50 * 10**8, 2: 200 * 10**8})
+    assert schedule == [{"maturity": 2, "poolClaimToSettle": 90 * 10**18, "strategyTokensToRedeem": 90 * 10**8}]
+
+    # Maturities smaller than the excess are settled until the vault is back under the threshold
+    schedule = get_emergency_schedule(supply, 2000, vaultState, {1: 25 * 10**8, 2: 25 * 10**8})
+    assert [s["poolClaimToSettle"] for s in schedule] == [25 * 10**18, 25 * 10**18]
+    assert [s["strategyTokensToRedeem"] for s in schedule] == [25 * 10**8, 25 * 10**8]
+
+    assert get_emergency_schedule(supply, 3000, vaultState, {1: 250 * 10**8}) == []
+    assert project_crossing([(0, 1000), (100, 1500)], 2000) == 100
+    assert project_crossing([(0, 1500), (100, 1000)], 2000) == None
+    assert project_crossing([(0, 1000), (100, 2500)], 2000) == 0
+
+def test_pool_share_schedule_before_crossing():
+    totalPoolClaim = 190 * 10**18
+    vaultState = {"totalPoolClaim": totalPoolClaim, "totalStrategyTokenGlobal": 190 * 10**8}
+    # 19% of the pool held against a max of 20%, nothing can be settled yet
+    assert get_emergency_schedule(1000 * 10**18, 2000, vaultState, {1: 190 * 10**8}) == []
+
+    # The schedule is calculated at a supply strictly past the threshold
+    supply = get_schedule_supply(totalPoolClaim, 2000, 1)
+    assert get_pool_claim_threshold(supply, 2000) < totalPoolClaim
+    schedule = get_emergency_schedule(supply, 2000, vaultState, {1: 190 * 10**8})
+    assert len(schedule) == 1
+    # Settles down to the 16% buffer of the pool supply at the crossing
+    assert schedule[0]["poolClaimToSettle"] == totalPoolClaim - supply * 1600 // 10**4
+
+def test_pool_share_monitor_before_crossing(StratStableETHstETH):
+    (env, vault, mock) = StratStableETHstETH
+    currencyId = 1
+    # The second market is always outside of the settlement window
+    maturity = env.notional.getActiveMarkets(currencyId)[1][1]
+    enterMaturity(env, mock, currencyId, maturity, 20e18, 60e8, accounts[0])
+
+    # Every headroom is below 100% so the schedule is always calculated
+    monitor = PoolShareMonitor(env.notional, mock, 100, 86400)
+    result = monitor.check(chain.height)
+    assert not result["isEligible"]
+    assert len(result["schedule"]) > 0
+    assert result["schedule"][0]["maturity"] == maturity
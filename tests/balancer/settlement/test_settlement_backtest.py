@@ -0,0 +1,31 @@
+from scripts.settlement_backtest import simulate_settlement, run_window, NORMAL, TRADE_LIMIT, INVALID_PRICE
+
+def test_settlement_backtest_slippage():
+    snapshot = {
+        "blockNumber": 1,
+        "poolContext": {
+            "basePool": {"primaryBalance": 10_000 * 10**18, "secondaryBalance": 10_000 * 10**18, "primaryDecimals": 18, "secondaryDecimals": 18},
+            "primaryScaleFactor": 10**18,
+            "secondaryScaleFactor": 10**18
+        },
+        "oracleContext": {"ampParam": 50_000},
+        "totalSupply": 20_000 * 10**18,
+        "swapFeePercentage": 4 * 10**14,
+        "oraclePrice": 10**18,
+        "tradeOraclePrice": 10**18,
+        "tradeOracleDecimals": 10**18,
+        "poolClaimPrecision": 10**18,
+        "oraclePriceDeviationLimitPercent": 100,
+        "maxPoolShare": 2000,
+        "totalPoolClaim": 1000 * 10**18
+    }
+    # Swap fees alone exceed a zero slippage limit
+    assert simulate_settlement(snapshot, 100 * 10**18, 0)[0] == TRADE_LIMIT
+    (revertReason, expectedPrimary, primaryReceived) = simulate_settlement(snapshot, 100 * 10**18, 1e6)
+    assert revertReason == None
+    assert expectedPrimary * 0.999 < primaryReceived < expectedPrimary
+    assert simulate_settlement(dict(snapshot, oraclePrice=95 * 10**16), 100 * 10**18, 1e6)[0] == INVALID_PRICE
+
+    result = run_window(([snapshot], [0, 2], NORMAL, 0, 0.5, 10))
+    assert result["settlements"] == 1
+    assert result["revertRate"] == 1
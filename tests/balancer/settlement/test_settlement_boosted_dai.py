@@ -5,6 +5,7 @@ from tests.balancer.acceptance import (
     DAIPrimaryContext, 
     normal_settlement,
     post_maturity_settlement,
+    post_maturity_batch_settlement,
     emergency_settlement
 )
 from scripts.common import (
@@ -50,3 +51,17 @@ def test_emergency_single_maturity(StratBoostedPoolDAIPrimary):
         accounts[1],
         redeemParams
     )
+
+def test_post_maturity_batch_settlement(StratBoostedPoolDAIPrimary):
+    redeemParams = [0, 0, [DEX_ID["UNISWAP_V3"], TRADE_TYPE["EXACT_IN_SINGLE"], Wei(5e6), True, get_univ3_single_data(3000)]]
+    post_maturity_batch_settlement(
+        DAIPrimaryContext(*StratBoostedPoolDAIPrimary), 
+        # The first maturity holds most of the vault so that its exit moves the pool
+        [1_000_000e18, 10000e18], 
+        [1_000_000e8, 5000e8], 
+        [0, 1], 
+        [accounts[0], accounts[2]], 
+        accounts[1],
+        redeemParams,
+        checkFirstPoolShare=True
+    )
@@ -4,7 +4,8 @@ from tests.balancer.acceptance import (
     USDCPrimaryContext, 
     normal_settlement,
     emergency_settlement,
-    post_maturity_settlement
+    post_maturity_settlement,
+    post_maturity_batch_settlement
 )
 from scripts.common import (
     get_univ3_single_data,
@@ -49,3 +50,15 @@ def test_emergency_single_maturity_success(StratBoostedPoolUSDCPrimary):
         accounts[1],
         redeemParams
     )
+
+def test_post_maturity_batch_settlement(StratBoostedPoolUSDCPrimary):
+    redeemParams = [0, 0, [DEX_ID["UNISWAP_V3"], TRADE_TYPE["EXACT_IN_SINGLE"], Wei(5e6), True, get_univ3_single_data(3000)]]
+    post_maturity_batch_settlement(
+        USDCPrimaryContext(*StratBoostedPoolUSDCPrimary), 
+        [10000e6, 10000e6], 
+        [5000e8, 5000e8], 
+        [0, 1], 
+        [accounts[0], accounts[2]], 
+        accounts[1],
+        redeemParams
+    )
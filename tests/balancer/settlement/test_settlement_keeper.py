@@ -0,0 +1,49 @@
+import asyncio
+import brownie
+from brownie import accounts
+from brownie.network.state import Chain
+from tests.balancer.helpers import enterMaturity
+from scripts.common import get_redeem_params, get_dynamic_trade_params, DEX_ID, TRADE_TYPE
+from scripts.settlement_keeper import get_settlement_action, NonceManager, VaultKeeper, NORMAL, POST_MATURITY
+
+chain = Chain()
+
+def test_keeper_settlement_schedule():
+    maturity = 1_000_000
+    period = 86400
+    coolDown = 3600
+    state = {"isSettled": False, "totalStrategyTokens": 100}
+    # Before the settlement window opens
+    assert get_settlement_action(maturity - 2 * period, maturity, state, period, 0, coolDown) == (NORMAL, maturity - period)
+    # Inside the window but still cooling down from the last settlement
+    lastSettlement = maturity - period + 100
+    assert get_settlement_action(lastSettlement + 1, maturity, state, period, lastSettlement, coolDown) == (NORMAL, lastSettlement + coolDown)
+    assert get_settlement_action(maturity, maturity, state, period, lastSettlement, coolDown) == (POST_MATURITY, maturity)
+    assert get_settlement_action(maturity, maturity, {"isSettled": True, "totalStrategyTokens": 100}, period, 0, coolDown) == (None, None)
+
+def test_keeper_run_once_under_max_pool_share(StratStableETHstETH):
+    (env, vault, mock) = StratStableETHstETH
+    currencyId = 1
+    # The second market is always outside of the settlement window
+    maturity = env.notional.getActiveMarkets(currencyId)[1][1]
+    enterMaturity(env, mock, currencyId, maturity, 20e18, 60e8, accounts[0])
+    strategyTokens = env.notional.getVaultState(mock.address, maturity)["totalStrategyTokens"]
+
+    # The vault holds less than its max pool share so emergency settlement is not allowed
+    with brownie.reverts():
+        mock.getEmergencySettlementPoolClaimAmount(maturity)
+
+    redeemParams = get_redeem_params(0, 0, get_dynamic_trade_params(
+        DEX_ID["CURVE"], TRADE_TYPE["EXACT_IN_SINGLE"], 5e6, True, bytes(0)
+    ))
+    keeper = VaultKeeper(env.notional, mock, accounts[1], NonceManager(accounts[1]), redeemParams)
+    settlementPeriod = mock.getStrategyContext()["baseStrategy"]["settlementPeriodInSeconds"]
+    pending = keeper.get_pending_settlements(chain.time())
+    assert (NORMAL, maturity, maturity - settlementPeriod, strategyTokens) in pending
+
+    # Nothing is ready, the keeper waits for the next settlement window instead of failing
+    delay = asyncio.run(keeper.run_once())
+    assert delay != None and delay > 0
+    vaultState = env.notional.getVaultState(mock.address, maturity)
+    assert not vaultState["isSettled"]
+    assert vaultState["totalStrategyTokens"] == strategyTokens
@@ -4,6 +4,7 @@ from tests.balancer.acceptance import (
     ETHPrimaryContext, 
     normal_settlement,
     post_maturity_settlement,
+    post_maturity_batch_settlement,
     emergency_settlement
 )
 from scripts.common import DEX_ID, TRADE_TYPE
@@ -45,3 +46,17 @@ def test_emergency_single_maturity(StratStableETHstETH):
         accounts[1],
         redeemParams
     )
+
+def test_post_maturity_batch_settlement(StratStableETHstETH):
+    redeemParams = [0, 0, [DEX_ID["CURVE"], TRADE_TYPE["EXACT_IN_SINGLE"], Wei(5e6), True, bytes(0)]]
+    post_maturity_batch_settlement(
+        ETHPrimaryContext(*StratStableETHstETH), 
+        # The first maturity holds most of the vault so that its exit reduces the pool supply
+        [200e18, 20e18], 
+        [600e8, 60e8], 
+        [0, 1], 
+        [accounts[0], accounts[2]], 
+        accounts[1],
+        redeemParams,
+        checkFirstPoolShare=True
+    )
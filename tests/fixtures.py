@@ -18,6 +18,55 @@ def encode_exchange_data(dex, tradeType, params):
     if dex == 'UNISWAP_V3' and tradeType == 'EXACT_IN_SINGLE':
         return eth_abi.encode_abi(['(uint24)'], [tuple([params['fee']])])
 
+def encode_deposit_params(**kwargs):
+    return eth_abi.encode_abi(
+        ['(uint256,uint32,uint16,bytes)'],
+        [(
+            kwargs['minPurchaseAmount'],
+            kwargs['minLendRate'],
+            DEX_ID[kwargs['dexId']],
+            encode_exchange_data(kwargs['dexId'], 'EXACT_IN_SINGLE', kwargs['exchangeData'])
+        )]
+    )
+
+def encode_redeem_params(**kwargs):
+    return eth_abi.encode_abi(
+        ['(uint256,uint32,uint16,bytes)'],
+        [(
+            kwargs['minPurchaseAmount'],
+            kwargs['maxBorrowRate'],
+            DEX_ID[kwargs['dexId']],
+            encode_exchange_data(kwargs['dexId'], 'EXACT_IN_SINGLE', kwargs['exchangeData'])
+        )]
+    )
+
+def deploy_usdc_dai_vault(env, CrossCurrencyfCashVault, nProxy, account):
+    impl = CrossCurrencyfCashVault.deploy(env.notional.address, env.tradingModule.address, {"from": account})
+    initializeCallData = impl.initialize.encode_input(
+        "USDC/DAI Cross Currency fCash",
+        3, 2, 0.995e18
+    )
+    proxy = nProxy.deploy(impl.address, initializeCallData, {"from": account})
+    vault = Contract.from_abi("CrossCurrency", proxy.address, abi=CrossCurrencyfCashVault.abi)
+
+    env.notional.updateVault(
+        vault.address,
+        get_vault_config(
+            flags=set_flags(0, ENABLED=True, ONLY_VAULT_SETTLE=True, ALLOW_REENTRANCY=True),
+            currencyId=3,
+            feeRate5BPS=1, # 5 BPS fee
+            minCollateralRatioBPS=500, # 5% collateral ratio
+            maxBorrowMarketIndex=3 # allow up to 1 year borrows
+        ),
+        100_000_000e8,
+        {"from": env.notional.owner()},
+    )
+
+    env.tokens['USDC'].transfer(account, 30_000e6, {"from": env.whales['USDC']})
+    env.tokens['USDC'].approve(env.notional.address, 2 ** 255, {"from": account})
+
+    return vault
+
 @pytest.fixture(scope="module", autouse=True)
 def env():
     name = network.show_active()
@@ -0,0 +1,136 @@
+import os
+import json
+import math
+import pytest
+from brownie import history
+from brownie.network.state import Chain
+from scripts.common import get_deposit_params, get_updated_vault_settings
+from tests.balancer.helpers import enterMaturity, exitVaultPercent
+
+chain = Chain()
+
+BASELINE_PATH = "tests/gas/baseline.json"
+
+# Allowed increase over the recorded baseline before a benchmark fails, override with
+# GAS_REGRESSION_THRESHOLD=0.05 (5%)
+DEFAULT_THRESHOLD = 0.01
+
+def load_gas_baseline():
+    with open(BASELINE_PATH, "r") as f:
+        return json.load(f)
+
+def save_gas_baseline(data):
+    with open(BASELINE_PATH, "w") as f:
+        json.dump(data, f, indent=4, sort_keys=True)
+
+def check_gas(strategy, operation, txn):
+    """
+    Compares the gas used by txn against the checked in baseline. Set UPDATE_GAS_BASELINE=1
+    to record new values instead, a benchmark without a baseline entry is skipped.
+    """
+    return check_gas_used(strategy, operation, txn.gas_used)
+
+def check_gas_used(strategy, operation, gasUsed):
+    data = load_gas_baseline()
+
+    if os.environ.get("UPDATE_GAS_BASELINE") == "1":
+        data.setdefault(strategy, {})[operation] = gasUsed
+        save_gas_baseline(data)
+        return gasUsed
+
+    baseline = data.get(strategy, {}).get(operation)
+    if baseline == None:
+        pytest.skip("{}.{} used {} gas and has no baseline, record it with UPDATE_GAS_BASELINE=1".format(
+            strategy, operation, gasUsed
+        ))
+
+    threshold = float(os.environ.get("GAS_REGRESSION_THRESHOLD", DEFAULT_THRESHOLD))
+    limit = math.floor(baseline * (1 + threshold))
+    assert gasUsed <= limit, "{}.{} used {} gas, baseline {} (+{:.2%})".format(
+        strategy, operation, gasUsed, baseline, gasUsed / baseline - 1
+    )
+    return gasUsed
+
+def get_maturity(context, maturityIndex):
+    return context.env.notional.getActiveMarkets(context.currencyId)[maturityIndex][1]
+
+def enter_vault(context, depositAmount, primaryBorrowAmount, depositor, maturityIndex=0):
+    env = context.env
+    maturity = get_maturity(context, maturityIndex)
+    context.approve(depositor, env.notional.address)
+    context.transfer(depositor, depositAmount)
+    enterMaturity(env, context.vault, context.currencyId, maturity, depositAmount, primaryBorrowAmount, depositor)
+    return history[-1]
+
+def exit_vault(context, depositor, percent, redeemParams):
+    # Min entry blocks
+    chain.mine(5)
+    exitVaultPercent(context.env, context.vault, depositor, percent, redeemParams)
+    return history[-1]
+
+def roll_vault(context, primaryBorrowAmount, depositor, maturityIndex):
+    return context.env.notional.rollVaultPosition(
+        depositor,
+        context.vault.address,
+        primaryBorrowAmount * 1.1,
+        get_maturity(context, maturityIndex),
+        0,
+        0,
+        0,
+        get_deposit_params(),
+        {"from": depositor}
+    )
+
+def prepare_settlement(context, operator, role):
+    env = context.env
+    chain.mine(5)
+    # Disable oracle freshness check
+    env.tradingModule.setMaxOracleFreshness(2 ** 32 - 1, {"from": env.notional.owner()})
+    context.vault.grantRole(context.vault.getRoles()[role], operator, {"from": env.notional.owner()})
+
+def settle_vault_normal(context, maturityIndex, operator, redeemParams, percent):
+    env = context.env
+    vault = context.vault
+    maturity = get_maturity(context, maturityIndex)
+    settlementWindow = vault.getStrategyContext()["baseStrategy"]["settlementPeriodInSeconds"]
+    settlementTime = maturity - settlementWindow + 1 - chain.time()
+    if settlementTime > 0:
+        chain.sleep(settlementTime)
+    prepare_settlement(context, operator, "normalSettlement")
+    tokensToRedeem = math.floor(env.notional.getVaultState(vault.address, maturity)["totalStrategyTokens"] * percent)
+    return vault.settleVaultNormal(maturity, tokensToRedeem, redeemParams, {"from": operator})
+
+def settle_vault_post_maturity(context, maturityIndex, operator, redeemParams, percent):
+    env = context.env
+    vault = context.vault
+    maturity = get_maturity(context, maturityIndex)
+    settlementTime = maturity + 1 - chain.time()
+    if settlementTime > 0:
+        chain.sleep(settlementTime)
+    prepare_settlement(context, operator, "postMaturitySettlement")
+    tokensToRedeem = math.floor(env.notional.getVaultState(vault.address, maturity)["totalStrategyTokens"] * percent)
+    return vault.settleVaultPostMaturity(maturity, tokensToRedeem, redeemParams, {"from": operator})
+
+def settle_vault_emergency(context, maturityIndex, operator, redeemParams):
+    env = context.env
+    vault = context.vault
+    maturity = get_maturity(context, maturityIndex)
+    prepare_settlement(context, operator, "emergencySettlement")
+    settings = vault.getStrategyContext()["baseStrategy"]["vaultSettings"]
+    vault.setStrategyVaultSettings(get_updated_vault_settings(settings, maxPoolShare=0), {"from": env.notional.owner()})
+    return vault.settleVaultEmergency(maturity, redeemParams, {"from": operator})
+
+def claim_reward_tokens(context, operator):
+    env = context.env
+    vault = context.vault
+    chain.sleep(3600 * 24 * 365)
+    chain.mine()
+    vault.grantRole(vault.getRoles()["rewardReinvestment"], operator, {"from": env.notional.owner()})
+    return vault.claimRewardTokens({"from": operator})
+
+def reinvest_reward(context, operator, rewardAmount, rewardParams):
+    env = context.env
+    vault = context.vault
+    env.tokens["BAL"].transfer(vault.address, rewardAmount, {"from": env.whales["BAL"]})
+    vault.grantRole(vault.getRoles()["rewardReinvestment"], operator, {"from": env.notional.owner()})
+    return vault.reinvestReward(rewardParams, {"from": operator})
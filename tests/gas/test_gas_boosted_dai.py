@@ -0,0 +1,104 @@
+import eth_abi
+from brownie import Wei, accounts
+from tests.fixtures import *
+from tests.balancer.acceptance import DAIPrimaryContext
+from tests.gas.helpers import (
+    check_gas,
+    check_gas_used,
+    enter_vault,
+    exit_vault,
+    roll_vault,
+    settle_vault_normal,
+    settle_vault_post_maturity,
+    settle_vault_emergency,
+    claim_reward_tokens,
+    reinvest_reward
+)
+from scripts.common import (
+    get_dynamic_trade_params,
+    get_redeem_params,
+    get_univ3_single_data,
+    get_univ3_batch_data,
+    DEX_ID,
+    TRADE_TYPE
+)
+
+STRATEGY = "StratBoostedPoolDAIPrimary"
+
+def get_settlement_params(slippage):
+    return get_redeem_params(0, 0, get_dynamic_trade_params(
+        DEX_ID["UNISWAP_V3"], TRADE_TYPE["EXACT_IN_SINGLE"], slippage, True, get_univ3_single_data(3000)
+    ))
+
+def test_load_strategy_context(StratBoostedPoolDAIPrimary):
+    (env, vault, mock) = StratBoostedPoolDAIPrimary
+    # Context loading is shared by every deposit, redeem and settlement
+    check_gas_used(STRATEGY, "getStrategyContext", vault.getStrategyContext.estimate_gas())
+
+def test_enter_vault(StratBoostedPoolDAIPrimary):
+    context = DAIPrimaryContext(*StratBoostedPoolDAIPrimary)
+    check_gas(STRATEGY, "enterVault", enter_vault(context, 10000e18, 5000e8, accounts[0]))
+
+def test_exit_vault_partial(StratBoostedPoolDAIPrimary):
+    context = DAIPrimaryContext(*StratBoostedPoolDAIPrimary)
+    enter_vault(context, 10000e18, 5000e8, accounts[0])
+    check_gas(STRATEGY, "exitVaultPartial", exit_vault(context, accounts[0], 0.5, get_settlement_params(5e6)))
+
+def test_exit_vault_full(StratBoostedPoolDAIPrimary):
+    context = DAIPrimaryContext(*StratBoostedPoolDAIPrimary)
+    enter_vault(context, 10000e18, 5000e8, accounts[0])
+    check_gas(STRATEGY, "exitVaultFull", exit_vault(context, accounts[0], 1.0, get_settlement_params(5e6)))
+
+def test_roll_vault(StratBoostedPoolDAIPrimary):
+    context = DAIPrimaryContext(*StratBoostedPoolDAIPrimary)
+    enter_vault(context, 10000e18, 5000e8, accounts[0], 0)
+    check_gas(STRATEGY, "rollVaultPosition", roll_vault(context, 5000e8, accounts[0], 1))
+
+def test_settle_vault_normal(StratBoostedPoolDAIPrimary):
+    context = DAIPrimaryContext(*StratBoostedPoolDAIPrimary)
+    enter_vault(context, 10000e18, 5000e8, accounts[0], 0)
+    txn = settle_vault_normal(context, 0, accounts[1], get_settlement_params(3e6), 0.5)
+    check_gas(STRATEGY, "settleVaultNormal", txn)
+
+def test_settle_vault_post_maturity(StratBoostedPoolDAIPrimary):
+    context = DAIPrimaryContext(*StratBoostedPoolDAIPrimary)
+    enter_vault(context, 10000e18, 5000e8, accounts[0], 0)
+    txn = settle_vault_post_maturity(context, 0, accounts[1], get_settlement_params(5e6), 0.5)
+    check_gas(STRATEGY, "settleVaultPostMaturity", txn)
+
+def test_settle_vault_emergency(StratBoostedPoolDAIPrimary):
+    context = DAIPrimaryContext(*StratBoostedPoolDAIPrimary)
+    # Emergency settlement is not allowed inside the settlement window
+    enter_vault(context, 10000e18, 5000e8, accounts[0], 1)
+    txn = settle_vault_emergency(context, 1, accounts[1], get_settlement_params(4e6))
+    check_gas(STRATEGY, "settleVaultEmergency", txn)
+
+def test_claim_reward_tokens(StratBoostedPoolDAIPrimary):
+    context = DAIPrimaryContext(*StratBoostedPoolDAIPrimary)
+    enter_vault(context, 10000e18, 5000e8, accounts[0])
+    check_gas(STRATEGY, "claimRewardTokens", claim_reward_tokens(context, accounts[0]))
+
+def test_reinvest_reward(StratBoostedPoolDAIPrimary):
+    context = DAIPrimaryContext(*StratBoostedPoolDAIPrimary)
+    env = context.env
+    rewardAmount = Wei(50e18)
+    tradeParams = "(uint16,uint8,uint256,bool,bytes)"
+    singleSidedRewardTradeParams = "(address,address,uint256,{})".format(tradeParams)
+    rewardParams = [eth_abi.encode_abi(
+        [singleSidedRewardTradeParams],
+        [[
+            env.tokens["BAL"].address,
+            env.tokens["DAI"].address,
+            rewardAmount,
+            [
+                DEX_ID["UNISWAP_V3"],
+                TRADE_TYPE["EXACT_IN_BATCH"],
+                0,
+                False,
+                get_univ3_batch_data([
+                    env.tokens["BAL"].address, 3000, env.tokens["WETH"].address, 500, env.tokens["DAI"].address
+                ])
+            ]
+        ]]
+    ), 0]
+    check_gas(STRATEGY, "reinvestReward", reinvest_reward(context, accounts[0], rewardAmount, rewardParams))
@@ -0,0 +1,86 @@
+import pytest
+from brownie import Wei
+from brownie.network.state import Chain
+from tests.fixtures import *
+from tests.gas.helpers import check_gas
+
+chain = Chain()
+
+STRATEGY = "CrossCurrencyfCashVault"
+
+@pytest.fixture(scope="module")
+def usdcDaiVault(env, CrossCurrencyfCashVault, nProxy, accounts):
+    return deploy_usdc_dai_vault(env, CrossCurrencyfCashVault, nProxy, accounts[0])
+
+def get_trade_params(encode, **kwargs):
+    return encode(dexId='UNISWAP_V3', exchangeData={'fee': 100}, **kwargs)
+
+def enter_vault(env, vault, account, maturity):
+    return env.notional.enterVault(
+        account,
+        vault.address,
+        20_000e6,
+        maturity,
+        110_000e8,
+        0,
+        get_trade_params(encode_deposit_params, minPurchaseAmount=Wei(107_000e18), minLendRate=0),
+        {"from": account}
+    )
+
+def settle_vault(env, vault, account, maturity):
+    markets = env.notional.getActiveMarkets(3)
+    chain.mine(1, timestamp=markets[0][1])
+    env.notional.initializeMarkets(2, False, {"from": account})
+    env.notional.initializeMarkets(3, False, {"from": account})
+
+    chain.mine(1, timestamp=markets[1][1])
+    env.notional.initializeMarkets(2, False, {"from": account})
+    env.notional.initializeMarkets(3, False, {"from": account})
+
+    vaultState = env.notional.getVaultState(vault.address, maturity)
+    return vault.settleVault(
+        maturity,
+        vaultState['totalStrategyTokens'],
+        get_trade_params(encode_redeem_params, minPurchaseAmount=Wei(129_500e6), maxBorrowRate=0),
+        {"from": account}
+    )
+
+def test_enter_vault(env, usdcDaiVault, accounts):
+    maturity = env.notional.getActiveMarkets(3)[1][1]
+    check_gas(STRATEGY, "enterVault", enter_vault(env, usdcDaiVault, accounts[0], maturity))
+
+def test_exit_vault_partial(env, usdcDaiVault, accounts):
+    maturity = env.notional.getActiveMarkets(3)[1][1]
+    enter_vault(env, usdcDaiVault, accounts[0], maturity)
+    txn = env.notional.exitVault(
+        accounts[0],
+        usdcDaiVault.address,
+        accounts[0],
+        12_000e8,
+        10_000e8,
+        0,
+        get_trade_params(encode_redeem_params, minPurchaseAmount=Wei(10_000e6), maxBorrowRate=0),
+        {"from": accounts[0]}
+    )
+    check_gas(STRATEGY, "exitVaultPartial", txn)
+
+def test_settle_vault(env, usdcDaiVault, accounts):
+    maturity = env.notional.getActiveMarkets(3)[1][1]
+    enter_vault(env, usdcDaiVault, accounts[0], maturity)
+    check_gas(STRATEGY, "settleVault", settle_vault(env, usdcDaiVault, accounts[1], maturity))
+
+def test_exit_vault_post_settlement(env, usdcDaiVault, accounts):
+    maturity = env.notional.getActiveMarkets(3)[1][1]
+    enter_vault(env, usdcDaiVault, accounts[0], maturity)
+    settle_vault(env, usdcDaiVault, accounts[1], maturity)
+    txn = env.notional.exitVault(
+        accounts[0],
+        usdcDaiVault.address,
+        accounts[0],
+        0,
+        0,
+        0,
+        get_trade_params(encode_redeem_params, minPurchaseAmount=0, maxBorrowRate=0),
+        {"from": accounts[0]}
+    )
+    check_gas(STRATEGY, "exitVaultPostSettlement", txn)
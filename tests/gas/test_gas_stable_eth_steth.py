@@ -0,0 +1,115 @@
+import eth_abi
+from brownie import ZERO_ADDRESS, Wei, accounts
+from tests.fixtures import *
+from tests.balancer.acceptance import ETHPrimaryContext
+from tests.balancer.helpers import get_metastable_amounts
+from tests.gas.helpers import (
+    check_gas,
+    enter_vault,
+    exit_vault,
+    roll_vault,
+    settle_vault_normal,
+    settle_vault_post_maturity,
+    settle_vault_emergency,
+    claim_reward_tokens,
+    reinvest_reward
+)
+from scripts.common import (
+    get_dynamic_trade_params,
+    get_redeem_params,
+    get_univ3_single_data,
+    get_univ3_batch_data,
+    DEX_ID,
+    TRADE_TYPE
+)
+
+STRATEGY = "StratStableETHstETH"
+
+def get_settlement_params(slippage):
+    return get_redeem_params(0, 0, get_dynamic_trade_params(
+        DEX_ID["CURVE"], TRADE_TYPE["EXACT_IN_SINGLE"], slippage, True, bytes(0)
+    ))
+
+def test_enter_vault(StratStableETHstETH):
+    context = ETHPrimaryContext(*StratStableETHstETH)
+    check_gas(STRATEGY, "enterVault", enter_vault(context, 100e18, 150e8, accounts[0]))
+
+def test_exit_vault_partial(StratStableETHstETH):
+    context = ETHPrimaryContext(*StratStableETHstETH)
+    enter_vault(context, 100e18, 150e8, accounts[0])
+    check_gas(STRATEGY, "exitVaultPartial", exit_vault(context, accounts[0], 0.5, get_settlement_params(5e6)))
+
+def test_exit_vault_full(StratStableETHstETH):
+    context = ETHPrimaryContext(*StratStableETHstETH)
+    enter_vault(context, 100e18, 150e8, accounts[0])
+    check_gas(STRATEGY, "exitVaultFull", exit_vault(context, accounts[0], 1.0, get_settlement_params(5e6)))
+
+def test_roll_vault(StratStableETHstETH):
+    context = ETHPrimaryContext(*StratStableETHstETH)
+    enter_vault(context, 100e18, 150e8, accounts[0], 0)
+    check_gas(STRATEGY, "rollVaultPosition", roll_vault(context, 150e8, accounts[0], 1))
+
+def test_settle_vault_normal(StratStableETHstETH):
+    context = ETHPrimaryContext(*StratStableETHstETH)
+    enter_vault(context, 100e18, 300e8, accounts[0], 0)
+    txn = settle_vault_normal(context, 0, accounts[1], get_settlement_params(3e6), 0.5)
+    check_gas(STRATEGY, "settleVaultNormal", txn)
+
+def test_settle_vault_post_maturity(StratStableETHstETH):
+    context = ETHPrimaryContext(*StratStableETHstETH)
+    enter_vault(context, 100e18, 300e8, accounts[0], 0)
+    txn = settle_vault_post_maturity(context, 0, accounts[1], get_settlement_params(5e6), 0.5)
+    check_gas(STRATEGY, "settleVaultPostMaturity", txn)
+
+def test_settle_vault_emergency(StratStableETHstETH):
+    context = ETHPrimaryContext(*StratStableETHstETH)
+    # Emergency settlement is not allowed inside the settlement window
+    enter_vault(context, 100e18, 300e8, accounts[0], 1)
+    txn = settle_vault_emergency(context, 1, accounts[1], get_settlement_params(4e6))
+    check_gas(STRATEGY, "settleVaultEmergency", txn)
+
+def test_claim_reward_tokens(StratStableETHstETH):
+    context = ETHPrimaryContext(*StratStableETHstETH)
+    enter_vault(context, 50e18, 100e8, accounts[0])
+    check_gas(STRATEGY, "claimRewardTokens", claim_reward_tokens(context, accounts[0]))
+
+def test_reinvest_reward(StratStableETHstETH):
+    context = ETHPrimaryContext(*StratStableETHstETH)
+    env = context.env
+    rewardAmount = Wei(50e18)
+    tradeParams = "(uint16,uint8,uint256,bool,bytes)"
+    singleSidedRewardTradeParams = "(address,address,uint256,{})".format(tradeParams)
+    proportional2TokenRewardTradeParams = "({},{})".format(singleSidedRewardTradeParams, singleSidedRewardTradeParams)
+    (primaryAmount, secondaryAmount) = get_metastable_amounts(context.vault.getStrategyContext()["poolContext"], rewardAmount)
+    rewardParams = [eth_abi.encode_abi(
+        [proportional2TokenRewardTradeParams],
+        [[
+            [
+                env.tokens["BAL"].address,
+                ZERO_ADDRESS,
+                primaryAmount,
+                [
+                    DEX_ID["UNISWAP_V3"],
+                    TRADE_TYPE["EXACT_IN_SINGLE"],
+                    0,
+                    False,
+                    get_univ3_single_data(3000)
+                ]
+            ],
+            [
+                env.tokens["BAL"].address,
+                env.tokens["wstETH"].address,
+                secondaryAmount,
+                [
+                    DEX_ID["UNISWAP_V3"],
+                    TRADE_TYPE["EXACT_IN_BATCH"],
+                    Wei(0.05e18), # static slippage
+                    False,
+                    get_univ3_batch_data([
+                        env.tokens["BAL"].address, 3000, env.tokens["WETH"].address, 500, env.tokens["wstETH"].address
+                    ])
+                ]
+            ]
+        ]]
+    ), 0]
+    check_gas(STRATEGY, "reinvestReward", reinvest_reward(context, accounts[0], rewardAmount, rewardParams))
@@ -0,0 +1,184 @@
+import os
+import pytest
+import eth_abi
+from brownie import accounts, network, interface, MockVault
+from brownie.convert import to_bytes
+from brownie.network.state import Chain
+from scripts.common import (
+    DEX_ID,
+    TRADE_TYPE,
+    get_univ2_data,
+    get_univ3_single_data,
+    get_univ3_batch_data,
+    set_dex_flags,
+    set_trade_type_flags
+)
+from scripts.EnvironmentConfig import getEnvironment
+from tests.gas.helpers import check_gas, check_gas_used
+from tests.zeroex.helpers import load_test_data
+
+chain = Chain()
+
+TABLE_PATH = "reports/trading_gas_matrix.md"
+DYNAMIC_SLIPPAGE_LIMIT = 5e6 # 5%
+WSTETH_WETH_POOL_ID = "0x32296969ef14eb0c6d29669c550d4a0449130230000200000000000000000080"
+WETH_DAI_POOL_ID = "0x0b09dea16768f0799065c475be02919503cb2a3500020000000000000000001a"
+
+def balancer_single_data(env, amount):
+    return eth_abi.encode_abi(["(bytes32)"], [[to_bytes(WSTETH_WETH_POOL_ID, "bytes32")]])
+
+def balancer_exact_in_batch_data(env, amount):
+    return eth_abi.encode_abi(
+        ['((bytes32,uint256,uint256,uint256,bytes)[],address[],int256[])'],
+        [[
+            [
+                [to_bytes(WSTETH_WETH_POOL_ID, "bytes32"), 0, 1, amount, bytes()],
+                [to_bytes(WETH_DAI_POOL_ID, "bytes32"), 1, 2, 0, bytes()]
+            ],
+            [env.tokens["wstETH"].address, env.tokens["WETH"].address, env.tokens["DAI"].address],
+            [amount, 0, 0]
+        ]]
+    )
+
+def balancer_exact_out_batch_data(env, amount):
+    # Swaps are listed from the last hop when the amount out is given
+    return eth_abi.encode_abi(
+        ['((bytes32,uint256,uint256,uint256,bytes)[],address[],int256[])'],
+        [[
+            [
+                [to_bytes(WETH_DAI_POOL_ID, "bytes32"), 1, 2, amount, bytes()],
+                [to_bytes(WSTETH_WETH_POOL_ID, "bytes32"), 0, 1, 0, bytes()]
+            ],
+            [env.tokens["wstETH"].address, env.tokens["WETH"].address, env.tokens["DAI"].address],
+            # Max amount in is enforced by the trade limit
+            [2 ** 255 - 1, 0, 0]
+        ]]
+    )
+
+def curve_exact_in_batch_data(env, amount):
+    router = interface.ICurveRouter("0xfA9a30350048B2BF66865ee20363067c66f67e58")
+    routes = router.get_exchange_routing(env.tokens["stETH"].address, env.tokens["DAI"].address, amount)
+    return eth_abi.encode_abi(["(address[6],uint256[8])"], [[routes[0], routes[1]]])
+
+def zero_ex_data(env, amount):
+    # Quote fetched for 200 COMP at the fork block by test_COMP_to_WETH_exact_in
+    return to_bytes(load_test_data("test_COMP_to_WETH_exact_in")["params"][0], "bytes")
+
+# Trade Case: (dex, tradeType, sellToken, buyToken, fundAmount, buyAmount, exchangeData, hasOracle)
+# buyAmount is only used for exact out trades, exact in trades sell the entire fund amount
+TRADE_CASES = [
+    ("UNISWAP_V2", "EXACT_IN_SINGLE", "USDC", "WETH", 1_000e6, 0,
+        lambda env, amount: get_univ2_data([env.tokens["USDC"].address, env.tokens["WETH"].address]), True),
+    ("UNISWAP_V2", "EXACT_OUT_SINGLE", "USDC", "WETH", 1_000e6, 0.1e18,
+        lambda env, amount: get_univ2_data([env.tokens["USDC"].address, env.tokens["WETH"].address]), True),
+    ("UNISWAP_V2", "EXACT_IN_BATCH", "USDC", "DAI", 1_000e6, 0,
+        lambda env, amount: get_univ2_data([
+            env.tokens["USDC"].address, env.tokens["WETH"].address, env.tokens["DAI"].address
+        ]), True),
+    ("UNISWAP_V2", "EXACT_OUT_BATCH", "USDC", "DAI", 1_000e6, 100e18,
+        lambda env, amount: get_univ2_data([
+            env.tokens["USDC"].address, env.tokens["WETH"].address, env.tokens["DAI"].address
+        ]), True),
+    ("UNISWAP_V3", "EXACT_IN_SINGLE", "USDC", "WETH", 1_000e6, 0,
+        lambda env, amount: get_univ3_single_data(500), True),
+    ("UNISWAP_V3", "EXACT_OUT_SINGLE", "USDC", "WETH", 1_000e6, 0.1e18,
+        lambda env, amount: get_univ3_single_data(500), True),
+    ("UNISWAP_V3", "EXACT_IN_BATCH", "USDC", "DAI", 1_000e6, 0,
+        lambda env, amount: get_univ3_batch_data([
+            env.tokens["USDC"].address, 500, env.tokens["WETH"].address, 500, env.tokens["DAI"].address
+        ]), True),
+    # Uniswap V3 exact out paths are encoded in reverse
+    ("UNISWAP_V3", "EXACT_OUT_BATCH", "USDC", "DAI", 1_000e6, 100e18,
+        lambda env, amount: get_univ3_batch_data([
+            env.tokens["DAI"].address, 500, env.tokens["WETH"].address, 500, env.tokens["USDC"].address
+        ]), True),
+    ("BALANCER_V2", "EXACT_IN_SINGLE", "wstETH", "WETH", 1e18, 0, balancer_single_data, True),
+    ("BALANCER_V2", "EXACT_OUT_SINGLE", "wstETH", "WETH", 1e18, 0.5e18, balancer_single_data, True),
+    ("BALANCER_V2", "EXACT_IN_BATCH", "wstETH", "DAI", 1e18, 0, balancer_exact_in_batch_data, True),
+    ("BALANCER_V2", "EXACT_OUT_BATCH", "wstETH", "DAI", 1e18, 100e18, balancer_exact_out_batch_data, True),
+    ("CURVE", "EXACT_IN_SINGLE", "stETH", "WETH", 1e18, 0, lambda env, amount: bytes(), True),
+    ("CURVE", "EXACT_IN_BATCH", "stETH", "DAI", 1e18, 0, curve_exact_in_batch_data, True),
+    ("ZERO_EX", "EXACT_IN_SINGLE", "COMP", "WETH", 200e18, 0, zero_ex_data, False),
+]
+
+@pytest.fixture(autouse=True)
+def run_around_tests():
+    chain.snapshot()
+    yield
+    chain.revert()
+
+@pytest.fixture(scope="module")
+def gasTable():
+    rows = []
+    yield rows
+    rows.sort()
+    os.makedirs(os.path.dirname(TABLE_PATH), exist_ok=True)
+    with open(TABLE_PATH, "w") as f:
+        f.write("| DEX | Trade Type | Pair | Slippage | Gas Used | Tx Calldata | DEX Calldata |\n")
+        f.write("| :-- | :--------- | :--- | :------- | -------: | ----------: | -----------: |\n")
+        for row in rows:
+            f.write("| {} | {} | {} | {} | {} | {} | {} |\n".format(*row))
+
+@pytest.mark.parametrize("dynamicSlippage", [False, True], ids=["static", "dynamic"])
+@pytest.mark.parametrize("case", TRADE_CASES, ids=["{}-{}".format(c[0], c[1]) for c in TRADE_CASES])
+def test_trade_gas(case, dynamicSlippage, gasTable):
+    (dex, tradeType, sellName, buyName, fundAmount, buyAmount, getExchangeData, hasOracle) = case
+    if dynamicSlippage and not hasOracle:
+        pytest.skip("no oracle price for {}/{}".format(sellName, buyName))
+
+    env = getEnvironment(network.show_active())
+    mockVault = MockVault.deploy(env.tradingModule, {"from": accounts[0]})
+    sellToken = env.tokens[sellName]
+    buyToken = env.tokens[buyName]
+    sellToken.transfer(mockVault, fundAmount, {"from": env.whales[sellName]})
+    env.tradingModule.setTokenPermissions(
+        mockVault.address,
+        sellToken.address,
+        [True, set_dex_flags(0, **{dex: True}), set_trade_type_flags(0, **{tradeType: True})],
+        {"from": env.notional.owner()})
+
+    isExactIn = tradeType.startswith("EXACT_IN")
+    amount = sellToken.balanceOf(mockVault) if isExactIn else buyAmount
+    trade = [
+        TRADE_TYPE[tradeType],
+        sellToken.address,
+        buyToken.address,
+        amount,
+        0,
+        chain.time() + 20000,
+        getExchangeData(env, amount)
+    ]
+
+    if dynamicSlippage:
+        txn = mockVault.executeTradeWithDynamicSlippage(DEX_ID[dex], trade, DYNAMIC_SLIPPAGE_LIMIT, {"from": accounts[0]})
+    else:
+        if hasOracle:
+            # Use the same limit the dynamic slippage path would calculate
+            trade[4] = env.tradingModule.getLimitAmount(
+                TRADE_TYPE[tradeType], sellToken.address, buyToken.address, amount, DYNAMIC_SLIPPAGE_LIMIT
+            )
+        txn = mockVault.executeTrade(DEX_ID[dex], trade, {"from": accounts[0]})
+
+    executionCallData = env.tradingModule.getExecutionData(DEX_ID[dex], mockVault.address, trade)[3]
+    mode = "dynamic" if dynamicSlippage else "static"
+    gasUsed = check_gas("TradingModule", "{}.{}.{}".format(dex, tradeType, mode), txn)
+    gasTable.append([
+        dex,
+        tradeType,
+        "{}/{}".format(sellName, buyName),
+        mode,
+        gasUsed,
+        len(to_bytes(txn.input, "bytes")),
+        len(to_bytes(executionCallData, "bytes"))
+    ])
+
+def test_oracle_prices_gas():
+    env = getEnvironment(network.show_active())
+    dai = env.tokens["DAI"].address
+    baseTokens = [env.tokens["USDC"].address, env.tokens["USDT"].address]
+    batchGas = env.tradingModule.getOraclePrices.estimate_gas(baseTokens, dai)
+    pairGas = sum(env.tradingModule.getOraclePrice.estimate_gas(token, dai) for token in baseTokens)
+
+    check_gas_used("TradingModule", "getOraclePrices", batchGas)
+    # The quote token oracle is only read once
+    assert batchGas < pairGas
@@ -11,53 +11,7 @@ chain = Chain()
 
 @pytest.fixture(scope="module", autouse=True)
 def usdcDaiVault(env, CrossCurrencyfCashVault, nProxy, accounts):
-    impl = CrossCurrencyfCashVault.deploy(env.notional.address, env.tradingModule.address, {"from": accounts[0]})
-    initializeCallData = impl.initialize.encode_input(
-        "USDC/DAI Cross Currency fCash",
-        3, 2, 0.995e18
-    )
-    proxy = nProxy.deploy(impl.address, initializeCallData, {"from": accounts[0]})
-    vault = Contract.from_abi("CrossCurrency", proxy.address, abi=CrossCurrencyfCashVault.abi)
-
-    env.notional.updateVault(
-        vault.address,
-        get_vault_config(
-            flags=set_flags(0, ENABLED=True, ONLY_VAULT_SETTLE=True, ALLOW_REENTRANCY=True),
-            currencyId=3,
-            feeRate5BPS=1, # 5 BPS fee
-            minCollateralRatioBPS=500, # 5% collateral ratio
-            maxBorrowMarketIndex=3 # allow up to 1 year borrows
-        ),
-        100_000_000e8,
-        {"from": env.notional.owner()},
-    )
-
-    env.tokens['USDC'].transfer(accounts[0], 30_000e6, {"from": env.whales['USDC']})
-    env.tokens['USDC'].approve(env.notional.address, 2 ** 255, {"from": accounts[0]})
-
-    return vault
-
-def encode_deposit_params(**kwargs):
-    return eth_abi.encode_abi(
-        ['(uint256,uint32,uint16,bytes)'],
-        [(
-            kwargs['minPurchaseAmount'],
-            kwargs['minLendRate'],
-            DEX_ID[kwargs['dexId']],
-            encode_exchange_data(kwargs['dexId'], 'EXACT_IN_SINGLE', kwargs['exchangeData'])
-        )]
-    )
-
-def encode_redeem_params(**kwargs):
-    return eth_abi.encode_abi(
-        ['(uint256,uint32,uint16,bytes)'],
-        [(
-            kwargs['minPurchaseAmount'],
-            kwargs['maxBorrowRate'],
-            DEX_ID[kwargs['dexId']],
-            encode_exchange_data(kwargs['dexId'], 'EXACT_IN_SINGLE', kwargs['exchangeData'])
-        )]
-    )
+    return deploy_usdc_dai_vault(env, CrossCurrencyfCashVault, nProxy, accounts[0])
 
 @pytest.mark.only
 def test_enter_vault_success(env, usdcDaiVault, accounts):
@@ -72,7 +26,6 @@ def test_enter_vault_success(env, usdcDaiVault, accounts):
         }
     )
 
-    # 1_074_000 gas
     txn = env.notional.enterVault(
         accounts[0],
         usdcDaiVault.address,
@@ -189,7 +142,6 @@ def test_exit_vault_success(env, usdcDaiVault, accounts):
         {"from": accounts[0]}
     )
 
-    # 857_889 gas used
     txn = env.notional.exitVault(
         accounts[0],
         usdcDaiVault.address,
@@ -288,7 +240,6 @@ def test_settle_vault_success(env, usdcDaiVault, accounts):
     assert env.tokens["DAI"].balanceOf(usdcDaiVault.address) < 1e14
     assert env.tokens["USDC"].balanceOf(usdcDaiVault.address) == 0
 
-    # 306_000 gas
     balanceBefore = env.tokens["USDC"].balanceOf(accounts[0])
     txn = env.notional.exitVault(
         accounts[0],
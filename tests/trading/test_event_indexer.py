@@ -0,0 +1,45 @@
+import pytest
+from brownie import accounts, interface, network, MockVault
+from brownie.network.state import Chain
+from scripts.common import set_dex_flags, set_trade_type_flags
+from scripts.EnvironmentConfig import getEnvironment
+from scripts.event_indexer import open_database, get_events, EventIndexer
+
+chain = Chain()
+
+@pytest.fixture(autouse=True)
+def run_around_tests():
+    chain.snapshot()
+    yield
+    chain.revert()
+
+def test_indexer_resumes_from_checkpoint():
+    env = getEnvironment(network.show_active())
+    db = open_database(":memory:")
+    startBlock = chain.height + 1
+    indexer = EventIndexer(db, "tradingModule", [env.tradingModule.address], interface.ITradingModule.abi, startBlock, maxBlockRange=2)
+
+    mockVault = MockVault.deploy(env.tradingModule, {"from": accounts[0]})
+    for token in ["WETH", "DAI"]:
+        env.tradingModule.setTokenPermissions(
+            mockVault.address,
+            env.tokens[token].address,
+            [True, set_dex_flags(0, UNISWAP_V3=True), set_trade_type_flags(0, EXACT_IN_SINGLE=True)],
+            {"from": env.notional.owner()})
+    chain.mine(5)
+
+    assert indexer.index(chain.height) == 2
+    assert indexer.get_checkpoint() == chain.height
+    events = get_events(db, "TokenPermissionsUpdated", env.tradingModule.address)
+    assert [e["token"] for e in events] == [env.tokens["WETH"].address, env.tokens["DAI"].address]
+    assert all(e["sender"] == mockVault.address for e in events)
+
+    # Only blocks after the checkpoint are read on the next run
+    env.tradingModule.setTokenPermissions(
+        mockVault.address,
+        env.tokens["USDC"].address,
+        [True, set_dex_flags(0, UNISWAP_V3=True), set_trade_type_flags(0, EXACT_IN_SINGLE=True)],
+        {"from": env.notional.owner()})
+    assert indexer.index(chain.height) == 1
+    assert indexer.index(chain.height) == 0
+    assert len(get_events(db, "TokenPermissionsUpdated")) == 3
@@ -0,0 +1,76 @@
+import pytest
+from brownie import Wei, accounts, network, MockVault
+from brownie.network.state import Chain
+from scripts.common import DEX_ID, TRADE_TYPE, set_dex_flags, set_trade_type_flags
+from scripts.EnvironmentConfig import getEnvironment
+from scripts.quote_router import quote_routes, get_best_route
+
+chain = Chain()
+
+# WETH/DAI weighted pool
+BALANCER_POOL_IDS = ["0x0b09dea16768f0799065c475be02919503cb2a3500020000000000000000001a"]
+
+@pytest.fixture(autouse=True)
+def run_around_tests():
+    chain.snapshot()
+    yield
+    chain.revert()
+
+def test_quotes_are_sorted_net_of_gas():
+    env = getEnvironment(network.show_active())
+    quotes = quote_routes(
+        env.tradingModule,
+        env.tokens["USDC"].address,
+        env.tokens["DAI"].address,
+        100_000e6,
+        Wei(20e9),
+        balancerPoolIds=BALANCER_POOL_IDS
+    )
+    dexIds = set(q["dexId"] for q in quotes)
+    assert DEX_ID["UNISWAP_V2"] in dexIds
+    assert DEX_ID["UNISWAP_V3"] in dexIds
+    assert DEX_ID["CURVE"] in dexIds
+    # USDC to DAI through the WETH/DAI pool requires a connector pool, none is given
+    assert DEX_ID["BALANCER_V2"] not in dexIds
+
+    for q in quotes:
+        assert q["gasCost"] > 0
+        assert q["netAmountOut"] == q["amountOut"] - q["gasCost"]
+    netAmounts = [q["netAmountOut"] for q in quotes]
+    assert netAmounts == sorted(netAmounts, reverse=True)
+
+def test_best_route_matches_execution():
+    env = getEnvironment(network.show_active())
+    mockVault = MockVault.deploy(env.tradingModule, {"from": accounts[0]})
+    env.tokens["WETH"].transfer(mockVault, 10e18, {"from": env.whales["WETH"]})
+    env.tradingModule.setTokenPermissions(
+        mockVault.address,
+        env.tokens["WETH"].address,
+        [
+            True,
+            set_dex_flags(0, UNISWAP_V2=True, UNISWAP_V3=True, BALANCER_V2=True, CURVE=True),
+            set_trade_type_flags(0, EXACT_IN_SINGLE=True, EXACT_IN_BATCH=True)
+        ],
+        {"from": env.notional.owner()})
+
+    best = get_best_route(
+        env.tradingModule,
+        env.tokens["WETH"].address,
+        env.tokens["DAI"].address,
+        Wei(10e18),
+        Wei(20e9),
+        balancerPoolIds=BALANCER_POOL_IDS
+    )
+    assert best != None
+
+    trade = [
+        best["tradeType"],
+        env.tokens["WETH"].address,
+        env.tokens["DAI"].address,
+        Wei(10e18),
+        0,
+        chain.time() + 20000,
+        best["exchangeData"]
+    ]
+    ret = mockVault.executeTrade(best["dexId"], trade, {"from": accounts[0]})
+    assert pytest.approx(ret.return_value[1], rel=1e-6) == best["amountOut"]
@@ -0,0 +1,102 @@
+import pytest
+import brownie
+from brownie import accounts, network, MockVault
+from brownie.network.state import Chain
+from scripts.common import (
+    DEX_ID,
+    TRADE_TYPE,
+    get_univ2_data,
+    get_univ3_single_data,
+    set_dex_flags,
+    set_trade_type_flags
+)
+from scripts.EnvironmentConfig import getEnvironment
+
+chain = Chain()
+
+@pytest.fixture(autouse=True)
+def run_around_tests():
+    chain.snapshot()
+    yield
+    chain.revert()
+
+def get_batch_trades(env, amount):
+    deadline = chain.time() + 20000
+    usdc = env.tokens["USDC"].address
+    weth = env.tokens["WETH"].address
+    dai = env.tokens["DAI"].address
+    return [
+        # dexId, trade, useDynamicSlippage, dynamicSlippageLimit
+        [DEX_ID["UNISWAP_V3"], [TRADE_TYPE["EXACT_IN_SINGLE"], usdc, weth, amount, 0, deadline, get_univ3_single_data(500)], True, 5e6],
+        [DEX_ID["UNISWAP_V2"], [TRADE_TYPE["EXACT_IN_SINGLE"], usdc, dai, amount, 0, deadline, get_univ2_data([usdc, dai])], True, 5e6],
+        [DEX_ID["UNISWAP_V3"], [TRADE_TYPE["EXACT_IN_SINGLE"], usdc, dai, amount, 0, deadline, get_univ3_single_data(100)], False, 0]
+    ]
+
+def test_USDC_batch_across_dexes():
+    env = getEnvironment(network.show_active())
+    mockVault = MockVault.deploy(env.tradingModule, {"from": accounts[0]})
+    env.tokens["USDC"].transfer(mockVault, 300e6, {"from": env.whales["USDC"]})
+    trades = get_batch_trades(env, 100e6)
+
+    # Vault only has permission to sell USDC on Uniswap V3
+    env.tradingModule.setTokenPermissions(
+        mockVault.address,
+        env.tokens["USDC"].address,
+        [True, set_dex_flags(0, UNISWAP_V3=True), set_trade_type_flags(0, EXACT_IN_SINGLE=True)],
+        {"from": env.notional.owner()})
+    with brownie.reverts():
+        mockVault.executeTradeBatch.call(trades, {"from": accounts[0]})
+
+    env.tradingModule.setTokenPermissions(
+        mockVault.address,
+        env.tokens["USDC"].address,
+        [True, set_dex_flags(0, UNISWAP_V2=True, UNISWAP_V3=True), set_trade_type_flags(0, EXACT_IN_SINGLE=True)],
+        {"from": env.notional.owner()})
+
+    # Dynamic slippage limits match the single trade limits
+    limits = env.tradingModule.getBatchLimitAmounts(mockVault.address, trades)
+    for (trade, limit) in zip(trades, limits):
+        (tradeType, sellToken, buyToken, amount) = trade[1][:4]
+        if trade[2]:
+            assert limit == env.tradingModule.getLimitAmount(tradeType, sellToken, buyToken, amount, trade[3])
+        else:
+            assert limit == trade[1][4]
+
+    wethBefore = env.tokens["WETH"].balanceOf(mockVault)
+    daiBefore = env.tokens["DAI"].balanceOf(mockVault)
+    ret = mockVault.executeTradeBatch(trades, {"from": accounts[0]})
+    (amountsSold, amountsBought) = ret.return_value
+
+    assert env.tokens["USDC"].balanceOf(mockVault) == 0
+    assert list(amountsSold) == [100e6, 100e6, 100e6]
+    assert amountsBought[0] == env.tokens["WETH"].balanceOf(mockVault) - wethBefore
+    assert amountsBought[1] + amountsBought[2] == env.tokens["DAI"].balanceOf(mockVault) - daiBefore
+    assert amountsBought[1] >= limits[1]
+
+def test_batch_skips_zero_amount_trades():
+    env = getEnvironment(network.show_active())
+    mockVault = MockVault.deploy(env.tradingModule, {"from": accounts[0]})
+    env.tokens["USDC"].transfer(mockVault, 100e6, {"from": env.whales["USDC"]})
+    env.tradingModule.setTokenPermissions(
+        mockVault.address,
+        env.tokens["USDC"].address,
+        [True, set_dex_flags(0, UNISWAP_V2=True, UNISWAP_V3=True), set_trade_type_flags(0, EXACT_IN_SINGLE=True)],
+        {"from": env.notional.owner()})
+
+    trades = get_batch_trades(env, 100e6)
+    trades[1][1][3] = 0
+    trades[2][1][3] = 0
+    ret = mockVault.executeTradeBatch(trades, {"from": accounts[0]})
+    (amountsSold, amountsBought) = ret.return_value
+    assert list(amountsSold) == [100e6, 0, 0]
+    assert list(amountsBought)[1:] == [0, 0]
+
+def test_oracle_prices_match_pair_prices():
+    env = getEnvironment(network.show_active())
+    dai = env.tokens["DAI"].address
+    baseTokens = [env.tokens["USDC"].address, env.tokens["USDT"].address, env.tokens["WETH"].address]
+    (answers, decimals) = env.tradingModule.getOraclePrices(baseTokens, dai)
+
+    assert len(answers) == len(baseTokens)
+    for (token, answer) in zip(baseTokens, answers):
+        assert (answer, decimals) == env.tradingModule.getOraclePrice(token, dai)